@@ -1,17 +1,12 @@
 import streamlit as st
-import sys, os, base64
-from PIL import Image
+import sys, os
 
 sys.path.append(os.path.dirname(__file__))
-from utils.styles import inject_css, sidebar_nav
-
-_favicon = Image.open(
-    os.path.join(os.path.dirname(__file__), "assets", "favicon.ico")
-)
+from utils.styles import inject_css, sidebar_nav, favicon, logo_src
 
 st.set_page_config(
     page_title="Graphix — Visualisateur d'Algorithmes",
-    page_icon=_favicon,
+    page_icon=favicon(),
     layout="wide",
     initial_sidebar_state="expanded",
 )
@@ -31,20 +26,12 @@ with st.sidebar:
 
 
 # ── Hero ──────────────────────────────────────────────────────────────────────
-def _get_logo_b64():
-    logo_path = os.path.join(os.path.dirname(__file__), "assets", "logo.png")
-    if os.path.exists(logo_path):
-        with open(logo_path, "rb") as f:
-            return base64.b64encode(f.read()).decode()
-    return None
-
-
-logo_b64 = _get_logo_b64()
-if logo_b64:
+logo = logo_src()
+if logo:
     st.markdown(
         f"""
     <div style="display:flex;align-items:center;gap:1.5rem;margin-bottom:0.5rem;">
-        <img src="data:image/png;base64,{logo_b64}"
+        <img src="{logo}"
              style="width:72px;height:72px;border-radius:50%;
                     box-shadow:0 0 24px rgba(191,30,46,0.5);flex-shrink:0;" />
         <div>
@@ -488,11 +475,11 @@ with col14:
     st.page_link("pages/13_Quiz.py", label="▶ Ouvrir Quiz")
 
 st.markdown("<hr class='divider'>", unsafe_allow_html=True)
-if logo_b64:
+if logo:
     st.markdown(
         f"""
         <div style="display:flex;align-items:center;justify-content:center;gap:0.6rem;padding:0.5rem 0;">
-            <img src="data:image/png;base64,{logo_b64}"
+            <img src="{logo}"
                  style="width:20px;height:20px;border-radius:50%;
                         box-shadow:0 0 10px rgba(191,30,46,0.4);flex-shrink:0;" />
             <span style="color:#64748b;font-size:0.8rem;font-family:'Space Mono',monospace;background:linear-gradient(135deg,#e2e8f0 0%,#7c3aed 50%,#06b6d4 100%);-webkit-background-clip:text;-webkit-text-fill-color:transparent;">Graphix par Laurent Jouron</span>
@@ -0,0 +1 @@
+"""AlgoLab : moteurs d'algorithmes de Graphix, utilisables sans l'interface."""
@@ -0,0 +1,4 @@
+"""Benchmarks des moteurs ``algolab.core`` en ligne de commande.
+
+    python -m algolab.bench --help
+"""
@@ -0,0 +1,136 @@
+"""Point d'entrée : ``python -m algolab.bench``.
+
+Exemples :
+    python -m algolab.bench                       # tous les moteurs
+    python -m algolab.bench -k tri -k dijkstra    # filtre par nom ou groupe
+    python -m algolab.bench --quick --json out.json --csv out.csv
+    python -m algolab.bench -k tri --fit          # complexité empirique
+    python -m algolab.bench --record --check      # historique + régressions
+"""
+import argparse
+import csv
+import datetime
+import json
+import platform
+import sys
+
+from . import history
+from .cases import CASES
+from .fit import MIN_POINTS, fit_results
+from .runner import run
+
+CSV_FIELDS = ["case", "group", "n", "repeat", "warmup", "min_ms", "median_ms", "p95_ms", "throughput",
+              "peak_kb", "retained_kb", "blocks"]
+
+
+def select(cases, keys):
+    if not keys:
+        return list(cases)
+    return [c for c in cases if any(k in (c.name, c.group) or k in c.name for k in keys)]
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def write_json(path, results, args):
+    payload = {
+        "environment": environment(),
+        "settings": {"repeat": args.repeat, "warmup": args.warmup, "seed": args.seed,
+                     "memory": args.memory},
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, ensure_ascii=False)
+
+
+def write_csv(path, results):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def print_row(res):
+    mem = f"  pic {res['peak_kb']:9.1f} Ko  retenu {res['retained_kb']:9.1f} Ko" if "peak_kb" in res else ""
+    print(f"{res['case']:<15} n={res['n']:<7} médiane {res['median_ms']:9.2f} ms  "
+          f"p95 {res['p95_ms']:9.2f} ms  {res['throughput']:12.0f} éléments/s{mem}", flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m algolab.bench",
+                                     description="Benchmarks des moteurs algolab.core")
+    parser.add_argument("-k", "--only", action="append", default=[],
+                        help="nom ou groupe de cas (répétable)")
+    parser.add_argument("--sizes", type=lambda s: [int(x) for x in s.split(",")],
+                        help="tailles à mesurer, ex. 100,200,400 (défaut : propres à chaque cas)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--quick", action="store_true",
+                        help="deux plus petites tailles (trois avec --fit), 3 répétitions")
+    parser.add_argument("--no-memory", dest="memory", action="store_false",
+                        help="sans mesure mémoire (tracemalloc)")
+    parser.add_argument("--json", metavar="FICHIER")
+    parser.add_argument("--csv", metavar="FICHIER")
+    parser.add_argument("--fit", action="store_true",
+                        help="ajuste chaque cas à O(1) … O(n²) après les mesures")
+    parser.add_argument("--record", nargs="?", const="", metavar="ÉTIQUETTE",
+                        help="enregistre l'exécution dans l'historique SQLite")
+    parser.add_argument("--check", action="store_true",
+                        help="enregistre puis compare aux exécutions précédentes (code 2 si régression)")
+    parser.add_argument("--db", default=history.DEFAULT_DB, help="base SQLite de l'historique")
+    parser.add_argument("--list", action="store_true", help="liste les cas et quitte")
+    args = parser.parse_args(argv)
+
+    cases = select(CASES, args.only)
+    if args.list:
+        for c in cases:
+            print(f"{c.name:<15} {c.group:<12} {', '.join(map(str, c.sizes))}")
+        return 0
+    if not cases:
+        parser.error("aucun cas ne correspond à --only")
+    if args.quick:
+        keep = MIN_POINTS if args.fit else 2
+        cases = [c._replace(sizes=c.sizes[:keep]) for c in cases]
+        args.repeat = min(args.repeat, 3)
+
+    results = run(cases, sizes=args.sizes, repeat=args.repeat, warmup=args.warmup,
+                  seed=args.seed, memory=args.memory, on_result=print_row)
+    if args.fit:
+        print()
+        fitted = fit_results(results)
+        for case in dict.fromkeys(r["case"] for r in results):
+            if case not in fitted:
+                print(f"{case:<15} trop peu de tailles pour ajuster (au moins {MIN_POINTS})")
+                continue
+            best, fits = fitted[case]
+            c, err = fits[best]
+            print(f"{case:<15} {best:<11} c = {c:.3g} ms  (erreur relative {err:.0%})")
+    if args.json:
+        write_json(args.json, results, args)
+    if args.csv:
+        write_csv(args.csv, results)
+    if args.record is not None or args.check:
+        run_id = history.record(results, args.db, label=args.record or "")
+        print(f"\nExécution n°{run_id} enregistrée dans {args.db}")
+    if args.check:
+        flagged = history.regressions(run_id, args.db)
+        for f in flagged:
+            print(f"RÉGRESSION {f['case']:<15} n={f['n']:<7} ×{f['ratio']:.2f} "
+                  f"({f['baseline_ms']:.2f} → {f['current_ms']:.2f} ms, p={f['p']:.3g}, "
+                  f"{f['baseline_rev']} → {f['current_rev']})")
+        if flagged:
+            return 2
+        print("Aucune régression significative.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
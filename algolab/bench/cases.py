@@ -0,0 +1,109 @@
+"""Cas de benchmark : pour chaque moteur, un générateur d'entrée et un appel.
+
+``make(n, rng)`` construit une entrée de taille n (toujours la même pour une
+graine donnée) ; ``run(inp)`` appelle le moteur jusqu'au bout, y compris les
+traces paresseuses.
+"""
+import collections
+
+from algolab import core
+
+Case = collections.namedtuple("Case", "name group sizes make run")
+
+
+def _complete(result):
+    """Force le calcul des traces paresseuses contenues dans le résultat."""
+    for item in result if isinstance(result, tuple) else (result,):
+        if isinstance(item, core.LazyTrace):
+            item.final
+    return result
+
+
+# ── Générateurs d'entrées ─────────────────────────────────────────────────────
+
+def _array(n, rng):
+    return [rng.randint(1, 1000) for _ in range(n)]
+
+
+def _weighted_graph(n, rng, degree=3):
+    """Graphe connexe non orienté : une chaîne aléatoire + arêtes en plus."""
+    nodes = [f"v{i}" for i in range(n)]
+    order = nodes[:]
+    rng.shuffle(order)
+    edges = {(order[i], order[i + 1]) for i in range(n - 1)}
+    while len(edges) < min(degree * n, n * (n - 1) // 2):
+        u, v = rng.sample(nodes, 2)
+        if (v, u) not in edges:
+            edges.add((u, v))
+    return nodes, [(u, v, rng.randint(1, 100)) for u, v in sorted(edges)]
+
+
+def _digraph(n, rng, degree=3):
+    nodes = [f"p{i}" for i in range(n)]
+    edges = {(u, v) for u in nodes for v in rng.sample(nodes, min(degree, n)) if u != v}
+    return nodes, sorted(edges)
+
+
+def _grid(n, rng, wall_pct=0.25):
+    grid = [[1 if rng.random() < wall_pct else 0 for _ in range(n)] for _ in range(n)]
+    grid[0][0] = grid[n - 1][n - 1] = 0
+    return grid
+
+
+def _text(n, rng):
+    return "".join(rng.choice("eeeeeaaaiioonnrrsstlucdmp ") for _ in range(n))
+
+
+def _conway_grid(n, rng):
+    return core.conway.make_grid(n, n, "Aléatoire", seed=rng.randint(0, 2**31))
+
+
+# ── Cas ───────────────────────────────────────────────────────────────────────
+
+SMALL = (50, 100, 200, 400)
+MEDIUM = (100, 200, 400, 800, 1600)
+LARGE = (1000, 2000, 4000, 8000, 16000)
+
+CASES = [
+    Case("bubble_sort", "tri", SMALL, _array, lambda a: core.bubble_sort_steps(a)),
+    Case("merge_sort", "tri", MEDIUM, _array, lambda a: core.merge_sort_steps(a)),
+    Case("quick_sort", "tri", MEDIUM, _array, lambda a: core.quick_sort_steps(a)),
+    Case("intro_sort", "tri", MEDIUM, _array, lambda a: core.intro_sort_steps(a)),
+    Case("quick3_sort", "tri", MEDIUM, _array, lambda a: core.quick3_sort_steps(a)),
+    Case("shell_sort", "tri", MEDIUM, _array, lambda a: core.shell_sort_steps(a)),
+    Case("natural_merge_sort", "tri", MEDIUM, _array, lambda a: core.natural_merge_sort_steps(a)),
+    Case("heap_sort", "tri", MEDIUM, _array, lambda a: core.heap_sort_steps(a)),
+    Case("counting_sort", "tri", MEDIUM, _array, lambda a: core.counting_sort_steps(a, max(a))),
+    Case("radix_sort", "tri", MEDIUM, _array, lambda a: core.radix_sort_steps(a)),
+    Case("dijkstra", "graphes", MEDIUM, _weighted_graph,
+         lambda g: core.dijkstra_steps(core.CSRGraph.from_edges(g[0], g[1]), g[0][0])),
+    Case("astar", "graphes", (10, 20, 40, 80), _grid,
+         lambda g: core.astar_steps(g, (0, 0), (len(g) - 1, len(g) - 1))),
+    Case("pagerank", "graphes", MEDIUM, _digraph,
+         lambda g: core.pagerank_steps(core.CSRGraph.from_edges(g[0], g[1], directed=True))),
+    Case("kruskal", "graphes", MEDIUM, _weighted_graph,
+         lambda g: core.kruskal_steps(core.CSRGraph.from_edges(g[0], g[1]))),
+    Case("prim", "graphes", MEDIUM, _weighted_graph, lambda g: core.prim_steps(core.CSRGraph.from_edges(g[0], g[1]))),
+    Case("levenshtein", "dp", (10, 20, 40, 80), lambda n, rng: (_text(n, rng), _text(n, rng)),
+         lambda s: _complete(core.levenshtein_steps(s[0], s[1]))),
+    Case("knapsack", "dp", (10, 20, 40, 80), lambda n, rng: ([rng.randint(1, 20) for _ in range(n)],
+                                                             [rng.randint(1, 50) for _ in range(n)], 5 * n),
+         lambda k: core.knapsack_dp(*k)),
+    Case("knapsack_np", "dp", (100, 200, 400, 800),
+         lambda n, rng: core.make_knapsack(n, 100 * n, rng.randrange(2**32))[:2] + (100 * n,),
+         lambda k: core.knapsack_solve(*k)),
+    Case("sieve", "maths", LARGE, lambda n, rng: n, lambda n: _complete(core.sieve_steps(n))),
+    Case("huffman", "structures", LARGE, _text, lambda t: core.build_huffman(t)),
+    Case("rbtree", "structures", (50, 100, 200, 400), lambda n, rng: rng.sample(range(10 * n), n),
+         lambda v: core.build_tree(v)),
+    Case("hash_chaining", "structures", MEDIUM, lambda n, rng: rng.sample(range(10 * n), n),
+         lambda k: core.chaining_steps(k, 2 * len(k), "modulo")),
+    Case("hash_probing", "structures", MEDIUM, lambda n, rng: rng.sample(range(10 * n), n),
+         lambda k: core.linear_probing_steps(k, 2 * len(k), "modulo")),
+    Case("conway", "simulation", (16, 32, 64, 128), _conway_grid,
+         lambda g: core.compute_generations(g, 10)),
+    Case("mandelbrot", "simulation", (50, 100, 200, 400), lambda n, rng: n,
+         lambda n: core.compute_mandelbrot(-2.5, 1.0, -1.25, 1.25, width=n, height=n, max_iter=80)),
+]
+
+BY_NAME = {c.name: c for c in CASES}
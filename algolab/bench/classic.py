@@ -0,0 +1,139 @@
+"""Comparateurs du Dashboard : tris et recherches « nus », sans trace d'étapes.
+
+Les fonctions ``time_*`` sont au niveau module pour pouvoir être envoyées à un
+pool de processus ; chacune mesure un seul algorithme à une seule taille et
+renvoie ``{"ms", "peak_kb", "retained_kb", "blocks"}`` : la mémoire est
+relevée lors d'un appel séparé, sous tracemalloc.
+"""
+import random
+import time
+
+from .runner import trace_memory
+
+
+def bubble(a):
+    a = a.copy()
+    for i in range(len(a)):
+        for j in range(len(a) - i - 1):
+            if a[j] > a[j + 1]:
+                a[j], a[j + 1] = a[j + 1], a[j]
+    return a
+
+
+def merge(a):
+    if len(a) <= 1:
+        return a
+    m = len(a) // 2
+    return merge_combine(merge(a[:m]), merge(a[m:]))
+
+
+def merge_combine(l, r):
+    res, i, j = [], 0, 0
+    while i < len(l) and j < len(r):
+        if l[i] <= r[j]:
+            res.append(l[i])
+            i += 1
+        else:
+            res.append(r[j])
+            j += 1
+    return res + l[i:] + r[j:]
+
+
+def linear(a, t):
+    for x in a:
+        if x == t:
+            return True
+    return False
+
+
+def binary(a, t):
+    lo, hi = 0, len(a) - 1
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        if a[mid] == t:
+            return True
+        elif a[mid] < t:
+            lo = mid + 1
+        else:
+            hi = mid - 1
+    return False
+
+
+SORTS = {"Tri Bulles": bubble, "Tri Fusion": merge, "Tri Rapide": sorted}
+SEARCHES = {"Recherche Linéaire": linear, "Recherche Binaire": binary}
+
+
+def time_sort(name, n, seed=None):
+    """Durée (ms) et mémoire d'un tri de ``n`` entiers distincts tirés avec ``seed``."""
+    arr = random.Random(seed).sample(range(1, 10000), n)
+    t0 = time.perf_counter()
+    SORTS[name](arr)
+    ms = (time.perf_counter() - t0) * 1000
+    _, mem = trace_memory(SORTS[name], arr)
+    return {"ms": ms, **mem}
+
+
+def time_search(name, n, target, calls=100):
+    """Durée moyenne (ms) et mémoire d'une recherche de ``target`` dans ``range(n)``."""
+    arr = list(range(n))
+    fn = SEARCHES[name]
+    t0 = time.perf_counter()
+    for _ in range(calls):
+        fn(arr, target)
+    ms = (time.perf_counter() - t0) * 1000 / calls
+    _, mem = trace_memory(fn, arr, target)
+    return {"ms": ms, **mem}
+
+
+def time_parallel_sort(n, workers, seed=None, repeat=3):
+    """Passage à l'échelle du tri fusion parallèle sur ``n`` entiers (int32).
+
+    Tâche unique, les nombres de workers étant mesurés l'un après l'autre pour
+    ne pas se disputer les cœurs ; pour chacun, un pool démarré d'avance et la
+    meilleure de ``repeat`` exécutions. L'accélération est rapportée à la
+    première mesure (1 worker) ; ``numpy_ms`` : ``np.sort`` seul, pour repère.
+    """
+    import numpy as np
+
+    from algolab.core import parallel
+
+    arr = np.random.default_rng(seed).integers(0, 2**31 - 1, n, dtype=np.int32)
+    t0 = time.perf_counter()
+    np.sort(arr)
+    numpy_ms = (time.perf_counter() - t0) * 1000
+    rows = []
+    for w in workers:
+        pool = parallel.make_pool(w)
+        try:
+            rows.append(min((parallel.parallel_merge_sort(arr, w, pool=pool)[1] for _ in range(repeat)),
+                            key=lambda t: t["total"]))
+        finally:
+            pool.shutdown()
+    for row in rows:
+        row["speedup"] = rows[0]["total"] / row["total"]
+    fraction = parallel.amdahl_fraction([r["workers"] for r in rows], [r["speedup"] for r in rows])
+    return {"n": n, "numpy_ms": numpy_ms, "rows": rows, "fraction": fraction}
+
+
+def time_knapsack(n, capacity, kind, seed=None, solver="dp"):
+    """Grand sac à dos (``core.make_knapsack``) résolu par ``solver``.
+
+    ``"dp"`` : DP vectorisée (variante ``kind``) ; ``"bb"`` : séparation-
+    évaluation ; ``"mitm"`` : rencontre au milieu (ces deux-là en 0/1).
+    Renvoie ``{"ms", "value", "taken", "nodes", …}`` : ``taken``, exemplaires
+    pris au total ; ``nodes``, cellules, nœuds ou sous-ensembles parcourus.
+    """
+    from algolab.core import knapsack
+
+    weights, values, counts = knapsack.make_knapsack(n, capacity, seed)
+    t0 = time.perf_counter()
+    if solver == "dp":
+        value, copies, info = knapsack.knapsack_solve(weights, values, capacity, kind,
+                                                      counts if kind == "bounded" else None)
+        taken = sum(copies)
+    else:
+        fn = {"bb": knapsack.knapsack_branch_bound, "mitm": knapsack.knapsack_meet_in_middle}[solver]
+        value, chosen, info = fn(weights, values, capacity)
+        taken = len(chosen)
+    ms = (time.perf_counter() - t0) * 1000
+    return {"ms": ms, "value": value, "taken": taken, **info}
@@ -0,0 +1,64 @@
+"""Ajustement empirique de complexité : t(n) ≈ c · f(n).
+
+Pour chaque modèle, la constante c est choisie par moindres carrés sur
+l'erreur relative (chaque mesure pèse autant, quelle que soit sa durée) ;
+le meilleur modèle est celui dont l'erreur relative quadratique moyenne est
+la plus faible.
+"""
+import math
+
+MODELS = {
+    "O(1)": lambda n: 1.0,
+    "O(log n)": lambda n: math.log2(n),
+    "O(n)": lambda n: float(n),
+    "O(n log n)": lambda n: n * math.log2(n),
+    "O(n²)": lambda n: float(n) ** 2,
+}
+MIN_POINTS = 3  # en dessous, tous les modèles s'ajustent trop bien
+
+
+def geometric_sizes(start, count, factor=2):
+    """Suite géométrique de tailles : start, start·factor, …"""
+    return [int(start * factor**k) for k in range(count)]
+
+
+def fit_model(ns, ts, f):
+    """Constante c et erreur relative RMS de ``t ≈ c · f(n)``."""
+    xs = [f(n) for n in ns]
+    num = sum(x / t for x, t in zip(xs, ts))
+    den = sum((x / t) ** 2 for x, t in zip(xs, ts))
+    c = num / den if den else 0.0
+    err = math.sqrt(sum(((t - c * x) / t) ** 2 for x, t in zip(xs, ts)) / len(ts))
+    return c, err
+
+
+def fit(ns, ts):
+    """Ajuste tous les modèles ; renvoie ``(meilleur, {modèle: (c, erreur)})``.
+
+    ``ns`` : tailles (≥ 2), ``ts`` : durées strictement positives (même unité
+    que la constante renvoyée).
+    """
+    if len(ns) != len(ts) or len(ns) < MIN_POINTS:
+        raise ValueError("au moins trois mesures sont nécessaires")
+    if min(ns) < 2 or min(ts) <= 0:
+        raise ValueError("tailles ≥ 2 et durées > 0 attendues")
+    fits = {name: fit_model(ns, ts, f) for name, f in MODELS.items()}
+    best = min(fits, key=lambda name: fits[name][1])
+    return best, fits
+
+
+def fit_results(results, key="median_ms"):
+    """Ajuste les résultats de ``runner.run`` ; un ajustement par cas.
+
+    Renvoie ``{cas: (meilleur, {modèle: (c, erreur)})}`` pour les cas ayant
+    au moins trois tailles mesurées.
+    """
+    by_case = {}
+    for res in results:
+        by_case.setdefault(res["case"], []).append((res["n"], res[key]))
+    out = {}
+    for case, points in by_case.items():
+        points.sort()
+        if len(points) >= MIN_POINTS:
+            out[case] = fit([n for n, _ in points], [t for _, t in points])
+    return out
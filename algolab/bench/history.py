@@ -0,0 +1,228 @@
+"""Historique des benchmarks (SQLite) et détection de régressions.
+
+Chaque exécution est rangée avec l'empreinte de la machine, la version de
+Python et la révision git : on ne compare que des mesures prises dans le
+même environnement. Une régression est signalée quand le test de
+Mann-Whitney (unilatéral) juge les nouvelles durées significativement plus
+longues que celles des exécutions précédentes, et que la médiane a
+réellement augmenté.
+"""
+import datetime
+import hashlib
+import json
+import math
+import os
+import platform
+import sqlite3
+import subprocess
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_DB = os.environ.get("GRAPHIX_BENCH_DB", os.path.join(_ROOT, "bench_history.sqlite"))
+
+ALPHA = 0.05  # seuil de significativité
+MIN_SLOWDOWN = 1.05  # ralentissement minimal de la médiane pour signaler
+WINDOW = 3  # nombre d'exécutions précédentes servant de référence
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp   TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    python      TEXT NOT NULL,
+    git_rev     TEXT NOT NULL,
+    label       TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id      INTEGER NOT NULL REFERENCES runs(id),
+    case_name   TEXT NOT NULL,
+    n           INTEGER NOT NULL,
+    median_ms   REAL NOT NULL,
+    p95_ms      REAL NOT NULL,
+    min_ms      REAL NOT NULL,
+    throughput  REAL NOT NULL,
+    times_ms    TEXT NOT NULL,
+    peak_kb     REAL,
+    retained_kb REAL,
+    blocks      INTEGER
+);
+CREATE INDEX IF NOT EXISTS results_case ON results(case_name, n);
+"""
+
+
+# ── Environnement ─────────────────────────────────────────────────────────────
+
+def fingerprint():
+    """Empreinte courte de la machine (hôte, architecture, processeur, cœurs)."""
+    parts = [platform.node(), platform.system(), platform.machine(),
+             platform.processor(), str(os.cpu_count())]
+    return hashlib.sha1("|".join(parts).encode()).hexdigest()[:12]
+
+
+def git_revision():
+    """Révision git courte, suffixée de ``+dirty`` si l'arbre est modifié."""
+    try:
+        rev = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=_ROOT,
+                             capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=_ROOT,
+                               capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return rev + ("+dirty" if dirty else "")
+
+
+# Colonnes ajoutées après la création du schéma : migrées à l'ouverture.
+_ADDED_COLUMNS = {"peak_kb": "REAL", "retained_kb": "REAL", "blocks": "INTEGER"}
+
+
+def connect(path=None):
+    conn = sqlite3.connect(path or DEFAULT_DB)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(_SCHEMA)
+    present = {r["name"] for r in conn.execute("PRAGMA table_info(results)")}
+    for name, kind in _ADDED_COLUMNS.items():
+        if name not in present:
+            conn.execute(f"ALTER TABLE results ADD COLUMN {name} {kind}")
+    return conn
+
+
+# ── Écriture / lecture ────────────────────────────────────────────────────────
+
+def record(results, path=None, label=""):
+    """Enregistre une exécution (résultats de ``runner.run``) ; renvoie son id."""
+    with connect(path) as conn:
+        cur = conn.execute(
+            "INSERT INTO runs (timestamp, fingerprint, python, git_rev, label) VALUES (?, ?, ?, ?, ?)",
+            (datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+             fingerprint(), platform.python_version(), git_revision(), label),
+        )
+        run_id = cur.lastrowid
+        conn.executemany(
+            """INSERT INTO results (run_id, case_name, n, median_ms, p95_ms, min_ms, throughput,
+                                    times_ms, peak_kb, retained_kb, blocks)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            [(run_id, r["case"], r["n"], r["median_ms"], r["p95_ms"], r["min_ms"],
+              r["throughput"], json.dumps(r["times_ms"]),
+              r.get("peak_kb"), r.get("retained_kb"), r.get("blocks")) for r in results],
+        )
+    return run_id
+
+
+def trend(case, path=None, fp=None, python=None):
+    """Mesures d'un cas dans le temps pour cet environnement (défaut : le courant)."""
+    fp = fp or fingerprint()
+    python = python or platform.python_version()
+    with connect(path) as conn:
+        rows = conn.execute(
+            """SELECT runs.id AS run_id, timestamp, git_rev, n, median_ms, p95_ms, times_ms,
+                      peak_kb, retained_kb
+               FROM results JOIN runs ON runs.id = results.run_id
+               WHERE case_name = ? AND fingerprint = ? AND python = ?
+               ORDER BY runs.id""",
+            (case, fp, python),
+        ).fetchall()
+    return [dict(r, times_ms=json.loads(r["times_ms"])) for r in rows]
+
+
+def cases(path=None):
+    with connect(path) as conn:
+        return [r[0] for r in conn.execute("SELECT DISTINCT case_name FROM results ORDER BY 1")]
+
+
+def last_run_id(path=None):
+    with connect(path) as conn:
+        row = conn.execute("SELECT MAX(id) FROM runs").fetchone()
+    return row[0]
+
+
+# ── Statistiques ──────────────────────────────────────────────────────────────
+
+def mann_whitney_u(x, y):
+    """Test de Mann-Whitney unilatéral « x > y » (approximation normale).
+
+    Renvoie ``(U, p)`` où U compte les paires (xi, yj) avec xi > yj (les
+    égalités comptent pour ½). Correction des ex-æquo et de continuité.
+    """
+    n1, n2 = len(x), len(y)
+    if not n1 or not n2:
+        raise ValueError("deux échantillons non vides attendus")
+    pooled = sorted([(v, 0) for v in x] + [(v, 1) for v in y])
+    ranks, ties, i = [0.0] * len(pooled), 0.0, 0
+    while i < len(pooled):
+        j = i
+        while j + 1 < len(pooled) and pooled[j + 1][0] == pooled[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        t = j - i + 1
+        ties += t**3 - t
+        i = j + 1
+    r1 = sum(r for r, (_, g) in zip(ranks, pooled) if g == 0)
+    u = r1 - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    var = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if var <= 0:
+        return u, 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(var)
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def _median(xs):
+    xs = sorted(xs)
+    m = len(xs) // 2
+    return xs[m] if len(xs) % 2 else (xs[m - 1] + xs[m]) / 2
+
+
+def _rev_range(revs):
+    """``premier..dernier`` pour des révisions dans l'ordre des exécutions."""
+    return revs[0] if len(revs) == 1 else f"{revs[0]}..{revs[-1]}"
+
+
+def regressions(run_id=None, path=None, window=WINDOW, alpha=ALPHA, min_slowdown=MIN_SLOWDOWN):
+    """Compare une exécution (défaut : la dernière) aux ``window`` précédentes.
+
+    Seules les exécutions du même environnement (empreinte + Python) servent de
+    référence. Renvoie une liste de dicts triée par ralentissement décroissant :
+    ``case, n, ratio, p, baseline_ms, current_ms, baseline_rev, current_rev``.
+    ``baseline_rev`` couvre les révisions de la référence, de la plus ancienne
+    à la plus récente (``a1b2c3d..e4f5a6b`` si elles diffèrent).
+    """
+    with connect(path) as conn:
+        run_id = run_id or conn.execute("SELECT MAX(id) FROM runs").fetchone()[0]
+        run = conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+        if run is None:
+            return []
+        base_ids = [r[0] for r in conn.execute(
+            """SELECT id FROM runs WHERE fingerprint = ? AND python = ? AND id < ?
+               ORDER BY id DESC LIMIT ?""",
+            (run["fingerprint"], run["python"], run_id, window))]
+        if not base_ids:
+            return []
+        marks = ",".join("?" * len(base_ids))
+        base = {}
+        for r in conn.execute(
+                f"""SELECT case_name, n, times_ms, git_rev FROM results
+                    JOIN runs ON runs.id = results.run_id WHERE run_id IN ({marks})
+                    ORDER BY run_id""", base_ids):
+            entry = base.setdefault((r["case_name"], r["n"]), ([], {}))
+            entry[0].extend(json.loads(r["times_ms"]))
+            entry[1][r["git_rev"]] = None
+        current = conn.execute(
+            "SELECT case_name, n, times_ms FROM results WHERE run_id = ?", (run_id,)).fetchall()
+
+    flagged = []
+    for r in current:
+        key = (r["case_name"], r["n"])
+        if key not in base:
+            continue
+        cur_times, (base_times, base_revs) = json.loads(r["times_ms"]), base[key]
+        ratio = _median(cur_times) / _median(base_times)
+        if ratio < min_slowdown:
+            continue
+        _, p = mann_whitney_u(cur_times, base_times)
+        if p < alpha:
+            flagged.append({
+                "case": key[0], "n": key[1], "ratio": ratio, "p": p,
+                "baseline_ms": _median(base_times), "current_ms": _median(cur_times),
+                "baseline_rev": _rev_range(list(base_revs)), "current_rev": run["git_rev"],
+            })
+    return sorted(flagged, key=lambda f: -f["ratio"])
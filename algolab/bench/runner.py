@@ -0,0 +1,99 @@
+"""Exécution des benchmarks : échauffement, répétitions, statistiques."""
+import gc
+import math
+import random
+import time
+import tracemalloc
+
+
+def percentile(values, q):
+    """Percentile q (0–100) par interpolation linéaire."""
+    xs = sorted(values)
+    if not xs:
+        raise ValueError("percentile d'une série vide")
+    pos = (len(xs) - 1) * q / 100
+    lo, hi = math.floor(pos), math.ceil(pos)
+    return xs[lo] + (xs[hi] - xs[lo]) * (pos - lo)
+
+
+def trace_memory(fn, *args):
+    """Appelle ``fn(*args)`` sous tracemalloc ; renvoie ``(résultat, mesures)``.
+
+    ``peak_kb`` : pic de mémoire allouée pendant l'appel ; ``retained_kb`` et
+    ``blocks`` : octets et blocs encore alloués à la sortie, c'est-à-dire
+    retenus par le résultat (la trace renvoyée). Appel séparé des mesures de
+    temps : tracemalloc ralentit fortement l'exécution.
+    """
+    gc.collect()
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        tracemalloc.clear_traces()
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        result = fn(*args)
+        current, peak = tracemalloc.get_traced_memory()
+        blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    finally:
+        if started:
+            tracemalloc.stop()
+    return result, {
+        "peak_kb": (peak - base) / 1024,
+        "retained_kb": (current - base) / 1024,
+        "blocks": blocks,
+    }
+
+
+def time_case(case, n, repeat=5, warmup=1, seed=0, memory=True):
+    """Mesure ``case`` à la taille n.
+
+    L'entrée est reconstruite à l'identique (même graine) avant chaque appel,
+    hors chronométrage, pour qu'un moteur qui la modifierait ne fausse pas la
+    répétition suivante. Avec ``memory``, un appel supplémentaire sous
+    tracemalloc ajoute ``peak_kb``, ``retained_kb`` et ``blocks``.
+    """
+    for _ in range(warmup):
+        case.run(case.make(n, random.Random(seed)))
+    times = []
+    for _ in range(repeat):
+        inp = case.make(n, random.Random(seed))
+        t0 = time.perf_counter()
+        case.run(inp)
+        times.append(time.perf_counter() - t0)
+    median = percentile(times, 50)
+    res = {
+        "case": case.name,
+        "group": case.group,
+        "n": n,
+        "repeat": repeat,
+        "warmup": warmup,
+        "min_ms": min(times) * 1000,
+        "median_ms": median * 1000,
+        "p95_ms": percentile(times, 95) * 1000,
+        "throughput": n / median if median > 0 else float("inf"),
+        "times_ms": [t * 1000 for t in times],
+    }
+    if memory:
+        _, mem = trace_memory(case.run, case.make(n, random.Random(seed)))
+        res.update(mem)
+    return res
+
+
+def run(cases, sizes=None, repeat=5, warmup=1, seed=0, memory=True, on_result=None):
+    """Balaye les tailles de chaque cas ; ``sizes`` remplace les tailles par défaut."""
+    results = []
+    for case in cases:
+        for n in sizes or case.sizes:
+            res = time_case(case, n, repeat=repeat, warmup=warmup, seed=seed, memory=memory)
+            results.append(res)
+            if on_result is not None:
+                on_result(res)
+    return results
+
+
+def time_named(name, n, repeat=5, warmup=1, seed=0, memory=True):
+    """``time_case`` par nom de cas : appelable depuis un autre processus."""
+    from .cases import BY_NAME
+
+    return time_case(BY_NAME[name], n, repeat=repeat, warmup=warmup, seed=seed, memory=memory)
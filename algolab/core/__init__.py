@@ -0,0 +1,101 @@
+"""Moteurs d'algorithmes, sans Streamlit ni Plotly.
+
+Les sous-modules sont chargés à la demande : ``from algolab.core import
+dijkstra_steps`` n'importe que ``algolab.core.graphs``. Le temps d'import est
+surveillé par ``python -m algolab.core.importcheck``.
+"""
+import importlib
+
+_EXPORTS = {
+    # Tris et recherche
+    "bubble_sort_steps": "sorting",
+    "merge_sort_steps": "sorting",
+    "quick_sort_steps": "sorting",
+    "intro_sort_steps": "sorting",
+    "quick3_sort_steps": "sorting",
+    "shell_sort_steps": "sorting",
+    "natural_merge_sort_steps": "sorting",
+    "make_input": "sorting",
+    "heap_sort_steps": "sorting",
+    "counting_sort_steps": "sorting",
+    "radix_sort_steps": "sorting",
+    "sort_stats": "sorting",
+    "parallel_merge_sort": "parallel",
+    "binary_search_steps": "search",
+    # Graphes
+    "dijkstra_steps": "graphs",
+    "bfs_steps": "graphs",
+    "dfs_steps": "graphs",
+    "route_steps": "graphs",
+    "shortest_paths": "graphs",
+    "bfs_levels": "graphs",
+    "CSRGraph": "csr",
+    "load_graph": "graphio",
+    "dedupe_edges": "graphio",
+    "astar_steps": "pathfinding",
+    "kruskal_steps": "mst",
+    "prim_steps": "mst",
+    "pagerank_steps": "pagerank",
+    "pagerank_scores": "pagerank",
+    "flood_fill_steps": "floodfill",
+    "count_islands_steps": "floodfill",
+    "generate_maze": "maze",
+    "solve_maze_bfs": "maze",
+    # Programmation dynamique et récursion
+    "knapsack_dp": "knapsack",
+    "knapsack_value": "knapsack",
+    "knapsack_solve": "knapsack",
+    "knapsack_branch_bound": "knapsack",
+    "knapsack_meet_in_middle": "knapsack",
+    "make_knapsack": "knapsack",
+    "levenshtein_distance": "levenshtein",
+    "levenshtein_steps": "levenshtein",
+    "fib_recursive_trace": "fibonacci",
+    "fib_memo_steps": "fibonacci",
+    "fib_iterative_steps": "fibonacci",
+    "hanoi_moves": "hanoi",
+    "hanoi_move": "hanoi",
+    "iter_hanoi_moves": "hanoi",
+    "hanoi_state": "hanoi",
+    "hanoi_states": "hanoi",
+    "n_queens_steps": "nqueens",
+    # Structures de données
+    "BST": "bst",
+    "RBTree": "rbtree",
+    "build_tree": "rbtree",
+    "chaining_steps": "hashing",
+    "linear_probing_steps": "hashing",
+    "build_huffman": "huffman",
+    # Mathématiques et simulation
+    "primes_up_to": "sieve",
+    "sieve_steps": "sieve",
+    "cesar_steps": "crypto",
+    "rsa_compute": "crypto",
+    "monte_carlo_pi": "montecarlo",
+    "genetic_steps": "genetic",
+    "compute_generations": "conway",
+    "compute_mandelbrot": "mandelbrot",
+    # Traces
+    "DeltaTrace": "trace",
+    "LazyTrace": "trace",
+    "StoredTrace": "traceio",
+}
+
+SUBMODULES = sorted(set(_EXPORTS.values()))
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS) | set(SUBMODULES))
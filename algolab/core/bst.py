@@ -0,0 +1,111 @@
+"""Arbre binaire de recherche."""
+
+
+class Node:
+    def __init__(self, val):
+        self.val   = val
+        self.left  = None
+        self.right = None
+
+
+class BST:
+    def __init__(self):
+        self.root  = None
+        self.steps = []
+
+    def insert(self, val):
+        self.steps = []
+        self.root  = self._insert(self.root, val)
+
+    def _insert(self, node, val):
+        if node is None:
+            self.steps.append(("insert_done", val))
+            return Node(val)
+        self.steps.append(("compare", node.val, val))
+        if val < node.val:
+            self.steps.append(("go_left", node.val))
+            node.left  = self._insert(node.left, val)
+        elif val > node.val:
+            self.steps.append(("go_right", node.val))
+            node.right = self._insert(node.right, val)
+        else:
+            self.steps.append(("duplicate", val))
+        return node
+
+    def search(self, val):
+        self.steps = []
+        return self._search(self.root, val)
+
+    def _search(self, node, val):
+        if node is None:
+            self.steps.append(("not_found", val))
+            return False
+        self.steps.append(("compare", node.val, val))
+        if val == node.val:
+            self.steps.append(("found", val))
+            return True
+        elif val < node.val:
+            self.steps.append(("go_left", node.val))
+            return self._search(node.left, val)
+        else:
+            self.steps.append(("go_right", node.val))
+            return self._search(node.right, val)
+
+    def delete(self, val):
+        self.steps = []
+        self.root  = self._delete(self.root, val)
+
+    def _delete(self, node, val):
+        if node is None:
+            self.steps.append(("not_found", val))
+            return None
+        self.steps.append(("compare", node.val, val))
+        if val < node.val:
+            self.steps.append(("go_left", node.val))
+            node.left  = self._delete(node.left, val)
+        elif val > node.val:
+            self.steps.append(("go_right", node.val))
+            node.right = self._delete(node.right, val)
+        else:
+            self.steps.append(("delete", val))
+            if node.left is None:  return node.right
+            if node.right is None: return node.left
+            # Successeur in-order
+            succ = node.right
+            while succ.left: succ = succ.left
+            self.steps.append(("replace", val, succ.val))
+            node.val   = succ.val
+            node.right = self._delete(node.right, succ.val)
+        return node
+
+    def traversal(self, mode):
+        self.steps = []
+        order = []
+        if mode == "In-order (trié)":
+            self._inorder(self.root, order)
+        elif mode == "Pré-order":
+            self._preorder(self.root, order)
+        else:
+            self._postorder(self.root, order)
+        return order
+
+    def _inorder(self, node, out):
+        if node:
+            self._inorder(node.left, out)
+            out.append(node.val)
+            self.steps.append(("visit", node.val))
+            self._inorder(node.right, out)
+
+    def _preorder(self, node, out):
+        if node:
+            out.append(node.val)
+            self.steps.append(("visit", node.val))
+            self._preorder(node.left, out)
+            self._preorder(node.right, out)
+
+    def _postorder(self, node, out):
+        if node:
+            self._postorder(node.left, out)
+            self._postorder(node.right, out)
+            out.append(node.val)
+            self.steps.append(("visit", node.val))
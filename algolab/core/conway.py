@@ -0,0 +1,70 @@
+"""Jeu de la vie de Conway."""
+import numpy as np
+
+
+def next_generation(grid):
+    n_rows, n_cols = grid.shape
+    new_grid = np.zeros_like(grid)
+    for r in range(n_rows):
+        for c in range(n_cols):
+            neighbors = int(np.sum(grid[max(0,r-1):r+2, max(0,c-1):c+2])) - int(grid[r, c])
+            if grid[r, c] == 1:
+                new_grid[r, c] = 1 if neighbors in (2, 3) else 0
+            else:
+                new_grid[r, c] = 1 if neighbors == 3 else 0
+    return new_grid
+
+
+def compute_generations(grid, n_gen):
+    frames_data = [grid.copy()]
+    alive_counts = [int(np.sum(grid))]
+    g = grid.copy()
+    for _ in range(n_gen):
+        g = next_generation(g)
+        frames_data.append(g.copy())
+        alive_counts.append(int(np.sum(g)))
+    return frames_data, alive_counts
+
+
+def make_grid(rows, cols, pattern, seed=42):
+    grid = np.zeros((rows, cols), dtype=int)
+    cr, cc = rows // 2, cols // 2
+
+    if pattern == "Aléatoire":
+        rng = np.random.default_rng(seed)
+        grid = rng.integers(0, 2, size=(rows, cols))
+
+    elif pattern == "Planeur (Glider)":
+        g = [(0,1),(1,2),(2,0),(2,1),(2,2)]
+        for dr, dc in g:
+            grid[cr-1+dr][cc-1+dc] = 1
+
+    elif pattern == "Oscillateur (Blinker)":
+        for dc in range(-1, 2):
+            grid[cr][cc+dc] = 1
+
+    elif pattern == "Canon de Gosper":
+        # Gosper Glider Gun — pattern classique
+        cells = [
+            (5,1),(5,2),(6,1),(6,2),
+            (5,11),(6,11),(7,11),(4,12),(8,12),(3,13),(9,13),(3,14),(9,14),
+            (6,15),(4,16),(8,16),(5,17),(6,17),(7,17),(6,18),
+            (3,21),(4,21),(5,21),(3,22),(4,22),(5,22),(2,23),(6,23),
+            (1,25),(2,25),(6,25),(7,25),
+            (3,35),(4,35),(3,36),(4,36),
+        ]
+        for r, c in cells:
+            if 0 <= r < rows and 0 <= c < cols:
+                grid[r][c] = 1
+
+    elif pattern == "Ruche (Beehive)":
+        hive = [(0,1),(0,2),(1,0),(1,3),(2,1),(2,2)]
+        for dr, dc in hive:
+            grid[cr-1+dr][cc-2+dc] = 1
+
+    elif pattern == "Vaisseau spatial (LWSS)":
+        lwss = [(0,1),(0,4),(1,0),(2,0),(2,4),(3,0),(3,1),(3,2),(3,3)]
+        for dr, dc in lwss:
+            grid[cr-1+dr][cc-2+dc] = 1
+
+    return grid
@@ -0,0 +1,86 @@
+"""Chiffrement de César et RSA (petits nombres)."""
+import math
+
+
+def cesar_encode(text, shift):
+    result = []
+    for ch in text:
+        if ch.isalpha():
+            base = ord("A") if ch.isupper() else ord("a")
+            result.append(chr((ord(ch) - base + shift) % 26 + base))
+        else:
+            result.append(ch)
+    return "".join(result)
+
+
+def cesar_steps(text, shift):
+    steps = []
+    result = []
+    for i, ch in enumerate(text):
+        if ch.isalpha():
+            base = ord("A") if ch.isupper() else ord("a")
+            orig_pos = ord(ch) - base
+            enc_pos = (orig_pos + shift) % 26
+            enc = chr(enc_pos + base)
+            result.append(enc)
+            steps.append(
+                {
+                    "index": i,
+                    "char": ch,
+                    "encoded": enc,
+                    "orig_pos": orig_pos,
+                    "enc_pos": enc_pos,
+                    "result_so_far": "".join(result),
+                    "desc": f"'{ch}' (position {orig_pos}) + décalage {shift} mod 26 = position {enc_pos} → '<b>{enc}</b>'",
+                }
+            )
+        else:
+            result.append(ch)
+            steps.append(
+                {
+                    "index": i,
+                    "char": ch,
+                    "encoded": ch,
+                    "orig_pos": None,
+                    "enc_pos": None,
+                    "result_so_far": "".join(result),
+                    "desc": f"'{ch}' — non alphabétique, conservé tel quel",
+                }
+            )
+    return steps
+
+
+def is_prime(n):
+    if n < 2:
+        return False
+    for i in range(2, int(n**0.5) + 1):
+        if n % i == 0:
+            return False
+    return True
+
+
+def mod_inverse(e, phi):
+    for d in range(2, phi):
+        if (e * d) % phi == 1:
+            return d
+    return None
+
+
+def rsa_compute(p, q, message):
+    n = p * q
+    phi = (p - 1) * (q - 1)
+    e = next(c for c in range(2, phi) if math.gcd(c, phi) == 1)
+    d = mod_inverse(e, phi)
+
+    enc_pairs = []
+    dec_pairs = []
+    for ch in message:
+        m = ord(ch)
+        if m < n:
+            c = pow(m, e, n)
+            enc_pairs.append((ch, m, c))
+    for ch, m, c in enc_pairs:
+        m2 = pow(c, d, n)
+        dec_pairs.append((c, m2, chr(m2)))
+
+    return n, phi, e, d, enc_pairs, dec_pairs
@@ -0,0 +1,145 @@
+"""Graphe en tableaux CSR, partagé par les moteurs de graphes.
+
+Les nœuds sont des entiers 0 … n-1 ; ``labels`` garde leurs noms. Les arcs
+sortants du nœud i sont ``targets[offsets[i]:offsets[i+1]]``, de poids
+``weights`` aux mêmes positions ; un graphe non orienté range chaque arête
+dans les deux sens. ``arc_ids`` donne la place de chaque arc dans la liste
+d'origine (2e et 2e+1 pour l'arête e non orientée) : les voisins d'un nœud
+restent dans l'ordre des arêtes fournies. ``labels`` peut rester un tableau
+NumPy (ids d'origine d'un fichier, voir ``graphio``).
+
+    g = CSRGraph.from_edges(["A", "B", "C"], [("A", "B", 4), ("B", "C", 1)])
+    g.neighbors(g.id("B"))   # ([0, 2], [4, 1])
+
+Pas de dict par nœud : un graphe de 10⁶ arêtes tient en quelques tableaux.
+"""
+import hashlib
+
+import numpy as np
+
+
+class CSRGraph:
+    """Graphe orienté ou non, en trois tableaux (+ ``arc_ids``) et des étiquettes."""
+
+    def __init__(self, offsets, targets, weights, labels=None, directed=False, arc_ids=None):
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.targets = np.asarray(targets, dtype=np.int32)
+        self.weights = np.asarray(weights)
+        self.arc_ids = np.arange(len(self.targets)) if arc_ids is None else np.asarray(arc_ids)
+        self.labels = labels if labels is None or isinstance(labels, np.ndarray) else list(labels)
+        self.directed = directed
+        self._index = None
+        self._lists = None
+        self._key = None
+
+    @classmethod
+    def from_arrays(cls, n, src, dst, weights=None, labels=None, directed=False):
+        """Graphe à n nœuds depuis des tableaux d'arcs ``src → dst`` (ids entiers)."""
+        src, dst = np.asarray(src, dtype=np.int64), np.asarray(dst, dtype=np.int64)
+        w = np.ones(len(src), dtype=np.int64) if weights is None else np.asarray(weights)
+        if not directed:  # arête e : arcs 2e (u → v) et 2e+1 (v → u)
+            src, dst = np.stack((src, dst), 1).ravel(), np.stack((dst, src), 1).ravel()
+            w = np.repeat(w, 2)
+        m = len(src)  # tri stable par src : clé composite unique src·m + rang
+        order = np.sort(src * m + np.arange(m)) % max(m, 1)
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=offsets[1:])
+        return cls(offsets, dst[order], w[order], labels, directed, order)
+
+    @classmethod
+    def from_edges(cls, nodes, edges, directed=False):
+        """``edges`` : triplets ``(u, v, poids)`` ou couples ``(u, v)`` (poids 1)."""
+        index = {node: i for i, node in enumerate(nodes)}
+        src = [index[e[0]] for e in edges]
+        dst = [index[e[1]] for e in edges]
+        w = np.asarray([e[2] if len(e) > 2 else 1 for e in edges]) if edges else np.zeros(0, np.int64)
+        graph = cls.from_arrays(len(index), src, dst, w, nodes, directed)
+        graph._index = index
+        return graph
+
+    # ── Accès ────────────────────────────────────────────────────────────────
+
+    @property
+    def n(self):
+        return len(self.offsets) - 1
+
+    @property
+    def num_edges(self):
+        return len(self.targets) if self.directed else len(self.targets) // 2
+
+    @property
+    def nbytes(self):
+        arrays = (self.offsets, self.targets, self.weights, self.arc_ids, self.labels)
+        return sum(a.nbytes for a in arrays if isinstance(a, np.ndarray))
+
+    def names(self):
+        """Étiquette de chaque nœud (ses ids s'il n'y en a pas)."""
+        if isinstance(self.labels, np.ndarray):
+            return self.labels.tolist()
+        return self.labels if self.labels is not None else list(range(self.n))
+
+    def id(self, label):
+        if self.labels is None:
+            return int(label)
+        if isinstance(self.labels, np.ndarray):  # pas de dict : une recherche vectorisée
+            found = np.flatnonzero(self.labels == label)
+            if not len(found):
+                raise KeyError(label)
+            return int(found[0])
+        if self._index is None:
+            self._index = {node: i for i, node in enumerate(self.labels)}
+        return self._index[label]
+
+    def label(self, i):
+        if isinstance(self.labels, np.ndarray):
+            return self.labels[i].item()
+        return self.labels[i] if self.labels is not None else i
+
+    def lists(self):
+        """``(offsets, targets, weights)`` en listes Python, pour les boucles nœud à nœud."""
+        if self._lists is None:
+            self._lists = (self.offsets.tolist(), self.targets.tolist(), self.weights.tolist())
+        return self._lists
+
+    def neighbors(self, u):
+        """Voisins et poids des arcs sortants de u, dans l'ordre des arêtes."""
+        off, tgt, w = self.lists()
+        return tgt[off[u]:off[u + 1]], w[off[u]:off[u + 1]]
+
+    def out_degree(self):
+        return np.diff(self.offsets)
+
+    def sources(self):
+        """Nœud de départ de chaque arc (aligné sur ``targets``)."""
+        return np.repeat(np.arange(self.n, dtype=np.int32), np.diff(self.offsets))
+
+    def edges(self):
+        """``(src, dst, poids)`` des arêtes, dans l'ordre d'origine et le sens donné."""
+        arcs = np.arange(len(self.targets)) if self.directed else np.flatnonzero(self.arc_ids % 2 == 0)
+        arcs = arcs[np.argsort(self.arc_ids[arcs], kind="stable")]
+        return self.sources()[arcs], self.targets[arcs], self.weights[arcs]
+
+    # ── Clé de cache : contenu, pas identité ──────────────────────────────────
+
+    def _digest(self):
+        if self._key is None:
+            h = hashlib.blake2b(digest_size=16)
+            for a in (self.offsets, self.targets, self.weights, self.arc_ids):
+                h.update(a.tobytes())
+            labels = self.labels
+            if isinstance(labels, np.ndarray):
+                h.update(labels.tobytes())
+                labels = labels.dtype.str
+            h.update(repr((self.directed, labels)).encode())
+            self._key = h.hexdigest()
+        return self._key
+
+    def __hash__(self):
+        return hash(self._digest())
+
+    def __eq__(self, other):
+        return isinstance(other, CSRGraph) and self._digest() == other._digest()
+
+    def __repr__(self):
+        kind = "orienté" if self.directed else "non orienté"
+        return f"CSRGraph({self.n} nœuds, {self.num_edges} arêtes, {kind})"
@@ -0,0 +1,130 @@
+"""Remplissage par diffusion (flood fill) et comptage d'îles."""
+from collections import deque
+
+
+def flood_fill_steps(grid, sx, sy, new_color):
+    n = len(grid)
+    g = [row[:] for row in grid]
+    old_c = g[sx][sy]
+    if old_c == new_color:
+        return [
+            {
+                "grid": g,
+                "frontier": set(),
+                "filled": set(),
+                "desc": "La couleur cible est identique — rien à faire",
+            }
+        ]
+
+    steps = []
+    frontier = deque([(sx, sy)])
+    visited = set()
+    filled = set()
+
+    steps.append(
+        {
+            "grid": [r[:] for r in g],
+            "frontier": {(sx, sy)},
+            "filled": set(),
+            "desc": f"Départ en ({sx},{sy}) — couleur source : <b>{old_c}</b>, cible : <b>{new_color}</b>",
+        }
+    )
+
+    while frontier:
+        batch_front = set()
+        next_frontier = deque()
+        # Traiter toute la frontière courante en une étape visuelle
+        for _ in range(min(len(frontier), 8)):
+            if not frontier:
+                break
+            x, y = frontier.popleft()
+            if (x, y) in visited:
+                continue
+            visited.add((x, y))
+            g[x][y] = new_color
+            filled.add((x, y))
+            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+                nx, ny = x + dx, y + dy
+                if (
+                    0 <= nx < n
+                    and 0 <= ny < n
+                    and g[nx][ny] == old_c
+                    and (nx, ny) not in visited
+                ):
+                    next_frontier.append((nx, ny))
+                    batch_front.add((nx, ny))
+            frontier.extendleft(list(next_frontier)[::-1])
+            next_frontier = deque()
+
+        steps.append(
+            {
+                "grid": [r[:] for r in g],
+                "frontier": set(batch_front),
+                "filled": set(filled),
+                "desc": f"Propagation — {len(filled)} cellule(s) remplies",
+            }
+        )
+
+    steps.append(
+        {
+            "grid": [r[:] for r in g],
+            "frontier": set(),
+            "filled": set(filled),
+            "desc": f"✅ Remplissage terminé — <b>{len(filled)}</b> cellule(s) modifiées",
+        }
+    )
+    return steps
+
+
+def count_islands_steps(grid):
+    n = len(grid)
+    g = [row[:] for row in grid]
+    visited = [[False] * n for _ in range(n)]
+    island_id = [[0] * n for _ in range(n)]
+    steps, count = [], 0
+    steps.append(
+        {
+            "visited": [r[:] for r in visited],
+            "island_id": [r[:] for r in island_id],
+            "count": 0,
+            "desc": "Comptage des îles — chaque couleur distincte = une île",
+        }
+    )
+    for i in range(n):
+        for j in range(n):
+            if not visited[i][j]:
+                count += 1
+                q = deque([(i, j)])
+                c = g[i][j]
+                while q:
+                    x, y = q.popleft()
+                    if visited[x][y]:
+                        continue
+                    visited[x][y] = True
+                    island_id[x][y] = count
+                    for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+                        nx, ny = x + dx, y + dy
+                        if (
+                            0 <= nx < n
+                            and 0 <= ny < n
+                            and not visited[nx][ny]
+                            and g[nx][ny] == c
+                        ):
+                            q.append((nx, ny))
+                steps.append(
+                    {
+                        "visited": [r[:] for r in visited],
+                        "island_id": [r[:] for r in island_id],
+                        "count": count,
+                        "desc": f"Île n°{count} découverte en ({i},{j}) — couleur <b>{c}</b>",
+                    }
+                )
+    steps.append(
+        {
+            "visited": [r[:] for r in visited],
+            "island_id": [r[:] for r in island_id],
+            "count": count,
+            "desc": f"✅ <b>{count}</b> île(s) distincte(s) trouvées",
+        }
+    )
+    return steps
@@ -0,0 +1,356 @@
+"""Import de grands graphes depuis des fichiers d'arêtes (liste, CSV, DIMACS).
+
+Formats, reconnus à l'extension (``.gz`` admis) :
+
+- ``edgelist`` : ``u v [poids]`` séparés par des blancs, commentaires ``#``
+  ou ``%`` (listes SNAP, KONECT…) ;
+- ``csv`` : ``u,v[,poids]`` (``,``, ``;`` ou tabulation), en-tête détecté ;
+- ``dimacs`` : ``.gr`` du challenge DIMACS, ``p sp n m`` puis ``a u v poids``
+  (ids 1 … n, arcs orientés).
+
+Le fichier est lu par morceaux de ``chunk_bytes`` : seul le morceau courant
+existe sous forme de texte. Un morceau d'ids entiers est converti d'un bloc
+par ``np.fromstring`` ; des étiquettes textuelles passent par un dict. Les
+ids sont ensuite renumérotés 0 … n-1, les boucles écartées et les doublons
+fusionnés (poids minimal, première occurrence), puis le ``CSRGraph`` est
+construit. Une copie binaire ``<fichier>.csr.npz`` est écrite à côté du
+fichier, avec sa taille, sa date et les options : le chargement suivant la
+relit directement.
+
+    graph, info = load_graph("roadNet-CA.txt")
+    info["duplicates"], info["cache"]      # 0, "written" (puis "hit")
+"""
+import csv
+import gzip
+import json
+import os
+import time
+
+import numpy as np
+
+from algolab.core.csr import CSRGraph
+
+FORMATS = ("edgelist", "csv", "dimacs")
+CACHE_SUFFIX = ".csr.npz"
+VERSION = 1
+CHUNK_BYTES = 16 * 1024 * 1024
+
+_EXTENSIONS = {".gr": "dimacs", ".csv": "csv"}
+_HEADER_NAMES = {"source", "target", "src", "dst", "from", "to", "u", "v", "weight",
+                 "poids", "node1", "node2", "id1", "id2", "origine", "destination"}
+
+
+def detect_format(path):
+    """Format déduit de l'extension (``edgelist`` par défaut)."""
+    base = path[:-3] if path.endswith(".gz") else path
+    return _EXTENSIONS.get(os.path.splitext(base)[1].lower(), "edgelist")
+
+
+def _open(path):
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return open(path, encoding="utf-8", newline="")
+
+
+# ── Lecture par morceaux ──────────────────────────────────────────────────────
+
+class _Reader:
+    """Accumule les arêtes morceau par morceau.
+
+    Mode numérique (ids entiers) : un bloc ``np.fromstring`` par morceau,
+    ligne à ligne si les colonnes varient. Mode texte : les étiquettes sont
+    numérotées à la volée dans ``index``. La première étiquette non entière,
+    quel que soit son morceau, fait passer en mode texte (``_to_text``).
+    """
+
+    def __init__(self, fmt, delimiter):
+        self.fmt, self.delimiter = fmt, delimiter
+        self.src, self.dst, self.w = [], [], []
+        self.index = None          # dict étiquette → id (mode texte)
+        self.ncol = None
+        self.n = None              # DIMACS : ligne « p sp n m »
+        self.lines = 0
+
+    def feed(self, lines):
+        lines = self._data(lines)
+        if not lines:
+            return
+        self.lines += len(lines)
+        if self.ncol is None:
+            self.ncol = len(self._split(lines[0]))
+            if self.ncol < 2:
+                raise ValueError(f"au moins deux colonnes attendues : {lines[0].strip()!r}")
+        block = None
+        if self.index is None:
+            block = self._numeric(lines)
+            if block is None:
+                try:
+                    block = self._rows(lines)
+                except ValueError:
+                    self._to_text()
+        self._push(*(block or self._rows(lines)))
+
+    def _to_text(self):
+        """Ids entiers déjà lus → étiquettes ``str(id)``, numérotées dans l'ordre
+        d'apparition, comme si tout le fichier avait été lu en mode texte."""
+        self.index = {}
+        if not self.src:
+            return
+        ends = np.stack((np.concatenate(self.src), np.concatenate(self.dst)), 1).ravel()
+        ids, first, inv = np.unique(ends, return_index=True, return_inverse=True)
+        order = np.argsort(first)
+        rank = np.empty(len(ids), dtype=np.int64)
+        rank[order] = np.arange(len(ids))
+        ends = rank[inv]
+        self.index = {str(i): k for k, i in enumerate(ids[order].tolist())}
+        self.src, self.dst = [ends[0::2]], [ends[1::2]]
+
+    def _data(self, lines):
+        if self.fmt == "dimacs":
+            for line in lines:
+                if line[:1] == "p" and self.n is None:
+                    self.n = int(line.split()[2])
+            return [line[1:] for line in lines if line[:1] == "a"]
+        text = "".join(lines)
+        data = lines
+        if "#" in text or "%" in text or "\n\n" in text or "\n\r\n" in text or text[:1] in "\r\n":
+            data = [line for line in lines if line[:1] not in "#%\r\n" and line.strip()]
+        if self.ncol is None and self.fmt == "csv" and data and _is_header(
+                self._split(data[0]), self._split(data[1]) if len(data) > 1 else None):
+            data = data[1:]
+        return data
+
+    def _split(self, line):
+        if self.fmt == "csv":
+            return [f.strip() for f in next(csv.reader([line], delimiter=self.delimiter))]
+        return line.split()
+
+    def _numeric(self, lines):
+        """Morceau d'ids entiers converti d'un bloc, ou None."""
+        text = "".join(lines)
+        if self.fmt == "csv":
+            text = text.replace(self.delimiter, " ")
+        try:
+            flat = np.fromstring(text, sep=" ")
+        except ValueError:
+            return None
+        if flat.size != self.ncol * len(lines):
+            return None
+        rows = flat.reshape(len(lines), self.ncol)
+        ids = rows[:, :2]
+        if not np.array_equal(ids, np.floor(ids)) or np.abs(ids).max() >= 2 ** 53:
+            return None
+        w = rows[:, 2] if self.ncol > 2 else None
+        return ids[:, 0].astype(np.int64), ids[:, 1].astype(np.int64), w
+
+    def _rows(self, lines):
+        """Ligne par ligne : colonnes de longueur variable ou étiquettes textuelles."""
+        index, src, dst, w = self.index, [], [], []
+        for line in lines:
+            f = self._split(line)
+            if not f:
+                continue
+            if len(f) < 2:
+                raise ValueError(f"ligne invalide : {line.strip()!r}")
+            if index is None:
+                src.append(int(f[0]))
+                dst.append(int(f[1]))
+            else:
+                src.append(index.setdefault(f[0], len(index)))
+                dst.append(index.setdefault(f[1], len(index)))
+            w.append(float(f[2]) if len(f) > 2 and f[2] else 1.0)
+        return np.array(src, np.int64), np.array(dst, np.int64), np.array(w)
+
+    def _push(self, src, dst, w):
+        self.src.append(src)
+        self.dst.append(dst)
+        self.w.append(w if w is not None else np.ones(len(src)))
+
+    def arrays(self):
+        cat = (lambda parts, dtype: np.concatenate(parts) if parts else np.zeros(0, dtype))
+        return cat(self.src, np.int64), cat(self.dst, np.int64), cat(self.w, float)
+
+
+def _is_header(fields, following):
+    """En-tête CSV : noms usuels, ou champ non numérique au-dessus d'un nombre."""
+    if {f.lower() for f in fields} & _HEADER_NAMES:
+        return True
+    if following is None:
+        return False
+    return any(not _is_number(a) and _is_number(b) for a, b in zip(fields, following))
+
+
+def _is_number(text):
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
+
+
+def _sniff_delimiter(path):
+    with _open(path) as f:
+        sample = f.read(64 * 1024)
+    lines = [line for line in sample.splitlines() if line and line[0] not in "#%"][:20]
+    counts = {d: min((line.count(d) for line in lines), default=0) for d in ",;\t"}
+    best = max(counts, key=counts.get)
+    return best if counts[best] else ","
+
+
+# ── Renumérotation et doublons ────────────────────────────────────────────────
+
+def _compact(src, dst):
+    """Ids quelconques → 0 … n-1 ; renvoie ``(src, dst, étiquettes triées)``.
+
+    Ids denses et positifs : masque de présence, en O(m + max) ; sinon
+    ``np.unique``.
+    """
+    if not len(src):
+        return src, dst, np.zeros(0, np.int64)
+    lo, hi = min(src.min(), dst.min()), max(src.max(), dst.max())
+    if lo >= 0 and hi < 8 * (len(src) + len(dst)):
+        present = np.zeros(hi + 1, dtype=bool)
+        present[src] = present[dst] = True
+        labels = np.flatnonzero(present)
+        remap = np.cumsum(present) - 1
+        return remap[src], remap[dst], labels
+    labels, inv = np.unique(np.concatenate((src, dst)), return_inverse=True)
+    return inv[:len(src)], inv[len(src):], labels
+
+
+def dedupe_edges(n, src, dst, w, directed=False):
+    """Indices des arêtes gardées, dans l'ordre du fichier, et nombre de boucles.
+
+    Sans orientation, ``u v`` et ``v u`` sont la même arête. Pour chaque
+    paire, l'occurrence de poids minimal (la première à égalité) est gardée.
+    """
+    keep = np.flatnonzero(src != dst)
+    a, b = src[keep], dst[keep]
+    if not directed:
+        a, b = np.minimum(a, b), np.maximum(a, b)
+    key = a * n + b
+    order = np.argsort(key)
+    first = _starts(key[order])
+    size = np.diff(np.append(np.flatnonzero(first), len(order)))
+    single = np.repeat(size == 1, size)
+    dup = order[~single]  # paires répétées seulement : tri (clé, poids, rang)
+    dup = dup[np.lexsort((dup, w[keep][dup], key[dup]))]
+    chosen = np.concatenate((order[single], dup[_starts(key[dup])]))
+    return np.sort(keep[chosen]), len(src) - len(keep)
+
+
+def _starts(sorted_keys):
+    first = np.ones(len(sorted_keys), dtype=bool)
+    first[1:] = sorted_keys[1:] != sorted_keys[:-1]
+    return first
+
+
+def _weights(w):
+    """Poids entiers quand ils le sont tous (affichage, sommes exactes)."""
+    if not len(w) or (np.array_equal(w, np.floor(w)) and np.abs(w).max() < 2 ** 53):
+        return w.astype(np.int64)
+    return w
+
+
+# ── Copie binaire ─────────────────────────────────────────────────────────────
+
+def _signature(path, fmt, directed, delimiter):
+    st = os.stat(path)
+    return {"version": VERSION, "size": st.st_size, "mtime_ns": st.st_mtime_ns,
+            "format": fmt, "directed": directed, "delimiter": delimiter}
+
+
+def _save(cache_path, graph, meta):
+    arrays = {"offsets": graph.offsets, "targets": graph.targets,
+              "weights": graph.weights, "arc_ids": graph.arc_ids}
+    if isinstance(graph.labels, np.ndarray):
+        arrays["labels"] = graph.labels
+    elif graph.labels is not None:  # étiquettes sans saut de ligne : une seule chaîne
+        arrays["labels_text"] = np.frombuffer("\n".join(graph.labels).encode(), dtype=np.uint8)
+    arrays["__meta__"] = np.frombuffer(json.dumps(meta).encode(), dtype=np.uint8)
+    tmp = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp, cache_path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _load_cached(cache_path, signature):
+    """``(graphe, meta)`` si la copie correspond au fichier et aux options, sinon None."""
+    try:
+        with np.load(cache_path) as z:
+            meta = json.loads(z["__meta__"].tobytes())
+            if {k: meta.get(k) for k in signature} != signature:
+                return None
+            if "labels" in z:
+                labels = z["labels"]
+            elif "labels_text" in z:
+                labels = z["labels_text"].tobytes().decode().split("\n")
+            else:
+                labels = None
+            graph = CSRGraph(z["offsets"], z["targets"], z["weights"], labels,
+                             meta["directed"], z["arc_ids"])
+    except (OSError, ValueError, KeyError):
+        return None
+    return graph, meta
+
+
+# ── Chargement ────────────────────────────────────────────────────────────────
+
+def load_graph(path, fmt=None, directed=None, delimiter=None, cache=True, chunk_bytes=CHUNK_BYTES):
+    """Lit un fichier d'arêtes ; renvoie ``(CSRGraph, infos)``.
+
+    ``fmt`` : ``"edgelist"``, ``"csv"`` ou ``"dimacs"`` (défaut : extension).
+    ``directed`` : défaut orienté pour DIMACS seulement. ``cache`` : True
+    (copie ``<fichier>.csr.npz``), un chemin, ou False. Infos : ``format``,
+    ``edges_read``, ``duplicates``, ``loops``, ``ms`` et ``cache`` (``"hit"``,
+    ``"written"`` ou None si la copie n'a pas pu être écrite).
+    """
+    fmt = fmt or detect_format(path)
+    if fmt not in FORMATS:
+        raise ValueError(f"format inconnu : {fmt!r}")
+    if directed is None:
+        directed = fmt == "dimacs"
+    if fmt == "csv" and delimiter is None:
+        delimiter = _sniff_delimiter(path)
+    t0 = time.perf_counter()
+    cache_path = (path + CACHE_SUFFIX) if cache is True else (cache or None)
+    signature = _signature(path, fmt, directed, delimiter)
+    if cache_path:
+        hit = _load_cached(cache_path, signature)
+        if hit is not None:
+            graph, meta = hit
+            return graph, {**meta["info"], "ms": (time.perf_counter() - t0) * 1000, "cache": "hit"}
+
+    reader = _Reader(fmt, delimiter)
+    with _open(path) as f:
+        for lines in iter(lambda: f.readlines(chunk_bytes), []):
+            reader.feed(lines)
+    src, dst, w = reader.arrays()
+    if reader.index is not None:
+        n, labels = len(reader.index), list(reader.index)
+    elif fmt == "dimacs" and reader.n is not None:
+        if len(src) and (min(src.min(), dst.min()) < 1 or max(src.max(), dst.max()) > reader.n):
+            raise ValueError(f"ids DIMACS hors de 1 … {reader.n}")
+        n, labels, src, dst = reader.n, np.arange(1, reader.n + 1), src - 1, dst - 1
+    else:
+        src, dst, labels = _compact(src, dst)
+        n = len(labels)
+        if np.array_equal(labels, np.arange(n)):
+            labels = None
+    keep, loops = dedupe_edges(n, src, dst, w, directed)
+    graph = CSRGraph.from_arrays(n, src[keep], dst[keep], _weights(w[keep]), labels, directed)
+    info = {"format": fmt, "lines": reader.lines, "edges_read": len(src),
+            "duplicates": len(src) - loops - len(keep), "loops": loops}
+    status = None
+    if cache_path:
+        try:
+            _save(cache_path, graph, {**signature, "info": info})
+            status = "written"
+        except OSError:
+            pass
+    return graph, {**info, "ms": (time.perf_counter() - t0) * 1000, "cache": status}
+
@@ -0,0 +1,189 @@
+"""Parcours de graphes pondérés : Dijkstra, BFS, DFS, sur un ``CSRGraph``."""
+import collections
+import heapq
+
+import numpy as np
+
+
+def dijkstra_steps(graph, start):
+    """Dijkstra pas à pas sur un ``CSRGraph`` ; étapes indexées par étiquette."""
+    names, n = graph.names(), graph.n
+    dist, prev = [float('inf')] * n, [None] * n
+    s = graph.id(start)
+    dist[s] = 0
+    pq, visited, steps = [(0, start, s)], set(), []  # égalités départagées par étiquette
+    def snapshot(current, desc):
+        return {"visited": {names[i] for i in visited}, "current": names[current],
+                "dist": dict(zip(names, dist)),
+                "prev": {names[i]: None if p is None else names[p] for i, p in enumerate(prev)},
+                "desc": desc}
+    while pq:
+        d, _, u = heapq.heappop(pq)
+        if u in visited: continue
+        visited.add(u)
+        steps.append(snapshot(u, f"Visite <b>{names[u]}</b> (distance={d})"))
+        for v, w in zip(*graph.neighbors(u)):
+            if v not in visited and dist[u]+w < dist[v]:
+                dist[v] = dist[u]+w; prev[v] = u
+                heapq.heappush(pq, (dist[v], names[v], v))
+                steps.append(snapshot(v, f"Mise à jour : dist[<b>{names[v]}</b>] = {dist[v]} (via {names[u]})"))
+    return (steps, dict(zip(names, dist)),
+            {names[i]: None if p is None else names[p] for i, p in enumerate(prev)})
+
+
+def _by_label(graph, ids):
+    return sorted(ids, key=graph.label)
+
+
+def bfs_steps(graph, start):
+    names = graph.names()
+    s = graph.id(start)
+    visited, queue, steps = {s}, collections.deque([s]), []
+    while queue:
+        u = queue.popleft()
+        steps.append({"visited": {names[i] for i in visited}, "current": names[u],
+                      "desc": f"Défilement : <b>{names[u]}</b> | File : {[names[i] for i in queue] or ['vide']}"})
+        for v in _by_label(graph, graph.neighbors(u)[0]):
+            if v not in visited:
+                visited.add(v); queue.append(v)
+    return steps
+
+
+def dfs_steps(graph, start):
+    names = graph.names()
+    visited, steps, order = set(), [], []
+    def dfs(u):
+        visited.add(u); order.append(names[u])
+        steps.append({"visited": {names[i] for i in visited}, "current": names[u],
+                      "desc": f"Exploration récursive de <b>{names[u]}</b> (ordre : {list(order)})"})
+        for v in _by_label(graph, graph.neighbors(u)[0]):
+            if v not in visited: dfs(v)
+    dfs(graph.id(start))
+    return steps
+
+
+# ── Grands graphes : sans trace d'étapes ──────────────────────────────────────
+
+def shortest_paths(graph, source):
+    """Distances et prédécesseurs depuis ``source`` (id) : tableaux NumPy.
+
+    Dijkstra sur les listes CSR, sans dict par nœud ; ``prev`` vaut -1 pour
+    la source et les nœuds inaccessibles (distance ``inf``).
+    """
+    off, tgt, wts = graph.lists()
+    dist = [float('inf')] * graph.n
+    prev = [-1] * graph.n
+    done = bytearray(graph.n)
+    dist[source] = 0
+    pq = [(0, source)]
+    while pq:
+        d, u = heapq.heappop(pq)
+        if done[u]:
+            continue
+        done[u] = 1
+        for a in range(off[u], off[u + 1]):
+            v, nd = tgt[a], d + wts[a]
+            if nd < dist[v]:
+                dist[v], prev[v] = nd, u
+                heapq.heappush(pq, (nd, v))
+    return np.array(dist, dtype=float), np.array(prev, dtype=np.int64)
+
+
+def bfs_levels(graph, source):
+    """Niveau BFS de chaque nœud (-1 si inaccessible), un niveau par opération NumPy.
+
+    La frontière entière est développée d'un coup : les arcs de ses nœuds
+    sont rassemblés par ``offsets``, les cibles déjà vues écartées.
+    """
+    level = np.full(graph.n, -1, dtype=np.int64)
+    level[source] = 0
+    degree = np.diff(graph.offsets)
+    frontier, depth = np.array([source]), 0
+    while len(frontier):
+        starts, counts = graph.offsets[frontier], degree[frontier]
+        arcs = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        nxt = np.unique(graph.targets[arcs])
+        nxt = nxt[level[nxt] < 0]
+        depth += 1
+        level[nxt] = depth
+        frontier = nxt
+    return level
+
+
+def get_path_edges(prev, start, end):
+    """Reconstruit les arêtes du chemin optimal de start à end depuis le dict prev final."""
+    path_edges, node = set(), end
+    while node in prev and prev[node] is not None:
+        parent = prev[node]
+        path_edges.add((parent, node))
+        node = parent
+        if node == start:
+            break
+    return path_edges
+
+
+def route_steps(graph, start, end):
+    """Dijkstra entre deux villes d'un réseau routier (``CSRGraph``)."""
+    names, n = graph.names(), graph.n
+    dist = [float("inf")] * n
+    prev = [None] * n
+    s, t = graph.id(start), graph.id(end)
+    dist[s] = 0
+    heap = [(0, start, s)]  # égalités départagées par étiquette
+    visited = set()
+    steps = []
+
+    def snapshot(current, frontier, desc, **extra):
+        return {
+            "dist": dict(zip(names, dist)),
+            "visited": {names[i] for i in visited},
+            "current": None if current is None else names[current],
+            "frontier": {names[i] for i in frontier},
+            "prev": {names[i]: None if p is None else names[p] for i, p in enumerate(prev)},
+            **extra,
+            "desc": desc,
+        }
+
+    steps.append(snapshot(None, {s}, f"Initialisation — distance de <b>{start}</b> = 0, toutes les autres = ∞"))
+
+    while heap:
+        d, _, u = heapq.heappop(heap)
+        if u in visited:
+            continue
+        visited.add(u)
+        nbrs, wts = graph.neighbors(u)
+        steps.append(snapshot(u, {v for v in nbrs if v not in visited},
+                              f"Visite <b>{names[u]}</b> (distance = {d} km) — exploration des voisins"))
+        if u == t:
+            break
+        for v, w in zip(nbrs, wts):
+            if v not in visited and dist[u] + w < dist[v]:
+                dist[v] = dist[u] + w
+                prev[v] = u
+                heapq.heappush(heap, (dist[v], names[v], v))
+                steps.append(snapshot(u, (), f"Mise à jour : <b>{names[u]}</b>→<b>{names[v]}</b> = "
+                                             f"{dist[u]}+{w} = <b>{dist[v]} km</b>"))
+
+    # Reconstruit le chemin
+    path, cur = [], t
+    while cur is not None:
+        path.append(names[cur])
+        cur = prev[cur]
+    path.reverse()
+
+    steps.append(snapshot(t, (), f"✅ Chemin optimal <b>{start} → {end}</b> = <b>{dist[t]} km</b>", path=path))
+    return steps, dist[t], path
+
+
+def reconstruct_path_from_prev(prev, end):
+    """Reconstruit le chemin connu jusqu'ici depuis prev (partiel ou final)."""
+    if not prev or prev.get(end) is None:
+        return []
+    path, cur = [], end
+    visited_back = set()
+    while cur and cur not in visited_back:
+        visited_back.add(cur)
+        path.append(cur)
+        cur = prev.get(cur)
+    path.reverse()
+    return path
@@ -0,0 +1,90 @@
+"""Tours de Hanoï : séquence de déplacements et état des piquets.
+
+Les coups de la solution optimale se calculent un à un à partir de
+l'écriture binaire de leur rang (``hanoi_move``) : ``iter_hanoi_moves``
+les produit en mémoire constante, sur n'importe quel intervalle de rangs.
+"""
+import time
+
+PEGS = 'ABC'
+
+
+def hanoi_move(n, k):
+    """Coup ``k`` (1 ≤ k < 2ⁿ) : ``(départ, arrivée, disque)``, en O(1).
+
+    Le disque est l'indice du bit de poids faible de k ; départ et arrivée
+    sont ``(k & (k-1)) % 3`` et ``((k | (k-1)) + 1) % 3``, piquets B et C
+    échangés quand n est pair.
+    """
+    pegs = PEGS if n % 2 else 'ACB'
+    return pegs[(k & (k - 1)) % 3], pegs[((k | (k - 1)) + 1) % 3], (k & -k).bit_length()
+
+
+def iter_hanoi_moves(n, start=1, stop=None):
+    """Coups ``start … stop-1`` (défaut : tous, 2ⁿ - 1), sans liste."""
+    pegs = PEGS if n % 2 else 'ACB'
+    for k in range(start, (1 << n) if stop is None else stop):
+        yield pegs[(k & (k - 1)) % 3], pegs[((k | (k - 1)) + 1) % 3], (k & -k).bit_length()
+
+
+def hanoi_moves(n):
+    return list(iter_hanoi_moves(n))
+
+
+def stream_counts(n, start=1, stop=None):
+    """Parcourt les coups ``start … stop-1`` sans les garder.
+
+    Renvoie ``{"moves", "per_disk", "ms"}`` : nombre de coups, coups par
+    disque (indice d-1) et durée du parcours. Les intervalles disjoints se
+    comptent indépendamment, par exemple dans plusieurs processus.
+    """
+    per_disk = [0] * n
+    t0 = time.perf_counter()
+    for _, _, d in iter_hanoi_moves(n, start, stop):
+        per_disk[d - 1] += 1
+    ms = (time.perf_counter() - t0) * 1000
+    return {"moves": sum(per_disk), "per_disk": per_disk, "ms": ms}
+
+
+def disk_moves(n, k):
+    """Coups de chaque disque parmi les k premiers (indice d-1) ; 2ⁿ⁻ᵈ au total."""
+    return [(k + (1 << (d - 1))) >> d for d in range(1, n + 1)]
+
+
+def build_state(n_disks, moves_done):
+    towers = {'A': list(range(n_disks, 0, -1)), 'B': [], 'C': []}
+    for src, tgt, _ in moves_done:
+        towers[tgt].append(towers[src].pop())
+    return towers
+
+
+def hanoi_states(n_disks, moves, ks):
+    """États après les coups ``ks`` (croissants), un coup appliqué à la fois.
+
+    Parcourt ``moves`` une seule fois : O(1) par coup au lieu de rejouer le
+    préfixe à chaque état. Les tours renvoyées sont un même dict modifié sur
+    place : à lire avant l'état suivant.
+    """
+    towers = build_state(n_disks, ())
+    done = 0
+    for k in ks:
+        for i in range(done, k):
+            src, tgt, _ = moves[i]
+            towers[tgt].append(towers[src].pop())
+        done = k
+        yield k, towers
+
+
+def hanoi_state(n_disks, k):
+    """Tours après le coup ``k`` de la solution optimale A → C, en O(n).
+
+    Le disque d (1 = le plus petit) a bougé ``(k + 2^(d-1)) >> d`` fois, toujours
+    dans le même sens de rotation : A → C → B si n - d est pair, A → B → C
+    sinon (le plus grand disque va ainsi directement de A à C).
+    """
+    towers = {'A': [], 'B': [], 'C': []}
+    for d in range(n_disks, 0, -1):
+        moved = (k + (1 << (d - 1))) >> d
+        step = 2 if (n_disks - d) % 2 == 0 else 1
+        towers[PEGS[moved * step % 3]].append(d)
+    return towers
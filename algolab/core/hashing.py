@@ -0,0 +1,70 @@
+"""Tables de hachage : chaînage et sondage linéaire."""
+from .trace import DeltaTrace
+
+
+def hash_fn(key, size, method="modulo"):
+    if isinstance(key, int):
+        h = key
+    else:
+        h = sum(ord(c) * (31 ** i) for i, c in enumerate(str(key))) % (10**9)
+    if method == "modulo":   return h % size
+    if method == "carré":    return (h * h // 100) % size
+    if method == "djb2":
+        v = 5381
+        for c in str(key): v = ((v << 5) + v) + ord(c)
+        return abs(v) % size
+    return h % size
+
+
+def chaining_steps(keys, size, hash_method):
+    table  = [() for _ in range(size)]
+    steps  = DeltaTrace({"table": table})
+    steps.record(current_key=None, current_idx=None, collisions=0,
+                 desc=f"Table de {size} buckets vide — méthode : {hash_method}")
+    collisions = 0
+    for key in keys:
+        idx = hash_fn(key, size, hash_method)
+        if table[idx]:
+            collisions += 1
+            desc = f"🔴 Collision : <b>{key}</b> → bucket[{idx}] déjà occupé → chaîné"
+        else:
+            desc = f"✅ <b>{key}</b> → hash={idx} → bucket[{idx}] libre"
+        table[idx] += (key,)
+        steps.record([("table", idx, table[idx])], current_key=key,
+                     current_idx=idx, collisions=collisions, desc=desc)
+    steps.record(current_key=None, current_idx=None, collisions=collisions,
+                 desc=f"✅ {len(keys)} clés insérées, {collisions} collision(s), facteur de charge = {len(keys)/size:.2f}")
+    return steps
+
+
+def linear_probing_steps(keys, size, hash_method):
+    table  = [None] * size
+    steps  = DeltaTrace({"table": table})
+    steps.record(current_key=None, current_idx=None, probes=[], collisions=0,
+                 desc=f"Table de {size} slots vide — sondage linéaire")
+    collisions = 0
+    for key in keys:
+        idx   = hash_fn(key, size, hash_method)
+        orig  = idx
+        probes = [idx]
+        probe_count = 0
+        while table[idx] is not None and probe_count < size:
+            idx = (idx + 1) % size
+            probes.append(idx)
+            probe_count += 1
+        if probe_count > 0:
+            collisions += 1
+            desc = f"🔴 Collision : <b>{key}</b> → hash={orig} occupé → sondage → slot[{idx}] libre ({probe_count} sonde(s))"
+        else:
+            desc = f"✅ <b>{key}</b> → hash={idx} → slot libre"
+        if probe_count < size:
+            table[idx] = key
+            steps.record([("table", idx, key)], current_key=key, current_idx=idx,
+                         probes=probes, collisions=collisions, desc=desc)
+        else:
+            steps.record(current_key=key, current_idx=None,
+                         probes=probes, collisions=collisions,
+                         desc=f"⚠️ Table pleine ! <b>{key}</b> ne peut pas être inséré")
+    steps.record(current_key=None, current_idx=None, probes=[], collisions=collisions,
+                 desc=f"✅ {sum(1 for t in table if t)} clés insérées sur {size} slots, {collisions} collision(s)")
+    return steps
@@ -0,0 +1,66 @@
+"""Codage de Huffman."""
+import heapq
+
+
+class HNode:
+    def __init__(self, char, freq, left=None, right=None):
+        self.char  = char
+        self.freq  = freq
+        self.left  = left
+        self.right = right
+    def __lt__(self, other): return self.freq < other.freq
+
+
+def build_huffman(text):
+    freq = {}
+    for c in text: freq[c] = freq.get(c, 0) + 1
+
+    heap = [HNode(c, f) for c, f in sorted(freq.items())]
+    heapq.heapify(heap)
+
+    # Snapshots à chaque fusion
+    snapshots = []
+    snapshots.append({
+        "heap": [(n.char, n.freq) for n in sorted(heap, key=lambda x: x.freq)],
+        "desc": f"File initiale : {len(heap)} symboles — on fusionne toujours les 2 moins fréquents",
+        "step": "init"
+    })
+
+    while len(heap) > 1:
+        left  = heapq.heappop(heap)
+        right = heapq.heappop(heap)
+        merged = HNode(f"{left.char}+{right.char}", left.freq + right.freq, left, right)
+        heapq.heappush(heap, merged)
+        snapshots.append({
+            "heap": [(n.char, n.freq) for n in sorted(heap, key=lambda x: x.freq)],
+            "desc": f"Fusion : <b>{left.char}</b>({left.freq}) + <b>{right.char}</b>({right.freq}) → nœud interne ({merged.freq})",
+            "merged_left": left.char,
+            "merged_right": right.char,
+            "merged_freq": merged.freq,
+            "step": "merge"
+        })
+
+    root = heap[0]
+
+    # Générer les codes
+    codes = {}
+    def build_codes(node, prefix=""):
+        if node is None: return
+        if node.left is None and node.right is None:
+            codes[node.char] = prefix or "0"
+            return
+        build_codes(node.left,  prefix + "0")
+        build_codes(node.right, prefix + "1")
+    build_codes(root)
+
+    snapshots.append({
+        "heap": [],
+        "desc": "✅ Arbre complet — codes assignés. Les symboles fréquents ont les codes les plus courts.",
+        "step": "done", "codes": codes
+    })
+
+    orig_bits = len(text) * 8
+    comp_bits = sum(len(codes[c]) * freq[c] for c in freq)
+    ratio     = (1 - comp_bits / orig_bits) * 100 if orig_bits > 0 else 0
+
+    return snapshots, freq, codes, root, orig_bits, comp_bits, ratio
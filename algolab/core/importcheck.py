@@ -0,0 +1,78 @@
+"""Contrôle du temps d'import des moteurs.
+
+Chaque module est importé dans un interpréteur neuf ; on mesure sa durée
+d'import et on vérifie qu'il ne charge ni Streamlit ni Plotly.
+
+    python -m algolab.core.importcheck [--budget-ms 150] [--package-budget-ms 20]
+
+Code de sortie 1 si un module dépasse son budget ou charge l'interface.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+from . import SUBMODULES
+
+IMPORT_BUDGET_MS = 150  # par module, NumPy compris
+PACKAGE_BUDGET_MS = 20  # ``import algolab.core`` seul
+FORBIDDEN = ("streamlit", "plotly")
+
+_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import {module}
+ms = (time.perf_counter() - t0) * 1000
+print(json.dumps({{"ms": ms, "loaded": sorted(m.split(".")[0] for m in sys.modules)}}))
+"""
+
+
+def measure(module, repeat=3):
+    """Meilleur temps d'import (ms) de ``module`` et paquets racines chargés."""
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    best, loaded = float("inf"), set()
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(module=module)],
+            cwd=root, capture_output=True, text=True, check=True,
+        ).stdout
+        res = json.loads(out)
+        best, loaded = min(best, res["ms"]), set(res["loaded"])
+    return best, loaded
+
+
+def check(budget_ms=IMPORT_BUDGET_MS, package_budget_ms=PACKAGE_BUDGET_MS):
+    """Liste de ``(module, ms, budget, problème)`` ; problème vaut None si tout va bien."""
+    rows = []
+    targets = [("algolab.core", package_budget_ms)]
+    targets += [(f"algolab.core.{m}", budget_ms) for m in SUBMODULES]
+    for module, budget in targets:
+        ms, loaded = measure(module)
+        bad = [f for f in FORBIDDEN if f in loaded]
+        if module == "algolab.core" and "numpy" in loaded:
+            bad.append("numpy")
+        problem = None
+        if bad:
+            problem = "charge " + ", ".join(bad)
+        elif ms > budget:
+            problem = "budget dépassé"
+        rows.append((module, ms, budget, problem))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m algolab.core.importcheck")
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument("--package-budget-ms", type=float, default=PACKAGE_BUDGET_MS)
+    args = parser.parse_args(argv)
+
+    rows = check(args.budget_ms, args.package_budget_ms)
+    for module, ms, budget, problem in rows:
+        status = "ok" if problem is None else f"ÉCHEC ({problem})"
+        print(f"{module:<32} {ms:8.1f} ms / {budget:.0f} ms  {status}")
+    return 1 if any(problem for *_, problem in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
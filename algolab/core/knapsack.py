@@ -0,0 +1,319 @@
+"""Sac à dos : 0/1, borné et illimité.
+
+- ``knapsack_dp`` / ``KnapsackTrace`` : table DP 0/1 pas à pas, pour la page ;
+- ``knapsack_value`` / ``knapsack_solve`` : moteur vectorisé NumPy pour les
+  trois variantes (objets bornés découpés en lots 1, 2, 4, …) ;
+- ``knapsack_branch_bound`` / ``knapsack_meet_in_middle`` : 0/1 exact quand
+  la capacité est trop grande pour une table.
+"""
+import numpy as np
+
+TOO_HEAVY, SKIP, TAKE = 0, 1, 2
+
+
+class KnapsackTrace:
+    """Remplissage de la table DP, une étape par cellule, ligne par ligne.
+
+    L'étape k écrit la cellule ``(k // (C+1) + 1, k % (C+1))`` : seuls la table
+    finale et la décision de chaque cellule (``TOO_HEAVY``, ``SKIP``, ``TAKE``,
+    int8) sont gardés, soit O(n·C) en tout. La table à l'étape k est la table
+    finale masquée au-delà de la cellule k ; le texte est formaté à la lecture.
+
+    ``trace[k]`` renvoie ``i``, ``w``, ``value`` (valeur écrite), ``take`` et
+    ``action``.
+    """
+
+    def __init__(self, dp, decision, weights, values):
+        self.dp, self.decision = dp, decision
+        self.weights, self.values = list(weights), list(values)
+        self.width = dp.shape[1]
+
+    @property
+    def nbytes(self):
+        return self.dp.nbytes + self.decision.nbytes
+
+    def __len__(self):
+        return self.decision.size
+
+    def _index(self, k):
+        if k < 0:
+            k += len(self)
+        if not 0 <= k < len(self):
+            raise IndexError(f"étape {k} hors de la trace ({len(self)} étapes)")
+        return k
+
+    def cell(self, k):
+        """Cellule ``(i, w)`` écrite à l'étape k."""
+        i, w = divmod(self._index(k), self.width)
+        return i + 1, w
+
+    def table(self, k):
+        """Lignes 0 … i de la table à l'étape k (float), cellules à venir en NaN."""
+        i, w = self.cell(k)
+        z = self.dp[:i + 1].astype(float)
+        z[i, w + 1:] = np.nan
+        return z
+
+    def changes(self):
+        """Poids de chaque étape pour l'échantillonnage des frames : 2 si l'objet est pris."""
+        return self.decision.ravel().astype(np.int64)
+
+    def describe(self, k):
+        i, w = self.cell(k)
+        wt, v = self.weights[i - 1], self.values[i - 1]
+        code = self.decision[i - 1, w]
+        if code == TOO_HEAVY:
+            return f"Objet {i} trop lourd ({wt}kg > {w}kg dispo) → IGNORÉ"
+        take, notake = v + int(self.dp[i - 1, w - wt]), int(self.dp[i - 1, w])
+        if code == TAKE:
+            return f"Objet {i} ({v}€, {wt}kg) → PRIS (gain {take} > {notake})"
+        return f"Objet {i} ({v}€, {wt}kg) → IGNORÉ ({notake} ≥ {take})"
+
+    def __getitem__(self, k):
+        i, w = self.cell(k)
+        return {"i": i, "w": w, "value": int(self.dp[i, w]),
+                "take": bool(self.decision[i - 1, w] == TAKE), "action": self.describe(k)}
+
+    def __iter__(self):
+        return (self[k] for k in range(len(self)))
+
+
+def knapsack_dp(weights, values, capacity):
+    n  = len(weights)
+    dp = np.zeros((n+1, capacity+1), dtype=np.int64)
+    decision = np.full((n, capacity+1), TOO_HEAVY, dtype=np.int8)
+
+    for i in range(1, n+1):
+        wt, v = weights[i-1], values[i-1]
+        prev, row, dec = dp[i-1].tolist(), dp[i], decision[i-1]
+        for w in range(capacity+1):
+            if wt <= w:
+                take, notake = v + prev[w - wt], prev[w]
+                row[w], dec[w] = (take, TAKE) if take > notake else (notake, SKIP)
+            else:
+                row[w] = prev[w]
+
+    chosen, ci, cw = [], n, capacity
+    while ci > 0 and cw > 0:
+        if dp[ci][cw] != dp[ci-1][cw]:
+            chosen.append(ci-1)
+            cw -= weights[ci-1]
+        ci -= 1
+
+    return dp, KnapsackTrace(dp, decision, weights, values), chosen
+
+
+# ── Moteur vectorisé : une opération NumPy par ligne ─────────────────────────
+
+KINDS = ("01", "bounded", "unbounded")
+
+
+def _rows(weights, values, kind, counts):
+    """Lignes ``(poids, valeur, objet, multiplicité)`` du calcul.
+
+    Un objet borné à c exemplaires devient des lots 1, 2, 4, …, reste (0/1
+    chacun) ; un objet illimité garde une ligne, de multiplicité None.
+    """
+    if kind not in KINDS:
+        raise ValueError(f"variante inconnue : {kind!r} (attendu : {', '.join(KINDS)})")
+    if kind == "bounded" and (counts is None or len(counts) != len(weights)):
+        raise ValueError("variante bornée : un nombre d'exemplaires par objet est requis")
+    rows = []
+    for item, (wt, v) in enumerate(zip(weights, values)):
+        if wt < 0 or v < 0:
+            raise ValueError(f"objet {item} : poids et valeur doivent être positifs")
+        if kind == "unbounded":
+            if wt == 0 and v > 0:
+                raise ValueError(f"objet {item} : poids nul et illimité, valeur infinie")
+            rows.append((wt, v, item, None))
+            continue
+        left, lot = counts[item] if kind == "bounded" else 1, 1
+        while left > 0:
+            m = min(lot, left)
+            rows.append((wt * m, v * m, item, m))
+            left, lot = left - m, lot * 2
+    return rows
+
+
+def _dtype(rows, kind, capacity):
+    """int32 si la valeur optimale y tient à coup sûr (moitié moins de mémoire à parcourir)."""
+    if kind == "unbounded":  # meilleur rapport valeur / poids sur toute la capacité
+        bound = max((-(-v * capacity // wt) for wt, v, _, _ in rows if wt), default=0)
+    else:
+        bound = sum(v for _, v, _, _ in rows)
+    return np.int32 if bound < 2**31 else np.int64
+
+
+def _fill(rows, capacity, dtype, packed=None):
+    """Optimum pour chaque capacité 0 … C, sur un seul tableau 1-D.
+
+    ``packed`` (lignes × ⌈(C+1)/8⌉ octets) reçoit, bit à bit, les cellules où
+    la ligne améliore l'optimum (objet pris).
+    """
+    dp, buf = np.zeros(capacity + 1, dtype=dtype), np.empty(capacity + 1, dtype=dtype)
+    took = np.zeros(capacity + 1, dtype=bool) if packed is not None else None
+    for r, (wt, v, _, mult) in enumerate(rows):
+        if wt > capacity or v == 0:
+            continue
+        if mult is None:  # illimité : max préfixe par classe de résidu modulo wt
+            m = -(-(capacity + 1) // wt)
+            j = (np.arange(m, dtype=dtype) * v)[:, None]
+            grid = np.full(m * wt, np.iinfo(dtype).min // 2, dtype=dtype)
+            grid[:capacity + 1] = dp
+            best = (np.maximum.accumulate(grid.reshape(m, wt) - j, axis=0) + j).ravel()[:capacity + 1]
+            if took is not None:
+                np.greater(best, dp, out=took)
+            dp = best
+        elif wt == 0:
+            dp += v
+            if took is not None:
+                took[:] = True
+        else:
+            cand = np.add(dp[:-wt], v, out=buf[wt:])  # copie : lit la ligne précédente
+            if took is not None:
+                took[:wt] = False
+                np.greater(cand, dp[wt:], out=took[wt:])
+            np.maximum(dp[wt:], cand, out=dp[wt:])
+        if packed is not None:
+            packed[r] = np.packbits(took)
+    return dp
+
+
+def knapsack_value(weights, values, capacity, kind="01", counts=None):
+    """Valeur optimale seule : tableau roulant 1-D, mémoire O(C).
+
+    ``kind`` : ``"01"``, ``"bounded"`` (``counts[i]`` exemplaires de l'objet
+    i) ou ``"unbounded"``. Poids et valeurs entiers positifs.
+
+    >>> knapsack_value([3, 2], [1_900_000_000, 1_000_000_000], 5, "unbounded")
+    2900000000
+    """
+    rows = _rows(weights, values, kind, counts)
+    return int(_fill(rows, capacity, _dtype(rows, kind, capacity))[capacity])
+
+
+def knapsack_solve(weights, values, capacity, kind="01", counts=None):
+    """Valeur optimale, exemplaires pris de chaque objet et taille du calcul.
+
+    En plus du tableau roulant, une matrice pris / ignoré compactée par
+    ``np.packbits`` (un bit par ligne et par capacité, soit lignes·(C+1)/8
+    octets) sert à remonter la solution depuis la capacité C. Le troisième
+    élément renvoyé : ``{"nodes": cellules calculées, "packed_bytes": …}``.
+    """
+    rows = _rows(weights, values, kind, counts)
+    packed = np.zeros((len(rows), (capacity + 8) // 8), dtype=np.uint8)
+    dp = _fill(rows, capacity, _dtype(rows, kind, capacity), packed)
+    taken, w = [0] * len(weights), capacity
+    for r in range(len(rows) - 1, -1, -1):
+        wt, _, item, mult = rows[r]
+        while packed[r, w >> 3] >> (7 - (w & 7)) & 1:
+            taken[item] += mult or 1
+            w -= wt
+            if mult is not None:
+                break
+    return int(dp[capacity]), taken, {"nodes": len(rows) * (capacity + 1), "packed_bytes": packed.nbytes}
+
+
+def make_knapsack(n, capacity, seed=None, max_count=5):
+    """Instance aléatoire : poids dans [1, C/10], valeurs corrélées aux poids
+    (± 10 %, les plus difficiles à élaguer), 1 à ``max_count`` exemplaires."""
+    rng = np.random.default_rng(seed)
+    weights = rng.integers(1, max(2, capacity // 10 + 1), n)
+    values = np.maximum(1, weights + rng.integers(-(weights // 10), weights // 10 + 1))
+    return weights.tolist(), values.tolist(), rng.integers(1, max_count + 1, n).tolist()
+
+
+# ── Grandes capacités : séparation-évaluation et rencontre au milieu (0/1) ───
+
+def knapsack_branch_bound(weights, values, capacity, max_nodes=2_000_000):
+    """Séparation-évaluation en meilleur d'abord, poids quelconques (réels, 10⁹…).
+
+    Objets triés par valeur/poids décroissante ; la borne d'un nœud est le
+    remplissage glouton fractionnaire des objets restants (préfixes cumulés +
+    bisection, O(log n)). Le tas sert d'abord le nœud de meilleure borne :
+    l'optimum est prouvé dès que cette borne ne dépasse plus la meilleure
+    solution. Au-delà de ``max_nodes`` nœuds, la meilleure solution trouvée
+    est renvoyée avec ``complete`` faux.
+
+    Renvoie ``(valeur, objets pris, {"nodes", "complete"})``.
+    """
+    import bisect
+    import heapq
+
+    order = sorted((i for i in range(len(weights)) if weights[i] <= capacity),
+                   key=lambda i: -values[i] / weights[i] if weights[i] else -float("inf"))
+    w = [weights[i] for i in order]
+    v = [values[i] for i in order]
+    n = len(order)
+    pw, pv = [0], [0]
+    for a, b in zip(w, v):
+        pw.append(pw[-1] + a)
+        pv.append(pv[-1] + b)
+
+    def bound(level, room, value):
+        j = bisect.bisect_right(pw, pw[level] + room, lo=level) - 1  # objets level … j-1 entiers
+        frac = (room - (pw[j] - pw[level])) * v[j] / w[j] if j < n else 0
+        return value + pv[j] - pv[level] + frac
+
+    best, best_mask = 0, 0
+    heap = [(-bound(0, capacity, 0), 0, 0, capacity, 0)]  # (-borne, -valeur, niveau, reste, choix)
+    nodes = 0
+    while heap and nodes < max_nodes:
+        neg_bound, neg_value, level, room, mask = heapq.heappop(heap)
+        if -neg_bound <= best:
+            break  # meilleure borne restante : optimum prouvé
+        nodes += 1
+        value = -neg_value
+        if level == n:
+            continue
+        if w[level] <= room:
+            taken = value + v[level]
+            if taken > best:
+                best, best_mask = taken, mask | 1 << level
+            b = bound(level + 1, room - w[level], taken)
+            if b > best:
+                heapq.heappush(heap, (-b, -taken, level + 1, room - w[level], mask | 1 << level))
+        b = bound(level + 1, room, value)
+        if b > best:
+            heapq.heappush(heap, (-b, neg_value, level + 1, room, mask))
+    taken = sorted(order[i] for i in range(n) if best_mask >> i & 1)
+    return best, taken, {"nodes": nodes, "complete": not heap or -heap[0][0] <= best}
+
+
+def _half_sums(weights, values):
+    """Poids et valeurs des 2^h sous-ensembles ; le bit i de l'indice = objet i."""
+    sw, sv = np.zeros(1), np.zeros(1)
+    for a, b in zip(weights, values):
+        sw, sv = np.concatenate((sw, sw + a)), np.concatenate((sv, sv + b))
+    return sw, sv
+
+
+def knapsack_meet_in_middle(weights, values, capacity):
+    """Rencontre au milieu, n ≤ 40, poids quelconques : O(2^(n/2) · n).
+
+    Les sous-ensembles de chaque moitié sont énumérés (NumPy, par
+    doublement) ; ceux de la seconde sont triés par poids, avec le maximum
+    préfixe des valeurs. Chaque sous-ensemble de la première moitié trouve
+    par ``searchsorted`` le meilleur complément qui tient dans le sac.
+
+    Renvoie ``(valeur, objets pris, {"nodes", "complete"})`` ; ``nodes`` :
+    sous-ensembles énumérés.
+    """
+    n = len(weights)
+    if n > 40:
+        raise ValueError(f"rencontre au milieu limitée à 40 objets ({n} donnés)")
+    h = n // 2
+    wa, va = _half_sums(weights[:h], values[:h])
+    wb, vb = _half_sums(weights[h:], values[h:])
+    order = np.argsort(wb, kind="stable")
+    wb, vb = wb[order], vb[order]
+    best_b = np.maximum.accumulate(vb)
+    at = np.arange(len(vb))
+    pos_b = np.maximum.accumulate(np.where(vb == best_b, at, 0))  # indice du maximum préfixe
+    j = np.searchsorted(wb, capacity - wa, side="right") - 1
+    total = np.where(j >= 0, va + best_b[np.maximum(j, 0)], -np.inf)
+    a = int(np.argmax(total))
+    b = int(order[pos_b[j[a]]])
+    taken = [i for i in range(h) if a >> i & 1] + [h + i for i in range(n - h) if b >> i & 1]
+    value = sum(values[i] for i in taken)
+    return value, taken, {"nodes": len(wa) + len(wb), "complete": True}
@@ -0,0 +1,56 @@
+"""Distance de Levenshtein et trace de la table DP."""
+from .trace import LazyTrace
+
+
+def levenshtein_distance(s1, s2):
+    """Distance seule, sur deux lignes glissantes — O(n) mémoire."""
+    prev = list(range(len(s2)+1))
+    for i, c1 in enumerate(s1, 1):
+        cur = [i]
+        for j, c2 in enumerate(s2, 1):
+            cur.append(prev[j-1] if c1 == c2 else 1 + min(cur[j-1], prev[j], prev[j-1]))
+        prev = cur
+    return prev[-1]
+
+
+def _levenshtein_events(s1, s2, dp):
+    m, n = len(s1), len(s2)
+    yield (), dict(i=0, j=0, op="init",
+                   desc="Initialisation : ligne 0 = nb insertions, colonne 0 = nb suppressions")
+    for i in range(1, m+1):
+        for j in range(1, n+1):
+            if s1[i-1] == s2[j-1]:
+                dp[i][j] = dp[i-1][j-1]
+                op, desc = "match", f"'{s1[i-1]}' = '{s2[j-1]}' — même lettre, coût 0 → dp[{i}][{j}] = {dp[i][j]}"
+            else:
+                ins  = dp[i][j-1] + 1
+                sup  = dp[i-1][j] + 1
+                repl = dp[i-1][j-1] + 1
+                dp[i][j] = min(ins, sup, repl)
+                best = "insertion" if dp[i][j]==ins else "suppression" if dp[i][j]==sup else "remplacement"
+                op   = "edit"
+                desc = f"'{s1[i-1]}' ≠ '{s2[j-1]}' → min(ins={ins}, sup={sup}, repl={repl}) = <b>{dp[i][j]}</b> ({best})"
+            yield [("dp", (i, j), dp[i][j])], dict(i=i, j=j, op=op, desc=desc)
+    # Chemin de retour
+    path, ci, cj = [], m, n
+    while ci > 0 or cj > 0:
+        path.append((ci, cj))
+        if ci == 0:                                          cj -= 1
+        elif cj == 0:                                        ci -= 1
+        elif dp[ci][cj] == dp[ci-1][cj-1] and s1[ci-1] == s2[cj-1]: ci -= 1; cj -= 1
+        elif dp[ci][cj] == dp[ci-1][cj-1] + 1:             ci -= 1; cj -= 1
+        elif dp[ci][cj] == dp[ci][cj-1] + 1:               cj -= 1
+        else:                                                ci -= 1
+    path.append((0, 0)); path.reverse()
+    yield (), dict(i=m, j=n, op="done", path=path,
+                   desc=f"✅ Distance({s1}, {s2}) = <b>{dp[m][n]}</b> opération(s)")
+
+
+def levenshtein_steps(s1, s2):
+    """Trace paresseuse : la table n'est remplie que jusqu'à l'étape affichée."""
+    m, n = len(s1), len(s2)
+    dp = [[0]*(n+1) for _ in range(m+1)]
+    for i in range(m+1): dp[i][0] = i
+    for j in range(n+1): dp[0][j] = j
+    steps = LazyTrace({"dp": dp}, _levenshtein_events(s1, s2, dp), length=m*n + 2)
+    return steps, levenshtein_distance(s1, s2)
@@ -0,0 +1,15 @@
+"""Ensemble de Mandelbrot (temps de fuite)."""
+import numpy as np
+
+
+def compute_mandelbrot(xmin, xmax, ymin, ymax, width=400, height=350, max_iter=80):
+    x = np.linspace(xmin, xmax, width)
+    y = np.linspace(ymin, ymax, height)
+    C = x[np.newaxis, :] + 1j * y[:, np.newaxis]
+    Z = np.zeros_like(C)
+    M = np.zeros(C.shape, dtype=float)
+    for i in range(max_iter):
+        mask = np.abs(Z) <= 2
+        Z[mask] = Z[mask] ** 2 + C[mask]
+        M[mask] += 1
+    return M
@@ -0,0 +1,64 @@
+"""Labyrinthes : génération par DFS et résolution par BFS."""
+import collections
+import random
+
+import numpy as np
+
+
+def generate_maze(rows, cols, seed=42):
+    """Génère un labyrinthe parfait par DFS. Retourne la grille et les étapes."""
+    rng = random.Random(seed)
+    # Grille de murs : 1 = mur, 0 = chemin
+    # On travaille sur une grille 2*rows+1 x 2*cols+1
+    h, w = 2*rows+1, 2*cols+1
+    grid = np.ones((h, w), dtype=int)
+
+    visited = set()
+    gen_steps = []  # snapshots de la grille pendant la génération
+
+    def cell_to_grid(r, c):
+        return 2*r+1, 2*c+1
+
+    def carve(r, c):
+        visited.add((r, c))
+        gr, gc = cell_to_grid(r, c)
+        grid[gr][gc] = 0
+        directions = [(0,1),(0,-1),(1,0),(-1,0)]
+        rng.shuffle(directions)
+        for dr, dc in directions:
+            nr, nc = r+dr, c+dc
+            if 0 <= nr < rows and 0 <= nc < cols and (nr, nc) not in visited:
+                # Abattre le mur entre (r,c) et (nr,nc)
+                grid[gr+dr][gc+dc] = 0
+                gen_steps.append(grid.copy())
+                carve(nr, nc)
+
+    carve(0, 0)
+    # Entrée et sortie
+    grid[0][1] = 0
+    grid[h-1][w-2] = 0
+
+    return grid, gen_steps, h, w
+
+
+def solve_maze_bfs(grid, h, w):
+    start = (0, 1)
+    end   = (h-1, w-2)
+    queue = collections.deque([(start, [start])])
+    visited = {start}
+    solve_steps = []
+
+    while queue:
+        (r, c), path = queue.popleft()
+        solve_steps.append({"visited": set(visited), "current": (r,c), "path": list(path)})
+
+        if (r, c) == end:
+            return solve_steps, path
+
+        for dr, dc in [(-1,0),(1,0),(0,-1),(0,1)]:
+            nr, nc = r+dr, c+dc
+            if 0 <= nr < h and 0 <= nc < w and grid[nr][nc] == 0 and (nr, nc) not in visited:
+                visited.add((nr, nc))
+                queue.append(((nr, nc), path + [(nr, nc)]))
+
+    return solve_steps, []
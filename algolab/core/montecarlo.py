@@ -0,0 +1,16 @@
+"""Estimation de π par Monte-Carlo."""
+import random
+
+
+def monte_carlo_pi(n_points, seed=42):
+    rng = random.Random(seed)
+    inside, outside, pi_estimates = [], [], []
+    for i in range(n_points):
+        x = rng.uniform(-1, 1)
+        y = rng.uniform(-1, 1)
+        if x*x + y*y <= 1:
+            inside.append((x, y))
+        else:
+            outside.append((x, y))
+        pi_estimates.append(4 * len(inside) / (i + 1))
+    return inside, outside, pi_estimates
@@ -0,0 +1,77 @@
+"""Arbres couvrants minimaux : Union-Find, Kruskal et Prim."""
+import heapq
+
+
+class UF:
+    def __init__(self, n):
+        self.parent = list(range(n))
+        self.rank   = [0] * n
+    def find(self, x):
+        while self.parent[x] != x:
+            self.parent[x] = self.parent[self.parent[x]]
+            x = self.parent[x]
+        return x
+    def union(self, x, y):
+        rx, ry = self.find(x), self.find(y)
+        if rx == ry: return False
+        if self.rank[rx] < self.rank[ry]: rx, ry = ry, rx
+        self.parent[ry] = rx
+        if self.rank[rx] == self.rank[ry]: self.rank[rx] += 1
+        return True
+
+
+def kruskal_steps(graph):
+    names = graph.names()
+    src, dst, wts = (a.tolist() for a in graph.edges())
+    order    = sorted(range(len(wts)), key=wts.__getitem__)
+    uf       = UF(graph.n)
+    mst, rejected, steps = [], [], []
+    steps.append({"mst": [], "current": None, "rejected": [],
+                  "desc": f"Arêtes triées par poids croissant — on teste dans l'ordre"})
+    for e in order:
+        u, v, w = names[src[e]], names[dst[e]], wts[e]
+        if uf.union(src[e], dst[e]):
+            mst.append((u, v, w))
+            steps.append({"mst": list(mst), "current": (u,v,w), "rejected": list(rejected),
+                          "desc": f"✅ <b>{u}–{v}</b> (poids {w}) ajoutée — pas de cycle"})
+        else:
+            rejected.append((u,v,w))
+            steps.append({"mst": list(mst), "current": (u,v,w), "rejected": list(rejected),
+                          "desc": f"❌ <b>{u}–{v}</b> (poids {w}) rejetée — créerait un cycle"})
+    total = sum(e[2] for e in mst)
+    steps.append({"mst": list(mst), "current": None, "rejected": list(rejected),
+                  "desc": f"✅ Terminé — {len(mst)} arêtes, poids total = <b>{total}</b>"})
+    return steps
+
+
+def prim_steps(graph):
+    names   = graph.names()
+    start   = 0
+    visited = {start}
+    heap    = [(w, names[start], names[v], start, v) for v, w in zip(*graph.neighbors(start))]
+    heapq.heapify(heap)
+    mst, rejected, steps = [], [], []
+    steps.append({"mst": [], "current": None, "visited": {names[start]}, "rejected": [],
+                  "desc": f"Départ depuis <b>{names[start]}</b> — on explore ses voisins"})
+    while heap:
+        w, _, _, u, v = heapq.heappop(heap)  # égalités départagées par étiquette
+        edge = (names[u], names[v], w)
+        if v in visited:
+            rejected.append(edge)
+            steps.append({"mst": list(mst), "current": edge, "visited": {names[i] for i in visited},
+                          "rejected": list(rejected),
+                          "desc": f"❌ <b>{names[u]}–{names[v]}</b> (poids {w}) ignorée — <b>{names[v]}</b> déjà dans l'arbre"})
+            continue
+        visited.add(v)
+        mst.append(edge)
+        steps.append({"mst": list(mst), "current": edge, "visited": {names[i] for i in visited},
+                      "rejected": list(rejected),
+                      "desc": f"✅ <b>{names[u]}–{names[v]}</b> (poids {w}) ajoutée — <b>{names[v]}</b> rejoint l'arbre"})
+        for neighbor, nw in zip(*graph.neighbors(v)):
+            if neighbor not in visited:
+                heapq.heappush(heap, (nw, names[v], names[neighbor], v, neighbor))
+    total = sum(e[2] for e in mst)
+    steps.append({"mst": list(mst), "current": None, "visited": {names[i] for i in visited},
+                  "rejected": list(rejected),
+                  "desc": f"✅ Terminé — poids total ACM = <b>{total}</b>"})
+    return steps
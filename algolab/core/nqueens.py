@@ -0,0 +1,41 @@
+"""N reines par backtracking."""
+
+
+def n_queens_steps(n, max_steps=800):
+    steps = []
+    board = [-1] * n  # board[col] = row de la reine
+
+    def is_safe(col, row):
+        for c in range(col):
+            r = board[c]
+            if r == row or abs(r - row) == abs(c - col):
+                return False
+        return True
+
+    def solve(col):
+        if len(steps) >= max_steps:
+            return False
+        if col == n:
+            steps.append({
+                "board": board.copy(), "col": -1, "action": "solved",
+                "desc": f"✅ Solution trouvée ! {n} reines placées sans conflit."
+            })
+            return True
+        for row in range(n):
+            if is_safe(col, row):
+                board[col] = row
+                steps.append({
+                    "board": board.copy(), "col": col, "action": "place",
+                    "desc": f"Reine placée colonne {col+1}, ligne {row+1} — test en cours…"
+                })
+                if solve(col + 1):
+                    return True
+                board[col] = -1
+                steps.append({
+                    "board": board.copy(), "col": col, "action": "backtrack",
+                    "desc": f"↩ Backtrack colonne {col+1} — aucune position valide, on recule"
+                })
+        return False
+
+    solve(0)
+    return steps
@@ -0,0 +1,48 @@
+"""PageRank par itération de puissance, sur un ``CSRGraph`` orienté."""
+import numpy as np
+
+
+def pagerank_iter(graph, damping=0.85, max_iter=30, tol=1e-6):
+    """Itérations ``(it, rang, Δ)`` ; chacune est un ``np.bincount`` sur les arcs.
+
+    La part d'une page sans lien sortant est perdue, comme dans la version
+    d'origine de la page.
+    """
+    n = graph.n
+    src, dst = graph.sources(), graph.targets
+    out = graph.out_degree()
+    share = np.divide(1.0, out, out=np.zeros(n), where=out > 0)
+    rank = np.full(n, 1 / n)
+    yield 0, rank, None
+    for it in range(1, max_iter + 1):
+        new_rank = (1 - damping) / n + damping * np.bincount(dst, weights=(rank * share)[src], minlength=n)
+        diff = float(np.abs(new_rank - rank).sum())
+        rank = new_rank
+        yield it, rank, diff
+        if diff < tol:
+            break
+
+
+def pagerank_scores(graph, damping=0.85, max_iter=100, tol=1e-6):
+    """Rang final (tableau) et variations Δ de chaque itération."""
+    diffs = []
+    for _, rank, diff in pagerank_iter(graph, damping, max_iter, tol):
+        if diff is not None:
+            diffs.append(diff)
+    return rank, diffs
+
+
+def pagerank_steps(graph, damping=0.85, max_iter=30, tol=1e-6):
+    names, n = graph.names(), graph.n
+    steps = []
+    for it, rank, diff in pagerank_iter(graph, damping, max_iter, tol):
+        rank = dict(zip(names, rank.tolist()))
+        if it == 0:
+            steps.append({"rank": rank, "iteration": 0, "diff": None,
+                          "desc": f"Initialisation — chaque page reçoit 1/{n} = {1/n:.4f}"})
+            continue
+        converged = diff < tol
+        steps.append({"rank": rank, "iteration": it, "diff": diff,
+                      "desc": f"Itération {it} — variation Δ={diff:.6f}" +
+                              (" &nbsp;✅ <b>Convergé !</b>" if converged else "")})
+    return steps
@@ -0,0 +1,138 @@
+"""Tri fusion parallèle : morceaux triés par un pool de processus, fusion en arbre.
+
+Le tableau est copié une fois dans un segment ``multiprocessing.shared_memory`` :
+les workers s'y attachent par son nom et trient leur morceau sur place, sans
+sérialiser les données. Les morceaux triés sont ensuite fusionnés deux à deux,
+en parallèle, vers un second segment (aller-retour entre les deux tampons) :
+⌈log₂ k⌉ tours, le dernier n'occupant plus qu'un worker — la part séquentielle
+qui borne l'accélération (loi d'Amdahl).
+
+    out, timing = parallel_merge_sort(np.arange(10**7)[::-1], workers=4)
+"""
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+def _attach(name):
+    """Segment existant. Les workers « spawn » partagent le resource tracker
+    du parent, qui garde une seule inscription par nom : c'est le parent qui
+    libère le segment (``unlink``)."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python ≥ 3.13
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def _view(shm, n, dtype):
+    return np.ndarray((n,), dtype=dtype, buffer=shm.buf)
+
+
+def _sort_chunk(name, n, dtype, lo, hi):
+    shm = _attach(name)
+    try:
+        _view(shm, n, dtype)[lo:hi].sort()
+    finally:
+        shm.close()
+
+
+def _merge_pair(src, dst, n, dtype, lo, mid, hi):
+    """Fusionne src[lo:mid] et src[mid:hi] (triés) dans dst[lo:hi].
+
+    Le tri stable de NumPy (timsort au-delà de 16 bits) repère les deux suites
+    déjà triées : la fusion est linéaire.
+    """
+    a, b = _attach(src), _attach(dst)
+    try:
+        out = _view(b, n, dtype)[lo:hi]
+        out[:] = _view(a, n, dtype)[lo:hi]
+        out.sort(kind="stable")
+    finally:
+        a.close()
+        b.close()
+
+
+def _ready():
+    return os.getpid()
+
+
+def make_pool(workers):
+    """Pool « spawn » démarré : chaque worker a déjà importé NumPy."""
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    wait([pool.submit(_ready) for _ in range(workers)])
+    return pool
+
+
+def parallel_merge_sort(arr, workers=None, chunks=None, pool=None):
+    """Trie ``arr`` (tableau d'entiers) ; renvoie ``(tableau trié, durées)``.
+
+    ``chunks`` : nombre de morceaux (défaut : un par worker). ``pool`` : pool
+    existant (voir ``make_pool``), sinon un pool est créé et arrêté ici, son
+    démarrage étant compté à part (``startup_ms``). Durées en ms : ``copy``
+    (entrée vers la mémoire partagée), ``sort`` (morceaux), ``merge`` (tous les
+    tours) et ``total`` ; ``rounds`` : nombre de tours de fusion.
+    """
+    a = np.ascontiguousarray(arr)
+    if a.dtype.kind not in "iu":
+        raise TypeError(f"tableau d'entiers attendu, pas {a.dtype}")
+    n, dtype = len(a), a.dtype.str
+    workers = workers or os.cpu_count() or 1
+    k = max(1, min(chunks or workers, n))
+    timing = {"workers": workers, "chunks": k, "startup_ms": 0.0}
+    own = pool is None
+    if own:
+        t0 = time.perf_counter()
+        pool = make_pool(workers)
+        timing["startup_ms"] = (time.perf_counter() - t0) * 1000
+    segs = [shared_memory.SharedMemory(create=True, size=max(1, a.nbytes)) for _ in range(2)]
+    try:
+        t0 = time.perf_counter()
+        _view(segs[0], n, dtype)[:] = a
+        t1 = time.perf_counter()
+        bounds = np.linspace(0, n, k + 1).astype(int).tolist()
+        runs = list(zip(bounds[:-1], bounds[1:]))
+        for f in [pool.submit(_sort_chunk, segs[0].name, n, dtype, lo, hi) for lo, hi in runs]:
+            f.result()
+        t2 = time.perf_counter()
+        src, dst, rounds = 0, 1, 0
+        while len(runs) > 1:
+            futures, merged = [], []
+            for (lo, mid), (_, hi) in zip(runs[0::2], runs[1::2]):
+                futures.append(pool.submit(_merge_pair, segs[src].name, segs[dst].name, n, dtype, lo, mid, hi))
+                merged.append((lo, hi))
+            if len(runs) % 2:  # morceau sans partenaire : recopié tel quel
+                lo, hi = runs[-1]
+                _view(segs[dst], n, dtype)[lo:hi] = _view(segs[src], n, dtype)[lo:hi]
+                merged.append(runs[-1])
+            for f in futures:
+                f.result()
+            runs, src, dst, rounds = merged, dst, src, rounds + 1
+        t3 = time.perf_counter()
+        out = _view(segs[src], n, dtype).copy()
+    finally:
+        for shm in segs:
+            shm.close()
+            shm.unlink()
+        if own:
+            pool.shutdown()
+    timing.update(copy=(t1 - t0) * 1000, sort=(t2 - t1) * 1000, merge=(t3 - t2) * 1000,
+                  total=(t3 - t0) * 1000, rounds=rounds)
+    return out, timing
+
+
+def amdahl_fraction(workers, speedups):
+    """Part séquentielle f ajustée sur S(p) = 1 / (f + (1 - f) / p) (moindres carrés).
+
+    ``1/S - 1/p = f · (1 - 1/p)`` est linéaire en f ; les mesures à p = 1 ne
+    l'informent pas. Renvoie None s'il n'y a aucune mesure à p > 1.
+    """
+    num = den = 0.0
+    for p, s in zip(workers, speedups):
+        x = 1 - 1 / p
+        num += (1 / s - 1 / p) * x
+        den += x * x
+    return min(1.0, max(0.0, num / den)) if den else None
@@ -0,0 +1,70 @@
+"""A* sur grille (heuristique de Manhattan)."""
+import heapq
+
+
+def heuristic(a, b):
+    return abs(a[0]-b[0]) + abs(a[1]-b[1])  # Manhattan
+
+
+def astar_steps(grid, start, end):
+    rows, cols = len(grid), len(grid[0])
+    open_set   = [(0, start)]
+    came_from  = {}
+    g_score    = {start: 0}
+    f_score    = {start: heuristic(start, end)}
+    open_nodes = {start}
+    closed     = set()
+    steps      = []
+
+    while open_set:
+        _, current = heapq.heappop(open_set)
+        if current not in open_nodes:
+            continue
+        open_nodes.discard(current)
+
+        if current == end:
+            # Reconstituer le chemin
+            path = []
+            node = end
+            while node in came_from:
+                path.append(node)
+                node = came_from[node]
+            path.append(start)
+            path.reverse()
+            steps.append({"current": current, "open": set(open_nodes), "closed": set(closed),
+                          "path": path, "g": dict(g_score), "f": dict(f_score),
+                          "desc": f"✅ Chemin trouvé ! {len(path)} étapes, coût = {g_score[end]}"})
+            return steps, path
+
+        closed.add(current)
+        steps.append({"current": current, "open": set(open_nodes), "closed": set(closed),
+                      "path": [], "g": dict(g_score), "f": dict(f_score),
+                      "desc": f"Explore <b>({current[0]},{current[1]})</b> | g={g_score[current]} | h={heuristic(current,end)} | f={f_score.get(current,'?')}"})
+
+        for dr, dc in [(-1,0),(1,0),(0,-1),(0,1)]:
+            nr, nc = current[0]+dr, current[1]+dc
+            neighbor = (nr, nc)
+            if 0 <= nr < rows and 0 <= nc < cols and grid[nr][nc] == 0 and neighbor not in closed:
+                tentative_g = g_score[current] + 1
+                if tentative_g < g_score.get(neighbor, float('inf')):
+                    came_from[neighbor] = current
+                    g_score[neighbor]   = tentative_g
+                    f_score[neighbor]   = tentative_g + heuristic(neighbor, end)
+                    heapq.heappush(open_set, (f_score[neighbor], neighbor))
+                    open_nodes.add(neighbor)
+                    steps.append({"current": neighbor, "open": set(open_nodes), "closed": set(closed),
+                                  "path": [], "g": dict(g_score), "f": dict(f_score),
+                                  "desc": f"Mise à jour <b>({nr},{nc})</b> | g={tentative_g} | h={heuristic(neighbor,end)} | f={f_score[neighbor]}"})
+
+    steps.append({"current": None, "open": set(), "closed": set(closed),
+                  "path": [], "g": dict(g_score), "f": dict(f_score),
+                  "desc": "❌ Aucun chemin trouvé"})
+    return steps, []
+
+
+def make_random_grid(rows, cols, wall_pct, seed):
+    import random
+    rng = random.Random(seed)
+    grid = [[1 if rng.random() < wall_pct else 0 for _ in range(cols)] for _ in range(rows)]
+    grid[0][0] = 0; grid[rows-1][cols-1] = 0
+    return grid
@@ -0,0 +1,42 @@
+"""Recherche dichotomique pas à pas."""
+
+
+def binary_search_steps(arr, target):
+    steps = []
+    lo, hi = 0, len(arr) - 1
+
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        steps.append({
+            "arr": arr, "lo": lo, "hi": hi, "mid": mid,
+            "target": target, "found": None,
+            "desc": f"Milieu = index {mid} → valeur <b>{arr[mid]}</b> | Recherche de <b>{target}</b> dans [{lo} … {hi}]"
+        })
+        if arr[mid] == target:
+            steps.append({
+                "arr": arr, "lo": lo, "hi": hi, "mid": mid,
+                "target": target, "found": mid,
+                "desc": f"✅ Trouvé ! <b>{target}</b> est à l'index <b>{mid}</b>"
+            })
+            return steps
+        elif arr[mid] < target:
+            lo = mid + 1
+            steps.append({
+                "arr": arr, "lo": lo, "hi": hi, "mid": mid,
+                "target": target, "found": None,
+                "desc": f"{arr[mid]} &lt; {target} → on cherche à droite : [{lo} … {hi}]"
+            })
+        else:
+            hi = mid - 1
+            steps.append({
+                "arr": arr, "lo": lo, "hi": hi, "mid": mid,
+                "target": target, "found": None,
+                "desc": f"{arr[mid]} &gt; {target} → on cherche à gauche : [{lo} … {hi}]"
+            })
+
+    steps.append({
+        "arr": arr, "lo": lo, "hi": hi, "mid": -1,
+        "target": target, "found": -1,
+        "desc": f"❌ <b>{target}</b> n'existe pas dans le tableau"
+    })
+    return steps
@@ -0,0 +1,50 @@
+"""Crible d'Ératosthène."""
+import math
+
+from .trace import LazyTrace
+
+
+def primes_up_to(n):
+    """Crible direct, sans trace."""
+    is_prime = bytearray(2) + bytearray([1]) * (n - 1)
+    for p in range(2, math.isqrt(n) + 1):
+        if is_prime[p]:
+            is_prime[p * p :: p] = bytes(len(range(p * p, n + 1, p)))
+    return [i for i in range(n + 1) if is_prime[i]]
+
+
+def _sieve_events(n, is_prime):
+    yield (), dict(
+        current=None,
+        multiples=range(0),
+        desc="Initialisation — tous les nombres supposés premiers sauf 0 et 1",
+    )
+    p = 2
+    while p * p <= n:
+        if is_prime[p]:
+            multiples = range(p * p, n + 1, p)
+            changes = []
+            for m in multiples:
+                if is_prime[m]:
+                    is_prime[m] = False
+                    changes.append(("is_prime", m, False))
+            yield changes, dict(
+                current=p,
+                multiples=multiples,
+                desc=f"Élimination des multiples de <b>{p}</b> : {p}², {p}²+{p}, … ({len(multiples)} nombre(s) barrés)",
+            )
+        p += 1
+    primes = [i for i in range(2, n + 1) if is_prime[i]]
+    yield (), dict(
+        current=None,
+        multiples=range(0),
+        desc=f"✅ Terminé — <b>{len(primes)}</b> nombres premiers jusqu'à {n}",
+    )
+
+
+def sieve_steps(n):
+    """Trace paresseuse : une étape par premier p ≤ √n, plus début et fin."""
+    is_prime = [True] * (n + 1)
+    is_prime[0] = is_prime[1] = False
+    length = len(primes_up_to(math.isqrt(n))) + 2
+    return LazyTrace({"is_prime": is_prime}, _sieve_events(n, is_prime), length=length)
@@ -0,0 +1,476 @@
+"""Tris pas à pas : bulles, fusion, rapide, introsort, tas, Shell, comptage et base."""
+import random
+import time
+
+from .trace import SortTrace
+
+
+# Types d'étape de SortTrace (indices dans SortTrace.DESCS)
+(COMPARE, SWAP, DONE, MERGE_COMPARE, MERGED, PIVOT, PIVOT_COMPARE, EXCHANGE, PIVOT_PLACED,
+ INSERTION, INSERT_COMPARE, INSERT_SWAP, MEDIAN3, HEAP_FALLBACK, HEAP_COMPARE, HEAP_SWAP,
+ PIVOT3, DUTCH_COMPARE, DUTCH_DONE, SHELL_GAP, GAP_COMPARE, GAP_SWAP,
+ RUN_FOUND, RUN_REVERSED) = range(24)
+# Comparaisons comptées par type d'étape (la médiane de trois en fait trois)
+_COMPARISONS = {COMPARE: 1, MERGE_COMPARE: 1, PIVOT_COMPARE: 1, INSERT_COMPARE: 1, MEDIAN3: 3,
+                HEAP_COMPARE: 1, DUTCH_COMPARE: 1, GAP_COMPARE: 1}
+# Échanges comptés par type d'étape, s'il déplace vraiment deux cases (la médiane de trois
+# peut ne rien écrire, Lomuto échange une case avec elle-même)
+_SWAPS = {SWAP, EXCHANGE, PIVOT_PLACED, INSERT_SWAP, MEDIAN3, HEAP_SWAP, GAP_SWAP, RUN_REVERSED}
+
+CIURA_GAPS = (1, 4, 10, 23, 57, 132, 301, 701, 1750)
+INSERTION_CUTOFF = 16  # introsort : sous-tableaux triés par insertion
+
+
+# ── Algorithmes ───────────────────────────────────────────────────────────────
+# Chaque tri agit sur la liste ``a`` et décrit ses étapes à ``rec`` : une
+# SortTrace pour la visualisation, un SortStats pour les compteurs seuls.
+
+def _swap(a, x, y):
+    a[x], a[y] = a[y], a[x]
+    return ((x, a[x]), (y, a[y]))
+
+
+def _bubble(a, rec):
+    record = rec.record
+    n = len(a)
+    for i in range(n):
+        for j in range(0, n-i-1):
+            record(COMPARE, j, j+1, n-i, n)
+            if a[j] > a[j+1]:
+                a[j], a[j+1] = a[j+1], a[j]
+                record(SWAP, j, j+1, n-i, n, ((j, a[j]), (j+1, a[j+1])))
+    record(DONE, lo=0, hi=n)
+
+
+def _merge_runs(a, record, left, mid, right):
+    """Fusionne les suites triées a[left:mid] et a[mid:right]."""
+    L, R = a[left:mid], a[mid:right]
+    merged = []
+    i = j = 0
+    while i < len(L) and j < len(R):
+        record(MERGE_COMPARE, left+i, mid+j, p=i, q=j)
+        if L[i] <= R[j]:
+            merged.append(L[i]); i += 1
+        else:
+            merged.append(R[j]); j += 1
+    merged.extend(L[i:]); merged.extend(R[j:])
+    changes = []
+    for k, val in enumerate(merged):
+        if a[left+k] != val:
+            a[left+k] = val
+            changes.append((left+k, val))
+    record(MERGED, lo=left, hi=right, writes=changes)
+
+
+def _merge(a, rec):
+    def merge_sort(left, right, depth):
+        if right - left <= 1:
+            return
+        rec.enter(depth)
+        mid = left + (right - left) // 2
+        merge_sort(left, mid, depth + 1)
+        merge_sort(mid, right, depth + 1)
+        _merge_runs(a, rec.record, left, mid, right)
+    merge_sort(0, len(a), 1)
+
+
+def _natural_merge(a, rec):
+    """Fusion naturelle : suites déjà monotones repérées, décroissantes retournées."""
+    record = rec.record
+    n, runs, lo = len(a), [], 0
+    while lo < n:
+        hi = lo + 1
+        if hi < n:
+            record(COMPARE, lo, hi)
+            descending = a[hi] < a[lo]  # strictement : la stabilité est préservée
+            while hi + 1 < n:
+                record(COMPARE, hi, hi+1)
+                if (a[hi+1] < a[hi]) != descending:
+                    break
+                hi += 1
+            hi += 1
+            if descending:
+                a[lo:hi] = a[lo:hi][::-1]
+                record(RUN_REVERSED, lo=lo, hi=hi, writes=[(k, a[k]) for k in range(lo, hi)])
+            else:
+                record(RUN_FOUND, lo=lo, hi=hi)
+        else:
+            hi = n
+            record(RUN_FOUND, lo=lo, hi=hi)
+        runs.append((lo, hi))
+        lo = hi
+    depth = 1
+    while len(runs) > 1:
+        rec.enter(depth)
+        merged = []
+        for k in range(0, len(runs) - 1, 2):
+            (left, mid), (_, right) = runs[k], runs[k+1]
+            _merge_runs(a, record, left, mid, right)
+            merged.append((left, right))
+        if len(runs) % 2:
+            merged.append(runs[-1])
+        runs, depth = merged, depth + 1
+    record(DONE, lo=0, hi=n)
+
+
+def _lomuto(a, record, lo, hi):
+    """Partition de Lomuto autour de a[hi] ; renvoie la position finale du pivot."""
+    pivot = a[hi]
+    i = lo
+    record(PIVOT, hi)
+    for j in range(lo, hi):
+        record(PIVOT_COMPARE, j, hi)
+        if a[j] <= pivot:
+            record(EXCHANGE, i, j, writes=_swap(a, i, j))
+            i += 1
+    record(PIVOT_PLACED, i, hi, i, i+1, _swap(a, i, hi))
+    return i
+
+
+def _quick(a, rec):
+    record = rec.record
+    stack = [(0, len(a)-1, 1)]  # pile explicite : pas de limite de récursion sur les grands tableaux
+    while stack:
+        lo, hi, depth = stack.pop()
+        if lo >= hi: continue
+        rec.enter(depth)
+        i = _lomuto(a, record, lo, hi)
+        stack.append((i+1, hi, depth+1))
+        stack.append((lo, i-1, depth+1))
+    record(DONE, lo=0, hi=len(a))
+
+
+def _gapped_insertion(a, record, lo, hi, gap, compare, swap):
+    """Tri par insertion de a[lo..hi] entre éléments distants de ``gap``."""
+    for i in range(lo + gap, hi + 1):
+        j = i
+        while j - gap >= lo:
+            record(compare, j-gap, j, p=gap)
+            if a[j-gap] <= a[j]:
+                break
+            record(swap, j-gap, j, writes=_swap(a, j-gap, j), p=gap)
+            j -= gap
+
+
+def _heap_range(a, record, lo, hi):
+    """Tri par tas de a[lo..hi] (repli de l'introsort)."""
+    def sift(root, end):
+        while 2 * (root - lo) + 1 + lo <= end:
+            child = 2 * (root - lo) + 1 + lo
+            if child + 1 <= end:
+                record(HEAP_COMPARE, child, child+1)
+                if a[child] < a[child+1]:
+                    child += 1
+            record(HEAP_COMPARE, root, child)
+            if a[root] >= a[child]:
+                return
+            record(HEAP_SWAP, root, child, writes=_swap(a, root, child))
+            root = child
+    for root in range(lo + (hi - lo - 1) // 2, lo - 1, -1):
+        sift(root, hi)
+    for end in range(hi, lo, -1):
+        record(HEAP_SWAP, lo, end, end, end+1, _swap(a, lo, end))
+        sift(lo, end - 1)
+
+
+def _intro(a, rec, cutoff=INSERTION_CUTOFF):
+    """Introsort : pivot médiane de trois, repli sur le tas au-delà de 2·log₂ n niveaux."""
+    record = rec.record
+    limit = 2 * max(1, len(a).bit_length())
+    stack = [(0, len(a)-1, 1)]
+    while stack:
+        lo, hi, depth = stack.pop()
+        if lo >= hi: continue
+        rec.enter(depth)
+        if hi - lo < cutoff:
+            record(INSERTION, lo, hi)
+            _gapped_insertion(a, record, lo, hi, 1, INSERT_COMPARE, INSERT_SWAP)
+            continue
+        if depth > limit:
+            record(HEAP_FALLBACK, lo, hi, p=limit)
+            _heap_range(a, record, lo, hi)
+            continue
+        mid = (lo + hi) // 2
+        m = sorted((lo, mid, hi), key=a.__getitem__)[1]
+        record(MEDIAN3, hi, writes=_swap(a, m, hi) if m != hi else (), p=lo, q=mid)
+        i = _lomuto(a, record, lo, hi)
+        stack.append((i+1, hi, depth+1))
+        stack.append((lo, i-1, depth+1))
+    record(DONE, lo=0, hi=len(a))
+
+
+def _quick3(a, rec):
+    """Tri rapide à partition en trois (drapeau hollandais), pivot médiane de trois."""
+    record = rec.record
+    stack = [(0, len(a)-1, 1)]
+    while stack:
+        lo, hi, depth = stack.pop()
+        if lo >= hi: continue
+        rec.enter(depth)
+        pivot = sorted((a[lo], a[(lo + hi) // 2], a[hi]))[1]
+        record(PIVOT3, lo, hi, p=pivot)
+        lt, i, gt = lo, lo, hi
+        while i <= gt:
+            record(DUTCH_COMPARE, i, p=pivot)
+            if a[i] < pivot:
+                record(EXCHANGE, lt, i, writes=_swap(a, lt, i))
+                lt += 1; i += 1
+            elif a[i] > pivot:
+                while gt > i:  # la fin déjà > pivot reste en place (entrées triées)
+                    record(DUTCH_COMPARE, gt, p=pivot)
+                    if a[gt] <= pivot:
+                        break
+                    gt -= 1
+                record(EXCHANGE, i, gt, writes=_swap(a, i, gt))
+                gt -= 1
+            else:
+                i += 1
+        record(DUTCH_DONE, lo=lt, hi=gt+1, p=pivot, q=gt+1-lt)
+        stack.append((gt+1, hi, depth+1))
+        stack.append((lo, lt-1, depth+1))
+    record(DONE, lo=0, hi=len(a))
+
+
+def ciura_gaps(n):
+    """Écarts de Ciura (prolongés par ×2,25) inférieurs à n, du plus grand au plus petit."""
+    gaps = list(CIURA_GAPS)
+    while gaps[-1] * 9 // 4 < n:
+        gaps.append(gaps[-1] * 9 // 4)
+    return [g for g in reversed(gaps) if g < n] or [1]
+
+
+def _shell(a, rec):
+    record = rec.record
+    for gap in ciura_gaps(len(a)):
+        record(SHELL_GAP, p=gap)
+        _gapped_insertion(a, record, 0, len(a) - 1, gap, GAP_COMPARE, GAP_SWAP)
+    record(DONE, lo=0, hi=len(a))
+
+
+SORTS = {"bubble": _bubble, "merge": _merge, "quick": _quick, "intro": _intro,
+         "quick3": _quick3, "shell": _shell, "natural": _natural_merge}
+
+
+# ── Entrées ───────────────────────────────────────────────────────────────────
+
+INPUTS = ("random", "sorted", "reversed", "few_unique", "nearly_sorted")
+
+
+def make_input(kind, n, seed=None):
+    """Tableau de ``n`` entiers : aléatoire, trié, inversé, peu de valeurs ou presque trié."""
+    rng = random.Random(seed)
+    if kind == "few_unique":
+        return [rng.choice((10, 30, 50, 70, 90)) for _ in range(n)]
+    a = rng.sample(range(1, max(100, 4 * n)), n)
+    if kind == "random":
+        return a
+    a.sort(reverse=kind == "reversed")
+    if kind == "nearly_sorted":  # ~5 % des éléments échangés avec un voisin proche
+        for _ in range(max(1, n // 20) if n else 0):
+            i = rng.randrange(n)
+            j = min(n - 1, i + rng.randint(1, 5))
+            a[i], a[j] = a[j], a[i]
+    elif kind not in ("sorted", "reversed"):
+        raise ValueError(f"entrée inconnue : {kind!r}")
+    return a
+
+
+# ── Traces (visualisation) ────────────────────────────────────────────────────
+
+def _steps(algo, arr, capacity):
+    trace = SortTrace(arr, capacity=capacity)
+    SORTS[algo](list(arr), trace)
+    return trace.finish()
+
+
+def _nlogn(arr, k=4):
+    return k * len(arr) * max(1, len(arr).bit_length())
+
+
+def bubble_sort_steps(arr):
+    return _steps("bubble", arr, len(arr) * (len(arr) - 1) + 1)
+
+
+def merge_sort_steps(arr):
+    return _steps("merge", arr, _nlogn(arr, 2))
+
+
+def quick_sort_steps(arr):
+    return _steps("quick", arr, _nlogn(arr))
+
+
+def intro_sort_steps(arr):
+    return _steps("intro", arr, _nlogn(arr))
+
+
+def quick3_sort_steps(arr):
+    return _steps("quick3", arr, _nlogn(arr))
+
+
+def shell_sort_steps(arr):
+    return _steps("shell", arr, _nlogn(arr))
+
+
+def natural_merge_sort_steps(arr):
+    return _steps("natural", arr, _nlogn(arr, 2))
+
+
+# ── Compteurs seuls (grandes tailles) ─────────────────────────────────────────
+
+class SortStats:
+    """Enregistreur sans étapes : mêmes appels que SortTrace, compteurs seulement.
+
+    Compte comparaisons, échanges, écritures et profondeur de récursion, et
+    garde un échantillon du tableau (au plus ``sample`` valeurs) à chaque
+    centile de ``percentiles`` de l'avancement, mesuré en étapes. Le total
+    n'étant pas connu d'avance, les échantillons sont pris à pas régulier ;
+    quand il y en a trop, un sur deux est oublié et le pas double.
+    """
+
+    PERCENTILES = tuple(range(0, 101, 10))
+    SAMPLE = 512
+
+    def __init__(self, a, percentiles=PERCENTILES, sample=SAMPLE):
+        self._a = a
+        self._stride = max(1, -(-len(a) // sample))
+        self.percentiles = tuple(percentiles)
+        self._keep = 8 * len(self.percentiles)  # pas ≤ total / (4 × nb de centiles)
+        self.steps = self.comparisons = self.swaps = self.writes = self.max_depth = 0
+        self._every = 1
+        self._snaps = [(0, a[::self._stride])]
+
+    def record(self, kind, i1=-1, i2=-1, lo=0, hi=0, writes=(), p=0, q=0):
+        self.steps += 1
+        self.comparisons += _COMPARISONS.get(kind, 0)
+        if writes:
+            self.writes += len(writes)
+            if kind in _SWAPS and writes[0][0] != writes[-1][0]:
+                self.swaps += 1
+        if self.steps % self._every == 0:
+            self._snaps.append((self.steps, self._a[::self._stride]))
+            if len(self._snaps) > self._keep:
+                self._every *= 2
+                self._snaps = [s for s in self._snaps if s[0] % self._every == 0]
+
+    def enter(self, depth):
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    def finish(self):
+        """Résultat : compteurs et ``snapshots`` ``[(centile, échantillon)]``."""
+        if self._snaps[-1][0] != self.steps:
+            self._snaps.append((self.steps, self._a[::self._stride]))
+        snaps = []
+        for pct in self.percentiles:
+            target = pct / 100 * self.steps
+            snaps.append((pct, min(self._snaps, key=lambda s: abs(s[0] - target))[1]))
+        return {"n": len(self._a), "steps": self.steps, "comparisons": self.comparisons,
+                "swaps": self.swaps, "writes": self.writes, "max_depth": self.max_depth,
+                "stride": self._stride, "snapshots": snaps}
+
+
+def sort_stats(algo, arr, percentiles=SortStats.PERCENTILES):
+    """Tri ``algo`` (une clé de ``SORTS``) en mode compteurs, chronométré.
+
+    Même code que la visualisation, sans trace : utilisable jusqu'à 10⁶
+    éléments (tri à bulles : quelques milliers). Renvoie le dict de
+    ``SortStats.finish`` plus ``ms``, la durée du tri instrumenté.
+    """
+    a = list(arr)
+    stats = SortStats(a, percentiles)
+    t0 = time.perf_counter()
+    SORTS[algo](a, stats)
+    ms = (time.perf_counter() - t0) * 1000
+    return {**stats.finish(), "ms": ms}
+
+
+def heap_sort_steps(arr):
+    a = arr.copy()
+    n = len(a)
+    steps = []
+
+    def record(phase, heap_end, active=None, desc=""):
+        steps.append({"arr": a.copy(), "heap_end": heap_end,
+                      "active": active or [], "phase": phase, "desc": desc})
+
+    def heapify(n_heap, i):
+        largest, left, right = i, 2*i+1, 2*i+2
+        if left  < n_heap and a[left]  > a[largest]: largest = left
+        if right < n_heap and a[right] > a[largest]: largest = right
+        if largest != i:
+            record("build", n_heap, [i, largest],
+                   f"Sift-down : échange <b>{a[i]}</b> ↔ <b>{a[largest]}</b> — parent trop petit")
+            a[i], a[largest] = a[largest], a[i]
+            heapify(n_heap, largest)
+
+    record("build", n, [], "Tableau initial — on va construire le max-heap")
+    for i in range(n//2 - 1, -1, -1):
+        heapify(n, i)
+        record("build", n, [i], f"Heapify à l'index {i} — racine actuelle = <b>{a[0]}</b>")
+
+    record("build", n, [0], f"✅ Max-heap construit — la racine <b>{a[0]}</b> est le plus grand élément")
+
+    for i in range(n-1, 0, -1):
+        record("extract", i+1, [0, i],
+               f"Extraction : <b>{a[0]}</b> (max) échangé avec la position {i}")
+        a[0], a[i] = a[i], a[0]
+        heapify(i, 0)
+        if i > 1:
+            record("extract", i, [0], f"Sift-down — tas réduit à {i} éléments, nouvelle racine = <b>{a[0]}</b>")
+
+    record("done", 0, list(range(n)), "✅ Tableau entièrement trié !")
+    return steps
+
+
+def counting_sort_steps(arr, max_val):
+    steps, count, output = [], [0]*(max_val+1), [0]*len(arr)
+    steps.append({"phase":"init","arr":list(arr),"count":list(count),"output":None,
+                  "hl_arr":[],"hl_count":[],"desc":"Tableau initial — on va compter chaque valeur"})
+    for i, v in enumerate(arr):
+        count[v] += 1
+        steps.append({"phase":"count","arr":list(arr),"count":list(count),"output":None,
+                      "hl_arr":[i],"hl_count":[v],
+                      "desc":f"arr[{i}]={v} → count[{v}] passe à {count[v]}"})
+    steps.append({"phase":"count_done","arr":list(arr),"count":list(count),"output":None,
+                  "hl_arr":[],"hl_count":[],"desc":"Comptage terminé — chaque case = nb d'occurrences de cette valeur"})
+    for i in range(1, max_val+1):
+        count[i] += count[i-1]
+        steps.append({"phase":"cumul","arr":list(arr),"count":list(count),"output":None,
+                      "hl_arr":[],"hl_count":[i],
+                      "desc":f"Cumul : count[{i}] += count[{i-1}] → {count[i]} (nb d'éléments ≤ {i})"})
+    steps.append({"phase":"cumul_done","arr":list(arr),"count":list(count),"output":None,
+                  "hl_arr":[],"hl_count":[],"desc":"Comptage cumulatif prêt — count[v] = dernière position de v dans la sortie"})
+    for i in range(len(arr)-1, -1, -1):
+        v = arr[i]; count[v] -= 1; output[count[v]] = v
+        steps.append({"phase":"place","arr":list(arr),"count":list(count),"output":list(output),
+                      "hl_arr":[i],"hl_count":[v],
+                      "desc":f"Placer arr[{i}]={v} → output[{count[v]}]={v}"})
+    steps.append({"phase":"done","arr":list(output),"count":list(count),"output":list(output),
+                  "hl_arr":list(range(len(output))),"hl_count":[],
+                  "desc":"✅ Tableau trié ! Counting Sort : O(n+k) sans aucune comparaison"})
+    return steps
+
+
+def radix_sort_steps(arr):
+    steps, current = [], list(arr)
+    max_val = max(arr)
+    n_digits = len(str(max_val))
+    steps.append({"phase":"init","arr":list(current),"buckets":None,"pass_num":0,"digit_name":"",
+                  "desc":f"Tableau initial — {n_digits} passe(s) nécessaire(s) (une par chiffre)"})
+    exp = 1
+    for d in range(n_digits):
+        name = ["unités","dizaines","centaines","milliers"][d] if d < 4 else f"10^{d}"
+        buckets = [[] for _ in range(10)]
+        for v in current:
+            buckets[(v // exp) % 10].append(v)
+        steps.append({"phase":"distribute","arr":list(current),"buckets":[list(b) for b in buckets],
+                      "pass_num":d+1,"digit_name":name,
+                      "desc":f"Passe {d+1} — chiffre des <b>{name}</b> : répartition dans les seaux 0–9"})
+        current = [v for b in buckets for v in b]
+        steps.append({"phase":"collect","arr":list(current),"buckets":[list(b) for b in buckets],
+                      "pass_num":d+1,"digit_name":name,
+                      "desc":f"Passe {d+1} — collecte des seaux dans l'ordre : tableau partiellement trié"})
+        exp *= 10
+    steps.append({"phase":"done","arr":list(current),"buckets":None,"pass_num":n_digits,"digit_name":"",
+                  "desc":f"✅ Trié en {n_digits} passe(s) — Radix Sort : O(d×n), stable, sans comparaison"})
+    return steps
@@ -0,0 +1,359 @@
+"""Traces d'étapes compactes : état initial + deltas, avec keyframes périodiques.
+
+Au lieu de copier tout l'état à chaque micro-étape, on enregistre uniquement
+les cases modifiées. Toutes les ``keyframe_every`` étapes, une copie complète
+de l'état est conservée pour reconstruire n'importe quelle étape rapidement.
+``LazyTrace`` fait de même à partir d'un générateur, consommé seulement
+jusqu'à l'étape demandée. ``SortTrace`` spécialise l'idée pour les tris :
+colonnes NumPy int32 et descriptions formatées seulement à l'affichage.
+"""
+import sys
+import threading
+
+import numpy as np
+
+KEYFRAME_EVERY = 64
+
+
+def _snapshot(state):
+    """Copie profonde des conteneurs mutables (listes, dicts, tableaux NumPy)."""
+    if isinstance(state, list):
+        if any(isinstance(x, (list, dict)) or hasattr(x, "ndim") for x in state):
+            return [_snapshot(x) for x in state]
+        return state[:]
+    if isinstance(state, dict):
+        return {k: _snapshot(v) for k, v in state.items()}
+    if hasattr(state, "ndim"):
+        return state.copy()
+    return state
+
+
+def _sizeof(state):
+    """Taille approximative en octets d'un état (listes, dicts, tableaux NumPy)."""
+    if hasattr(state, "ndim"):
+        return state.nbytes
+    if isinstance(state, list):
+        return sys.getsizeof(state) + sum(_sizeof(x) for x in state)
+    if isinstance(state, dict):
+        return sys.getsizeof(state) + sum(_sizeof(v) for v in state.values())
+    return sys.getsizeof(state)
+
+
+def _assign(obj, key, value):
+    """obj[key] = value ; une clé tuple parcourt les listes imbriquées."""
+    if isinstance(key, tuple) and not hasattr(obj, "ndim"):
+        for k in key[:-1]:
+            obj = obj[k]
+        key = key[-1]
+    obj[key] = value
+
+
+class DeltaTrace:
+    """Séquence d'étapes stockée sous forme d'état initial + deltas.
+
+    Chaque étape est enregistrée par ``record(changes, **meta)`` où ``changes``
+    est une liste de triplets ``(champ, clé, valeur)``. ``trace[k]`` renvoie un
+    dict contenant une copie de l'état à l'étape k et ses métadonnées.
+    """
+
+    def __init__(self, initial, keyframe_every=KEYFRAME_EVERY):
+        self.keyframe_every = keyframe_every
+        self._head = _snapshot(initial)  # état après la dernière étape
+        self._deltas = []
+        self._meta = []
+        self._keyframes = []
+        self._cursor = None  # (k, état) dernier état reconstruit
+        self._nbytes = 0
+        self._lock = threading.RLock()  # traces partagées entre sessions via le cache
+
+    def record(self, changes=(), **meta):
+        changes = tuple(changes)
+        for field, key, value in changes:
+            _assign(self._head[field], key, value)
+        if len(self._deltas) % self.keyframe_every == 0:
+            self._keyframes.append(_snapshot(self._head))
+            self._nbytes += _sizeof(self._keyframes[-1])
+        self._deltas.append(changes)
+        self._meta.append(meta)
+        self._nbytes += (sys.getsizeof(changes) + sum(sys.getsizeof(c) for c in changes)
+                         + sys.getsizeof(meta) + sum(sys.getsizeof(v) for v in meta.values()))
+
+    @property
+    def nbytes(self):
+        """Estimation de la mémoire occupée par les deltas et keyframes."""
+        return self._nbytes
+
+    def __len__(self):
+        return len(self._deltas)
+
+    def _pull(self, k):
+        """Vrai si l'étape k est disponible (les sous-classes peuvent la calculer)."""
+        return k < len(self._deltas)
+
+    def _index(self, k):
+        if k < 0:
+            k += len(self)
+        if k < 0 or not self._pull(k):
+            raise IndexError(f"étape {k} hors de la trace ({len(self)} étapes)")
+        return k
+
+    def _state_at(self, k):
+        """État (non copié) à l'étape k, depuis le curseur ou la keyframe la plus proche."""
+        base = (k // self.keyframe_every) * self.keyframe_every
+        cursor = self._cursor
+        if cursor is not None and base <= cursor[0] <= k:
+            start, state = cursor
+        else:
+            start, state = base, _snapshot(self._keyframes[base // self.keyframe_every])
+        for d in self._deltas[start + 1 : k + 1]:
+            for field, key, value in d:
+                _assign(state[field], key, value)
+        self._cursor = (k, state)
+        return state
+
+    def __getitem__(self, k):
+        with self._lock:
+            k = self._index(k)
+            return {**_snapshot(self._state_at(k)), **self._meta[k]}
+
+    def __iter__(self):
+        k = 0
+        state = _snapshot(self._keyframes[0]) if self._pull(0) else None  # trace paresseuse : étape 0 d'abord
+        while self._pull(k):
+            if k:
+                for field, key, value in self._deltas[k]:
+                    _assign(state[field], key, value)
+            yield {**_snapshot(state), **self._meta[k]}
+            k += 1
+
+    @property
+    def final(self):
+        """État après la dernière étape (copie)."""
+        return _snapshot(self._head)
+
+    def parts(self):
+        """``(keyframe_every, keyframes, deltas, meta)`` de toute la trace, sans copie (export)."""
+        with self._lock:
+            self._pull(float("inf"))
+            return self.keyframe_every, self._keyframes, self._deltas, self._meta
+
+
+class LazyTrace(DeltaTrace):
+    """DeltaTrace alimentée à la demande par un générateur d'événements.
+
+    ``events`` produit des paires ``(changes, meta)``. Accéder à ``trace[k]``
+    ne fait avancer l'algorithme que jusqu'à l'étape k ; si ``length`` est
+    connu à l'avance, ``len(trace)`` ne déclenche aucun calcul.
+    """
+
+    def __init__(self, initial, events, keyframe_every=KEYFRAME_EVERY, length=None):
+        super().__init__(initial, keyframe_every)
+        self._events = iter(events)
+        self._length = length
+
+    def _pull(self, k):
+        with self._lock:
+            while self._events is not None and len(self._deltas) <= k:
+                try:
+                    changes, meta = next(self._events)
+                except StopIteration:
+                    self._events = None
+                    self._length = len(self._deltas)
+                    break
+                self.record(changes, **meta)
+            return k < len(self._deltas)
+
+    @property
+    def computed(self):
+        """Nombre d'étapes déjà calculées."""
+        return len(self._deltas)
+
+    def __len__(self):
+        if self._length is None:
+            self._pull(float("inf"))
+        return self._length
+
+    @property
+    def final(self):
+        self._pull(float("inf"))
+        return super().final
+
+
+class SortTrace:
+    """Trace d'un tri : tableau initial + journal des écritures, en colonnes int32.
+
+    Chaque étape tient en quelques entiers : type d'étape (``kind``), indices
+    comparés ``i1``/``i2``, zone triée ``[lo, hi)``, deux paramètres libres
+    ``p``/``q`` et ses écritures ``(indice, valeur)``. Le texte de l'étape
+    n'est formaté qu'à la lecture, à partir de ``DESCS[kind]`` et de l'état
+    reconstruit : ``{x}`` et ``{y}`` valent ``a[i1]`` et ``a[i2]``.
+    Une copie du tableau est gardée toutes les ``keyframe_every`` étapes
+    (au moins n, pour que les keyframes ne pèsent pas plus que le journal).
+
+    ``trace[k]`` renvoie le même dict qu'une ``DeltaTrace`` de tri :
+    ``arr``, ``i1``, ``i2``, ``sorted`` (range) et ``desc``.
+    """
+
+    DESCS = (
+        "Comparaison : a[{i1}]={x} et a[{i2}]={y}",
+        "Échange : a[{i1}] ↔ a[{i2}] → {y} avant {x}",
+        "✅ Tableau trié !",
+        "Fusion : comparaison L[{p}]={x} vs R[{q}]={y}",
+        "Sous-tableau [{lo}:{hi}] fusionné",
+        "Pivot choisi : a[{i1}] = {x}",
+        "Comparaison : a[{i1}]={x} vs pivot={y}",
+        "Échange : a[{i1}]={x} ↔ a[{i2}]={y}",
+        "Pivot {x} placé en position {i1} ✓",
+        "Sous-tableau a[{i1}…{i2}] court : tri par insertion",
+        "Insertion : comparaison a[{i1}]={x} et a[{i2}]={y}",
+        "Insertion : {x} recule en a[{i1}]",
+        "Médiane de a[{p}], a[{q}], a[{i1}] : pivot {x} placé en a[{i1}]",
+        "Profondeur {p} dépassée : tri par tas de a[{i1}…{i2}]",
+        "Tas : comparaison a[{i1}]={x} et a[{i2}]={y}",
+        "Tas : échange a[{i1}]={x} ↔ a[{i2}]={y}",
+        "Pivot {p} (médiane de trois) pour a[{i1}…{i2}]",
+        "Comparaison : a[{i1}]={x} vs pivot {p}",
+        "Pivot {p} : {q} valeur(s) égale(s) en place dans [{lo}:{hi}]",
+        "Passe d'écart {p} (Ciura)",
+        "Écart {p} : comparaison a[{i1}]={x} et a[{i2}]={y}",
+        "Écart {p} : {x} recule en a[{i1}]",
+        "Suite croissante repérée : [{lo}:{hi}]",
+        "Suite décroissante [{lo}:{hi}] retournée",
+    )
+    COLUMNS = ("kind", "i1", "i2", "lo", "hi", "p", "q", "moved")
+
+    def __init__(self, arr, capacity=1024, keyframe_every=None):
+        self._head = np.array(arr, dtype=np.int32)
+        self.keyframe_every = keyframe_every or max(KEYFRAME_EVERY, len(self._head))
+        self._cols = {c: np.empty(capacity, np.int32) for c in self.COLUMNS}
+        self._woff = np.zeros(capacity + 1, np.int64)  # écritures de l'étape k : woff[k]:woff[k+1]
+        self._widx = np.empty(capacity, np.int32)
+        self._wval = np.empty(capacity, np.int32)
+        self._keyframes = []
+        self._n = 0
+
+    def _grow(self, steps, writes):
+        if self._n + steps > len(self._woff) - 1:
+            cap = 2 * (len(self._woff) - 1) + steps
+            self._cols = {c: np.resize(v, cap) for c, v in self._cols.items()}
+            self._woff = np.resize(self._woff, cap + 1)
+        if self._woff[self._n] + writes > len(self._widx):
+            cap = 2 * len(self._widx) + writes
+            self._widx, self._wval = np.resize(self._widx, cap), np.resize(self._wval, cap)
+
+    def record(self, kind, i1=-1, i2=-1, lo=0, hi=0, writes=(), p=0, q=0):
+        """Ajoute une étape ; ``writes`` : couples ``(indice, nouvelle valeur)``."""
+        k = self._n
+        self._grow(1, len(writes))
+        w, moved = self._woff[k], 0
+        for idx, val in writes:
+            moved += int(self._head[idx] != val)
+            self._widx[w] = idx
+            self._head[idx] = self._wval[w] = val
+            w += 1
+        self._woff[k + 1] = w
+        for c, v in zip(self.COLUMNS, (kind, i1, i2, lo, hi, p, q, moved)):
+            self._cols[c][k] = v
+        if k % self.keyframe_every == 0:
+            self._keyframes.append(self._head.copy())
+        self._n += 1
+
+    def enter(self, depth):
+        """Entrée à la profondeur ``depth`` de la récursion : ignorée par la trace."""
+
+    def finish(self):
+        """Libère la capacité inutilisée des colonnes ; renvoie la trace."""
+        n, w = self._n, self._woff[self._n]
+        self._cols = {c: v[:n].copy() for c, v in self._cols.items()}
+        self._woff = self._woff[:n + 1].copy()
+        self._widx, self._wval = self._widx[:w].copy(), self._wval[:w].copy()
+        return self
+
+    def parts(self):
+        """``(keyframe_every, tableaux)`` : colonnes, journal et keyframes, pour l'export."""
+        n, w = self._n, self._woff[self._n]
+        arrays = {c: self._cols[c][:n] for c in self.COLUMNS}
+        arrays.update(woff=self._woff[:n + 1], widx=self._widx[:w], wval=self._wval[:w],
+                      keyframes=np.stack(self._keyframes) if self._keyframes
+                      else np.zeros((0, len(self._head)), np.int32))
+        return self.keyframe_every, arrays
+
+    @classmethod
+    def from_parts(cls, keyframe_every, arrays):
+        """Trace relue depuis ``parts()`` ; les tableaux (éventuellement mappés) ne sont pas copiés."""
+        trace = cls(arrays["keyframes"][-1] if len(arrays["keyframes"]) else (), 0, keyframe_every)
+        trace._cols = {c: arrays[c] for c in cls.COLUMNS}
+        trace._woff, trace._widx, trace._wval = arrays["woff"], arrays["widx"], arrays["wval"]
+        trace._keyframes = list(arrays["keyframes"])
+        trace._n = len(trace._woff) - 1
+        return trace
+
+    @property
+    def nbytes(self):
+        return (sum(v.nbytes for v in self._cols.values()) + self._woff.nbytes + self._widx.nbytes
+                + self._wval.nbytes + sum(kf.nbytes for kf in self._keyframes))
+
+    def __len__(self):
+        return self._n
+
+    def column(self, name):
+        """Colonne brute (vue en lecture seule) : ``kind``, ``i1``, ``moved``…"""
+        col = self._cols[name][:self._n].view()
+        col.flags.writeable = False
+        return col
+
+    def changes(self):
+        """Ampleur de chaque étape : valeurs déplacées + variation de la zone triée."""
+        lo, hi = self.column("lo").astype(np.int64), self.column("hi").astype(np.int64)
+        span = np.maximum(hi - lo, 0)
+        return self.column("moved") + np.abs(np.diff(span, prepend=span[:1]))
+
+    def state(self, k):
+        """Tableau (int32) après l'étape k."""
+        k = self._index(k)
+        base = k // self.keyframe_every * self.keyframe_every
+        state = self._keyframes[base // self.keyframe_every].copy()
+        w0, w1 = self._woff[base + 1], self._woff[k + 1]
+        if w1 > w0:  # dernière écriture de chaque indice
+            idx, val = self._widx[w0:w1][::-1], self._wval[w0:w1][::-1]
+            idx, first = np.unique(idx, return_index=True)
+            state[idx] = val[first]
+        return state
+
+    def describe(self, k, state=None):
+        """Texte de l'étape k, formaté à la demande."""
+        k = self._index(k)
+        state = self.state(k) if state is None else state
+        f = {c: int(self._cols[c][k]) for c in ("i1", "i2", "lo", "hi", "p", "q")}
+        x = int(state[f["i1"]]) if f["i1"] >= 0 else None
+        y = int(state[f["i2"]]) if f["i2"] >= 0 else None
+        return self.DESCS[self._cols["kind"][k]].format(x=x, y=y, **f)
+
+    def _index(self, k):
+        if k < 0:
+            k += self._n
+        if not 0 <= k < self._n:
+            raise IndexError(f"étape {k} hors de la trace ({self._n} étapes)")
+        return k
+
+    def _step(self, k, state):
+        c = self._cols
+        return {"arr": state.tolist(), "i1": int(c["i1"][k]), "i2": int(c["i2"][k]),
+                "sorted": range(c["lo"][k], c["hi"][k]), "desc": self.describe(k, state)}
+
+    def __getitem__(self, k):
+        k = self._index(k)
+        return self._step(k, self.state(k))
+
+    def __iter__(self):
+        state = self._keyframes[0].copy() if self._n else None
+        for k in range(self._n):
+            if k:
+                w0, w1 = self._woff[k], self._woff[k + 1]
+                state[self._widx[w0:w1]] = self._wval[w0:w1]  # au plus une écriture par indice
+            yield self._step(k, state)
+
+    @property
+    def final(self):
+        """Tableau trié (copie)."""
+        return self._head.copy()
@@ -0,0 +1,559 @@
+"""Export et relecture binaire des traces d'étapes (NumPy).
+
+Une trace est rangée selon sa nature (``layout`` de l'index) :
+
+- ``sort`` : une ``SortTrace`` garde ses colonnes int32, son journal
+  d'écritures et ses keyframes tels quels ;
+- ``delta`` : une ``DeltaTrace`` (ou ``LazyTrace``) garde ses keyframes, ses
+  changements ``(champ, clé, valeur)`` et ses métadonnées, chacun en table ;
+- ``steps`` : toute autre séquence d'étapes (dicts) est une table.
+
+Une table est rangée par colonnes, une par champ :
+
+- scalaires (booléens, entiers, flottants, éventuellement None) : un tableau
+  de longueur n, plus un masque des None ;
+- ``range`` : ``(start, stop, step)`` ;
+- tableaux et listes numériques de forme constante : un tableau (n, …), ou
+  des keyframes + les cases modifiées à chaque étape si c'est au moins deux
+  fois plus petit ;
+- listes, tuples ou ensembles de longueur variable (nombres ou n-uplets de
+  nombres) et chaînes : valeurs concaténées + décalages (n + 1) ;
+- tout le reste (dicts, objets mixtes) : ``repr`` relu comme un littéral
+  Python (``inf`` et ``nan`` admis, aucun appel), concaténé de la même façon.
+
+Le type des conteneurs (liste, tuple, ensemble, lignes d'une liste de
+listes) est noté dans l'index et rétabli à la relecture.
+
+Deux formats, décrits par le même index JSON :
+
+- ``trace.npz`` : un seul fichier (index dans le membre ``__index__``),
+  chargé colonne par colonne ;
+- un dossier ``index.json`` + un ``.npy`` par tableau, relu par
+  ``np.load(mmap_mode="r")`` : parcourir une trace de plusieurs Go ne charge
+  en mémoire que les pages touchées.
+
+    save(steps, "tri.npz", meta={"page": "tri"})
+    trace = load("tri.npz")
+    trace[42]            # dict de l'étape 42, reconstruit à la demande
+    trace.column("i1")   # tableau brut, pour l'analyse hors ligne
+"""
+import ast
+import io
+import json
+import math
+import os
+from numbers import Integral, Real
+
+import numpy as np
+
+from algolab.core.trace import KEYFRAME_EVERY, DeltaTrace, SortTrace, _assign, _snapshot
+
+FORMAT = "algolab-trace"
+VERSION = 2
+INDEX_NAME = "index.json"
+
+_CONTAINERS = {list: "list", tuple: "tuple", set: "set", frozenset: "set"}
+
+
+# ── Littéraux ─────────────────────────────────────────────────────────────────
+
+_NODES = (ast.Expression, ast.Constant, ast.Tuple, ast.List, ast.Set, ast.Dict,
+          ast.UnaryOp, ast.USub, ast.UAdd, ast.Load)
+_NAMES = {"inf": math.inf, "nan": math.nan}
+
+
+def _literal(text):
+    """``ast.literal_eval`` élargi aux flottants non finis (``repr(inf)``)."""
+    tree = ast.parse(text, mode="eval")
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and node.id in _NAMES:
+            continue
+        if not isinstance(node, _NODES):
+            raise ValueError(f"littéral attendu : {text[:60]}")
+    return eval(compile(tree, "<trace>", "eval"), {"__builtins__": {}}, dict(_NAMES))
+
+
+def _repr(v):
+    return repr(list(v) if isinstance(v, range) else v)
+
+
+# ── Schéma ────────────────────────────────────────────────────────────────────
+
+def _scalar_kind(v):
+    if isinstance(v, (bool, np.bool_)):
+        return "bool"
+    if isinstance(v, Integral):
+        return "int"
+    if isinstance(v, Real):
+        return "float"
+    return None
+
+
+def _merge_scalar(a, b):
+    if a is None or a == b:
+        return b
+    if {a, b} <= {"int", "float"}:
+        return "float"
+    return "pyobj"
+
+
+def _as_array(v):
+    """Tableau numérique pour une séquence de nombres (ou de n-uplets), sinon None."""
+    if hasattr(v, "ndim"):
+        return v if v.dtype.kind in "biuf" else None
+    try:
+        items = sorted(v) if isinstance(v, (set, frozenset)) else v
+        arr = np.asarray(items)
+    except (TypeError, ValueError):  # ensemble non ordonnable, n-uplets inégaux
+        return None
+    return arr if arr.dtype.kind in "biuf" and arr.ndim >= 1 else None
+
+
+def _add_array(c, v):
+    """Intègre une valeur séquence à la colonne ; False si elle ne s'y range pas."""
+    container = "ndarray" if hasattr(v, "ndim") else _CONTAINERS.get(type(v))
+    arr = _as_array(v) if container else None
+    if arr is None or c["kind"] not in (None, "array", "ragged"):
+        return False
+    if c.setdefault("container", container) != container:
+        return False
+    if arr.ndim > 1 and container != "ndarray" and len(v):  # lignes d'une liste de listes
+        row = next(iter(v))
+        inner = "ndarray" if hasattr(row, "ndim") else _CONTAINERS.get(type(row))
+        if c.setdefault("inner", inner) != inner:
+            return False
+    shape = list(arr.shape)
+    if c["kind"] is None:
+        c["kind"], c["shape"] = "array", shape
+    elif c["kind"] == "array" and c["shape"] != shape:
+        c["kind"] = "ragged"
+    if arr.size:  # une séquence vide ne dit rien du type ni de la forme des éléments
+        c["dtype"] = np.result_type(c.get("dtype", arr.dtype), arr.dtype).str
+        if c.setdefault("item_shape", shape[1:]) != shape[1:]:
+            return False
+    if c["kind"] == "array":  # cases modifiées depuis l'étape précédente
+        prev = c.get("prev")
+        c["changed"] += int(np.count_nonzero(prev != arr)) if prev is not None else 0
+        c["prev"] = arr
+    c["size"] += shape[0]
+    return True
+
+
+def _infer(steps):
+    """Premier passage : type de chaque colonne et taille des valeurs concaténées."""
+    cols = {}
+    n = 0
+    for step in steps:
+        n += 1
+        for key, v in step.items():
+            c = cols.setdefault(key, {"kind": None, "null": False, "count": 0, "size": 0, "changed": 0})
+            c["count"] += 1
+            if v is None:
+                c["null"] = True
+            elif c["kind"] == "pyobj":
+                pass
+            elif isinstance(v, range):
+                c["kind"] = "range" if c["kind"] in (None, "range") else "pyobj"
+            elif _scalar_kind(v) is not None:
+                scalar = c["kind"] in (None, "bool", "int", "float")
+                c["kind"] = _merge_scalar(c["kind"], _scalar_kind(v)) if scalar else "pyobj"
+            elif isinstance(v, str):
+                c["kind"] = "str" if c["kind"] in (None, "str") else "pyobj"
+                c["size"] += len(v.encode())
+            elif not _add_array(c, v):
+                c["kind"] = "pyobj"
+    for c in cols.values():
+        c.pop("prev", None)
+        c["kind"] = c["kind"] or "pyobj"  # colonne toujours None
+        if c["kind"] == "array":
+            c.setdefault("dtype", np.dtype(float).str)
+            if not c["null"] and c["count"] == n:
+                _plan_delta(c, n)
+        if c["kind"] == "ragged":
+            c.setdefault("dtype", np.dtype(float).str)
+            c.setdefault("item_shape", [])
+    return cols
+
+
+def _plan_delta(c, n):
+    """Keyframes + cases modifiées si c'est au moins deux fois plus petit que (n, …)."""
+    size, itemsize = int(np.prod(c["shape"])), np.dtype(c["dtype"]).itemsize
+    every = max(KEYFRAME_EVERY, size)
+    idx = np.dtype(np.int32 if size < 2**31 else np.int64)
+    delta = c["changed"] * (idx.itemsize + itemsize) + -(-n // every) * size * itemsize + 8 * (n + 1)
+    if size and delta * 2 <= n * size * itemsize:
+        c["delta"], c["index_dtype"] = every, idx.str
+
+
+# ── Écriture ──────────────────────────────────────────────────────────────────
+
+def _encode(c, v):
+    """Valeur -> (cellule ou tableau) selon le type de colonne."""
+    kind = c["kind"]
+    if kind == "str":
+        return np.frombuffer(v.encode(), dtype=np.uint8)
+    if kind == "pyobj":
+        return np.frombuffer(_repr(v).encode(), dtype=np.uint8)
+    if kind == "range":
+        return (v.start, v.stop, v.step)
+    if kind in ("array", "ragged"):
+        return np.asarray(_as_array(v), dtype=c["dtype"])
+    return v
+
+
+def _columns(steps, cols, alloc, prefix):
+    """Second passage : remplit les tableaux obtenus par ``alloc(nom, forme, dtype)``."""
+    n = len(steps)
+    out, cursors, prev = {}, {}, {}
+    for i, (key, c) in enumerate(cols.items()):
+        p = f"{prefix}{i}"
+        c["file"] = p
+        kind = c["kind"]
+        if kind == "pyobj":  # taille connue seulement maintenant : un passage de plus
+            reprs = (_repr(s[key]) for s in steps if s.get(key) is not None)
+            first = next(reprs, None)
+            try:
+                _literal(first or "None")
+            except (ValueError, SyntaxError):
+                raise TypeError(f"champ {key!r} : valeur non sérialisable ({first[:60]})") from None
+            c["size"] = len(first.encode()) + sum(len(r.encode()) for r in reprs) if first else 0
+        if c["null"] or c["count"] < n:
+            out[p + ".mask"] = alloc(p + ".mask", (n,), np.bool_)
+        if kind in ("bool", "int", "float"):
+            dtype = {"bool": np.bool_, "int": np.int64, "float": np.float64}[kind]
+            out[p + ".values"] = alloc(p + ".values", (n,), dtype)
+        elif kind == "range":
+            out[p + ".values"] = alloc(p + ".values", (n, 3), np.int64)
+        elif kind == "array" and "delta" in c:
+            dtype = np.dtype(c["dtype"])
+            out[p + ".values"] = alloc(p + ".values", (-(-n // c["delta"]), *c["shape"]), dtype)
+            out[p + ".offsets"] = alloc(p + ".offsets", (n + 1,), np.int64)
+            out[p + ".index"] = alloc(p + ".index", (c["changed"],), np.dtype(c["index_dtype"]))
+            out[p + ".changes"] = alloc(p + ".changes", (c["changed"],), dtype)
+            out[p + ".offsets"][:2] = 0
+        elif kind == "array":
+            out[p + ".values"] = alloc(p + ".values", (n, *c["shape"]), np.dtype(c["dtype"]))
+        else:
+            dtype = np.uint8 if kind in ("str", "pyobj") else np.dtype(c["dtype"])
+            out[p + ".values"] = alloc(p + ".values", (c["size"], *c.get("item_shape", [])), dtype)
+            out[p + ".offsets"] = alloc(p + ".offsets", (n + 1,), np.int64)
+            out[p + ".offsets"][0] = 0
+        cursors[key] = 0
+
+    for k, step in enumerate(steps):
+        for key, c in cols.items():
+            p, v = c["file"], step.get(key)
+            if p + ".mask" in out:
+                out[p + ".mask"][k] = v is not None
+            if "delta" in c:
+                arr = _encode(c, v).reshape(-1)
+                if k % c["delta"] == 0:
+                    out[p + ".values"][k // c["delta"]] = arr.reshape(c["shape"])
+                if k:
+                    idx = np.flatnonzero(arr != prev[key])
+                    start = cursors[key]
+                    out[p + ".index"][start:start + len(idx)] = idx
+                    out[p + ".changes"][start:start + len(idx)] = arr[idx]
+                    out[p + ".offsets"][k + 1] = cursors[key] = start + len(idx)
+                prev[key] = arr
+            elif c["kind"] in ("bool", "int", "float", "array", "range"):
+                if v is not None:
+                    out[p + ".values"][k] = _encode(c, v)
+            else:
+                start = cursors[key]
+                cell = _encode(c, v) if v is not None else ()
+                if len(cell):  # une liste vide n'a pas la forme des éléments
+                    out[p + ".values"][start:start + len(cell)] = cell
+                    start += len(cell)
+                out[p + ".offsets"][k + 1] = cursors[key] = start
+    return out
+
+
+_KEEP = ("kind", "file", "null", "dtype", "shape", "item_shape", "container", "inner",
+         "delta", "index_dtype")
+
+
+def _layout(steps):
+    """``(layout, tables, tableaux bruts, champs d'index)`` selon la nature de la trace."""
+    if isinstance(steps, SortTrace):
+        every, arrays = steps.parts()
+        return "sort", {}, {f"sort.{k}": v for k, v in arrays.items()}, {"keyframe_every": every}
+    if isinstance(steps, DeltaTrace):
+        every, keyframes, deltas, meta = steps.parts()
+        changes = [{"field": f, "key": key, "value": v} for d in deltas for f, key, v in d]
+        offsets = np.zeros(len(deltas) + 1, np.int64)
+        np.cumsum([len(d) for d in deltas], out=offsets[1:])
+        tables = {"meta": meta, "keyframes": keyframes, "changes": changes}
+        return "delta", tables, {"delta.offsets": offsets}, {"keyframe_every": every}
+    return "steps", {"steps": steps}, {}, {}
+
+
+def _write(steps, alloc, meta):
+    """Remplit tous les tableaux ; renvoie ``(tableaux, index)``."""
+    layout, tables, arrays, extra = _layout(steps)
+    schemas = {}
+    for name, rows in tables.items():
+        schemas[name] = _infer(rows)
+        arrays.update(_columns(rows, schemas[name], alloc, f"{name}.c"))
+    index = {
+        "format": FORMAT, "version": VERSION, "length": len(steps), "meta": meta or {},
+        "layout": layout, **extra,
+        "tables": {name: {"length": len(tables[name]),
+                          "columns": {key: {f: c[f] for f in _KEEP if f in c} for key, c in cols.items()}}
+                   for name, cols in schemas.items()},
+    }
+    return arrays, index
+
+
+def save(steps, path, meta=None):
+    """Écrit ``steps`` en ``.npz`` (si ``path`` finit par .npz) ou en dossier mappable.
+
+    Une séquence d'étapes est parcourue deux fois (schéma, puis données) ;
+    une ``DeltaTrace`` ou une ``SortTrace`` n'est jamais matérialisée, seuls
+    ses deltas et keyframes sont écrits. Renvoie l'index.
+    """
+    if str(path).endswith(".npz") or hasattr(path, "write"):
+        arrays, index = _write(steps, lambda name, shape, dtype: np.zeros(shape, dtype), meta)
+        arrays["__index__"] = np.frombuffer(json.dumps(index).encode(), dtype=np.uint8)
+        np.savez(path, **arrays)
+        return index
+    os.makedirs(path, exist_ok=True)
+
+    def alloc(name, shape, dtype):
+        return np.lib.format.open_memmap(os.path.join(path, name + ".npy"), mode="w+",
+                                         dtype=dtype, shape=shape)
+
+    arrays, index = _write(steps, alloc, meta)
+    for name, a in arrays.items():
+        if isinstance(a, np.memmap):
+            a.flush()
+        else:  # tableaux bruts (layouts sort et delta)
+            np.save(os.path.join(path, name + ".npy"), a)
+    with open(os.path.join(path, INDEX_NAME), "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=1)
+    return index
+
+
+def to_bytes(steps, meta=None):
+    """Trace encodée en ``.npz``, en mémoire (pour un téléchargement)."""
+    buf = io.BytesIO()
+    save(steps, buf, meta)
+    return buf.getvalue()
+
+
+# ── Lecture ───────────────────────────────────────────────────────────────────
+
+def _nest(x, inner):
+    """Lignes d'une liste de listes (issues de ``tolist``) dans leur conteneur d'origine."""
+    if not isinstance(x, list):
+        return x
+    items = [_nest(y, inner) for y in x]
+    if inner == "ndarray":
+        return np.array(items)
+    return {"tuple": tuple, "set": set}.get(inner, list)(items)
+
+
+class _Table:
+    """Table en colonnes ; ``row(k)`` reconstruit le dict de la ligne k."""
+
+    def __init__(self, schema, array):
+        self.columns, self.length = schema["columns"], schema["length"]
+        self._array = array
+        self._cursors = {}  # colonne en deltas -> (k, état)
+
+    def _value(self, c, k):
+        p = c["file"]
+        mask = self._array(p + ".mask")
+        if mask is not None and not mask[k]:
+            return None
+        values, kind = self._array(p + ".values"), c["kind"]
+        if kind in ("bool", "int", "float"):
+            return values[k].item()
+        if kind == "range":
+            return range(*values[k].tolist())
+        if kind == "array":
+            cell = self._delta_cell(c, k) if "delta" in c else values[k]
+        else:
+            off = self._array(p + ".offsets")
+            cell = values[off[k]:off[k + 1]]
+            if kind == "str":
+                return bytes(cell).decode()
+            if kind == "pyobj":
+                return _literal(bytes(cell).decode())
+        container = c.get("container")
+        if container == "ndarray":
+            return cell
+        items = cell.tolist()
+        if cell.ndim > 1:
+            items = [_nest(x, c.get("inner", "tuple")) for x in items]  # version 1 : n-uplets
+        return {"tuple": tuple, "set": set}.get(container, list)(items)
+
+    def _changes(self, c, state, lo, hi):
+        """Applique les changements des lignes lo … hi-1 (dernière écriture gagnante)."""
+        off = self._array(c["file"] + ".offsets")
+        a, b = off[lo], off[hi]
+        if b > a:
+            idx = self._array(c["file"] + ".index")[a:b][::-1]
+            val = self._array(c["file"] + ".changes")[a:b][::-1]
+            idx, first = np.unique(idx, return_index=True)
+            state.reshape(-1)[idx] = val[first]
+
+    def _delta_cell(self, c, k):
+        every, cursor = c["delta"], self._cursors.get(c["file"])
+        base = k // every * every
+        if cursor is not None and base <= cursor[0] <= k:
+            start, state = cursor
+        else:
+            start, state = base, np.array(self._array(c["file"] + ".values")[k // every])
+        self._changes(c, state, start + 1, k + 1)
+        self._cursors[c["file"]] = (k, state)
+        return state.copy()
+
+    def row(self, k):
+        out = {}
+        for key, c in self.columns.items():
+            v = self._value(c, k)
+            if v is not None or c.get("null") or self._array(c["file"] + ".mask") is None:
+                out[key] = v
+        return out
+
+    def column(self, key):
+        c = self.columns[key]
+        if "delta" not in c:
+            return self._array(c["file"] + ".values")
+        out = np.empty((self.length, *c["shape"]), dtype=c["dtype"])
+        state = np.array(self._array(c["file"] + ".values")[0]) if self.length else None
+        for k in range(self.length):
+            if k % c["delta"] == 0:
+                state = np.array(self._array(c["file"] + ".values")[k // c["delta"]])
+            else:
+                self._changes(c, state, k, k + 1)
+            out[k] = state
+        return out
+
+
+class StoredTrace:
+    """Trace relue depuis un ``.npz`` ou un dossier ; étapes reconstruites à la demande.
+
+    Pour un dossier, les colonnes sont des ``np.memmap`` en lecture seule : les
+    champs « tableau NumPy » d'une étape sont des vues, sans copie. Une trace
+    de tri est relue en ``SortTrace`` sur ses colonnes : ``changes()``,
+    ``state(k)``… restent disponibles.
+    """
+
+    def __init__(self, index, arrays):
+        if index.get("format") != FORMAT:
+            raise ValueError("ce fichier n'est pas une trace algolab")
+        if index.get("version", 0) > VERSION:
+            raise ValueError(f"trace en version {index['version']}, non prise en charge")
+        if "tables" not in index:  # version 1 : une seule table, à la racine
+            index = {**index, "tables": {"steps": {"length": index["length"], "columns": index["columns"]}}}
+        self.index = index
+        self.meta = index["meta"]
+        self.layout = index.get("layout", "steps")
+        self._arrays = arrays  # nom -> tableau ou mapping paresseux (NpzFile)
+        self._cache = {}
+        self._tables = {name: _Table(schema, self._array) for name, schema in index["tables"].items()}
+        self._sort = None
+        if self.layout == "sort":
+            names = (*SortTrace.COLUMNS, "woff", "widx", "wval", "keyframes")
+            self._sort = SortTrace.from_parts(index["keyframe_every"],
+                                              {k: self._array(f"sort.{k}") for k in names})
+        self._cursor = None  # layout delta : (k, état)
+
+    def _array(self, name):
+        arr = self._cache.get(name)
+        if arr is None:
+            try:
+                arr = self._cache[name] = self._arrays[name]
+            except (KeyError, FileNotFoundError):
+                return None
+        return arr
+
+    def __getattr__(self, name):  # changes(), state(k)… d'une trace de tri
+        sort = self.__dict__.get("_sort")
+        if sort is None or name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(sort, name)
+
+    @property
+    def fields(self):
+        if self._sort is not None:
+            return ["arr", "i1", "i2", "sorted", "desc"]
+        if self.layout == "delta":
+            return list(self._tables["keyframes"].columns) + list(self._tables["meta"].columns)
+        return list(self._tables["steps"].columns)
+
+    def _table_of(self, key):
+        return self._tables["meta" if self.layout == "delta" else "steps"]
+
+    def column(self, key):
+        """Tableau brut des valeurs d'un champ (``values`` ; décalages via ``offsets``).
+
+        Trace de tri : colonne int32 (``kind``, ``i1``…) ; colonne en deltas :
+        tableau (n, …) reconstruit.
+        """
+        if self._sort is not None:
+            return self._sort.column(key)
+        return self._table_of(key).column(key)
+
+    def offsets(self, key):
+        table = self._table_of(key)
+        return self._array(table.columns[key]["file"] + ".offsets")
+
+    def __len__(self):
+        return self.index["length"]
+
+    def _state_at(self, k):
+        """Layout delta : état à l'étape k, depuis le curseur ou la keyframe la plus proche."""
+        every, changes = self.index["keyframe_every"], self._tables["changes"]
+        base = k // every * every
+        if self._cursor is not None and base <= self._cursor[0] <= k:
+            start, state = self._cursor
+        else:
+            start, state = base, self._tables["keyframes"].row(k // every)
+        off = self._array("delta.offsets")
+        for j in range(off[start + 1], off[k + 1]):
+            ch = changes.row(j)
+            _assign(state[ch["field"]], ch["key"], ch["value"])
+        self._cursor = (k, state)
+        return state
+
+    def __getitem__(self, k):
+        n = len(self)
+        if k < 0:
+            k += n
+        if not 0 <= k < n:
+            raise IndexError(f"étape {k} hors de la trace ({n} étapes)")
+        if self._sort is not None:
+            return self._sort[k]
+        if self.layout == "delta":
+            return {**_snapshot(self._state_at(k)), **self._tables["meta"].row(k)}
+        return self._tables["steps"].row(k)
+
+    def __iter__(self):
+        if self._sort is not None:
+            yield from self._sort
+            return
+        for k in range(len(self)):
+            yield self[k]
+
+
+def load(path, mmap=True):
+    """Relit une trace : ``.npz`` (fichier ou objet fichier) ou dossier.
+
+    ``mmap`` : pour un dossier, colonnes mappées en mémoire (lecture seule)
+    plutôt que chargées.
+    """
+    if hasattr(path, "read") or str(path).endswith(".npz"):
+        npz = np.load(path)
+        index = json.loads(bytes(npz["__index__"]).decode())
+        return StoredTrace(index, npz)
+    with open(os.path.join(path, INDEX_NAME), encoding="utf-8") as f:
+        index = json.load(f)
+
+    class _Files:
+        def __getitem__(self, name):
+            return np.load(os.path.join(path, name + ".npy"), mmap_mode="r" if mmap else None)
+
+    return StoredTrace(index, _Files())
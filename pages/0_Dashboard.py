@@ -1,94 +1,24 @@
 import streamlit as st
 import plotly.graph_objects as go
-import sys, os, time, random
+from plotly.subplots import make_subplots
+import sys, os, random
 
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils.styles import inject_css, sidebar_nav
+from utils import instrument
+from utils.cache import cache_stats
+from utils import jobs
+from utils.jobs import MAX_WORKERS
+from algolab.bench import classic, history, runner
+from algolab.bench.cases import CASES, BY_NAME
+from algolab.bench.fit import fit_results, geometric_sizes, MODELS
 
 st.set_page_config(
     page_title="Dashboard — Graphix", page_icon="📈", layout="wide"
 )
 inject_css()
 sidebar_nav()
-
-# ── Benchmarks ────────────────────────────────────────────────────────────────
-
-
-def bench_sorts(n=500):
-    import time
-
-    arr = random.sample(range(1, 10000), n)
-
-    def bubble(a):
-        a = a.copy()
-        for i in range(len(a)):
-            for j in range(len(a) - i - 1):
-                if a[j] > a[j + 1]:
-                    a[j], a[j + 1] = a[j + 1], a[j]
-        return a
-
-    def merge(a):
-        if len(a) <= 1:
-            return a
-        m = len(a) // 2
-        return merge_combine(merge(a[:m]), merge(a[m:]))
-
-    def merge_combine(l, r):
-        res, i, j = [], 0, 0
-        while i < len(l) and j < len(r):
-            if l[i] <= r[j]:
-                res.append(l[i])
-                i += 1
-            else:
-                res.append(r[j])
-                j += 1
-        return res + l[i:] + r[j:]
-
-    results = {}
-    for name, fn in [
-        ("Tri Bulles", bubble),
-        ("Tri Fusion", merge),
-        ("Tri Rapide", sorted),
-    ]:
-        t0 = time.perf_counter()
-        fn(arr)
-        results[name] = (time.perf_counter() - t0) * 1000
-    return results
-
-
-def bench_search(n=10000):
-    arr = list(range(n))
-    target = random.randint(0, n - 1)
-
-    def linear(a, t):
-        for x in a:
-            if x == t:
-                return True
-        return False
-
-    def binary(a, t):
-        lo, hi = 0, len(a) - 1
-        while lo <= hi:
-            mid = (lo + hi) // 2
-            if a[mid] == t:
-                return True
-            elif a[mid] < t:
-                lo = mid + 1
-            else:
-                hi = mid - 1
-        return False
-
-    results = {}
-    for name, fn in [
-        ("Recherche Linéaire", linear),
-        ("Recherche Binaire", binary),
-    ]:
-        t0 = time.perf_counter()
-        for _ in range(100):
-            fn(arr, target)
-        results[name] = (time.perf_counter() - t0) * 10  # ms for 1 call
-    return results
-
+instrument.start(__file__)
 
 # ── UI ────────────────────────────────────────────────────────────────────────
 st.markdown(
@@ -100,7 +30,7 @@ st.markdown(
     unsafe_allow_html=True,
 )
 st.markdown(
-    '<div class="page-desc">Comparaison des performances réelles des algorithmes mesurées sur ta machine. Les temps sont en millisecondes, moyennés sur plusieurs exécutions.</div>',
+    '<div class="page-desc">Comparaison des performances réelles des algorithmes mesurées sur ta machine. Les temps sont en millisecondes, moyennés sur plusieurs exécutions ; la mémoire est relevée avec tracemalloc.</div>',
     unsafe_allow_html=True,
 )
 
@@ -209,95 +139,199 @@ for col, (name, color, algos) in zip([p1, p2, p3, p4, p5, p6, p7], paradigms):
 # ── Benchmark Tri ─────────────────────────────────────────────────────────────
 st.markdown("---")
 st.markdown("### ⏱️ Comparateur de performances")
+st.caption(
+    f"Les mesures tournent dans un pool de {MAX_WORKERS} processus, hors de la page : "
+    "elle reste utilisable pendant le calcul, et changer un réglage annule la mesure en cours."
+)
 
-b1, b2 = st.columns(2)
 
-with b1:
-    st.markdown("#### 📊 Algorithmes de Tri")
-    n_sort = st.slider("Taille du tableau", 100, 2000, 500, key="bench_n")
-    if st.button(
-        "🚀 Lancer le benchmark Tri", width="stretch", type="primary"
-    ):
-        with st.spinner("Mesure en cours…"):
-            results = bench_sorts(n_sort)
-        st.session_state.sort_bench = results
-
-    if "sort_bench" in st.session_state:
-        r = st.session_state.sort_bench
-        names = list(r.keys())
-        values = list(r.values())
-        colors = ["#ef4444", "#06b6d4", "#10b981"]
-        fig = go.Figure(
+def bench_figure(r, colors, fmt):
+    """Durée et pic mémoire côte à côte, une barre par algorithme."""
+    names = list(r.keys())
+    fig = make_subplots(rows=1, cols=2, subplot_titles=("Durée (ms)", "Pic mémoire (Ko)"),
+                        horizontal_spacing=0.12)
+    for col, key, label in ((1, "ms", fmt), (2, "peak_kb", "{:.1f} Ko")):
+        values = [r[n][key] for n in names]
+        fig.add_trace(
             go.Bar(
                 x=names,
                 y=values,
-                marker_color=colors,
-                text=[f"{v:.3f} ms" for v in values],
+                marker_color=colors[: len(names)],
+                text=[label.format(v) for v in values],
                 textposition="outside",
                 textfont=dict(color="#e2e8f0", size=11, family="Space Mono"),
-            )
+                customdata=[r[n]["retained_kb"] for n in names],
+                hovertemplate="%{x}<br>%{text}" + ("<br>retenu %{customdata:.1f} Ko" if col == 2 else ""),
+                showlegend=False,
+            ),
+            row=1, col=col,
         )
-        fig.update_layout(
-            paper_bgcolor="#0a0a0f",
-            plot_bgcolor="#111118",
-            font=dict(color="#e2e8f0", family="DM Sans"),
-            xaxis=dict(showgrid=False),
-            yaxis=dict(showgrid=True, gridcolor="#1e1e2e", title="ms"),
-            margin=dict(l=20, r=20, t=20, b=20),
-            height=260,
+    fig.update_layout(
+        paper_bgcolor="#0a0a0f",
+        plot_bgcolor="#111118",
+        font=dict(color="#e2e8f0", family="DM Sans"),
+        margin=dict(l=20, r=20, t=40, b=20),
+        height=300,
+    )
+    fig.update_xaxes(showgrid=False)
+    fig.update_yaxes(showgrid=True, gridcolor="#1e1e2e")
+    fig.update_annotations(font=dict(size=12, color="#94a3b8"))
+    return fig
+
+
+def render_sort_bench(job):
+    if job is None:
+        return
+    if not job.done:
+        st.progress(job.progress, text=f"Mesure en cours… {job.progress:.0%}")
+    r = job.results()
+    if not r:
+        return
+    fig = bench_figure(r, ["#ef4444", "#06b6d4", "#10b981"], "{:.3f} ms")
+    instrument.plotly_chart(fig, width="stretch", key="bench_sort")
+    if job.done and len(r) > 1:
+        ms = {name: m["ms"] for name, m in r.items()}
+        fastest = min(ms, key=ms.get)
+        slowest = max(ms, key=ms.get)
+        ratio = ms[slowest] / ms[fastest]
+        lightest = min(r, key=lambda name: r[name]["peak_kb"])
+        st.markdown(
+            f'<div class="info-box" style="border-left-color:#10b981;">🏆 <b>{fastest}</b> est {ratio:.0f}× plus rapide que <b>{slowest}</b> sur {job.params} éléments ; '
+            f'<b>{lightest}</b> est le plus sobre en mémoire ({r[lightest]["peak_kb"]:.1f} Ko au pic)</div>',
+            unsafe_allow_html=True,
         )
-        st.plotly_chart(fig, width="stretch", key="bench_sort")
-        fastest = min(r, key=r.get)
-        slowest = max(r, key=r.get)
-        ratio = r[slowest] / r[fastest]
+
+
+def render_search_bench(job):
+    if job is None:
+        return
+    if not job.done:
+        st.progress(job.progress, text=f"Mesure en cours… {job.progress:.0%}")
+    r = job.results()
+    if not r:
+        return
+    fig2 = bench_figure(r, ["#ef4444", "#10b981"], "{:.4f} ms")
+    instrument.plotly_chart(fig2, width="stretch", key="bench_search")
+    values = [m["ms"] for m in r.values()]
+    if job.done and len(values) == 2 and values[1] > 0:
+        ratio = values[0] / values[1]
         st.markdown(
-            f'<div class="info-box" style="border-left-color:#10b981;">🏆 <b>{fastest}</b> est {ratio:.0f}× plus rapide que <b>{slowest}</b> sur {n_sort} éléments</div>',
+            f'<div class="info-box" style="border-left-color:#06b6d4;">🏆 La recherche binaire est <b>{ratio:.0f}×</b> plus rapide sur {job.params:,} éléments</div>',
             unsafe_allow_html=True,
         )
 
+
+b1, b2 = st.columns(2)
+
+with b1:
+    st.markdown("#### 📊 Algorithmes de Tri")
+    n_sort = st.slider("Taille du tableau", 100, 2000, 500, key="bench_n")
+    sort_job = jobs.current("sort_bench", n_sort)
+    if st.button(
+        "🚀 Lancer le benchmark Tri", width="stretch", type="primary"
+    ):
+        seed = random.randrange(2**32)
+        sort_job = jobs.submit(
+            "sort_bench", n_sort,
+            [(name, classic.time_sort, (name, n_sort, seed)) for name in classic.SORTS],
+        )
+    jobs.live(sort_job, render_sort_bench)
+
 with b2:
     st.markdown("#### 🔍 Recherche Linéaire vs Binaire")
     n_search = st.slider(
         "Taille du tableau trié", 1000, 50000, 10000, step=1000, key="bench_ns"
     )
+    search_job = jobs.current("search_bench", n_search)
     if st.button(
         "🚀 Lancer le benchmark Recherche", width="stretch", type="primary"
     ):
-        with st.spinner("Mesure en cours…"):
-            results_s = bench_search(n_search)
-        st.session_state.search_bench = results_s
-
-    if "search_bench" in st.session_state:
-        r = st.session_state.search_bench
-        names = list(r.keys())
-        values = list(r.values())
-        colors = ["#ef4444", "#10b981"]
-        fig2 = go.Figure(
-            go.Bar(
-                x=names,
-                y=values,
-                marker_color=colors,
-                text=[f"{v:.4f} ms" for v in values],
-                textposition="outside",
-                textfont=dict(color="#e2e8f0", size=11, family="Space Mono"),
-            )
+        target = random.randint(0, n_search - 1)
+        search_job = jobs.submit(
+            "search_bench", n_search,
+            [(name, classic.time_search, (name, n_search, target)) for name in classic.SEARCHES],
         )
-        fig2.update_layout(
-            paper_bgcolor="#0a0a0f",
-            plot_bgcolor="#111118",
-            font=dict(color="#e2e8f0", family="DM Sans"),
-            xaxis=dict(showgrid=False),
-            yaxis=dict(showgrid=True, gridcolor="#1e1e2e", title="ms"),
-            margin=dict(l=20, r=20, t=20, b=20),
-            height=260,
-        )
-        st.plotly_chart(fig2, width="stretch", key="bench_search")
-        if values[0] > 0:
-            ratio = values[0] / values[1]
-            st.markdown(
-                f'<div class="info-box" style="border-left-color:#06b6d4;">🏆 La recherche binaire est <b>{ratio:.0f}×</b> plus rapide sur {n_search:,} éléments</div>',
-                unsafe_allow_html=True,
-            )
+    jobs.live(search_job, render_search_bench)
+
+# ── Tri fusion parallèle ──────────────────────────────────────────────────────
+st.markdown("#### ⚡ Tri fusion parallèle — accélération selon le nombre de workers")
+st.markdown(
+    '<div class="info-box">Le tableau est placé en mémoire partagée ; chaque worker trie son morceau sur place, puis les morceaux sont fusionnés deux à deux en arbre. Le dernier tour de fusion n\'occupe plus qu\'un worker : cette part séquentielle borne l\'accélération (loi d\'Amdahl).</div>',
+    unsafe_allow_html=True,
+)
+PAR_SIZES = {10**6: "10⁶", 10**7: "10⁷", 3 * 10**7: "3·10⁷", 10**8: "10⁸"}
+CPUS = os.cpu_count() or 1
+p1, p2 = st.columns([3, 1])
+with p1:
+    n_par = st.select_slider("Nombre d'entiers", list(PAR_SIZES), 10**7, key="par_n",
+                             format_func=PAR_SIZES.get)
+with p2:
+    max_par = st.selectbox("Workers max", [1, 2, 4, 8, 16], index=2, key="par_max")
+par_workers = tuple(w for w in (1, 2, 4, 8, 16) if w <= max_par)
+st.caption(f"≈ {n_par * 4 * 4 / 2**20:,.0f} Mo de mémoire au pic (int32 : entrée, deux tampons "
+           f"partagés, sortie) ; {CPUS} cœur(s) sur cette machine.")
+par_params = (n_par, par_workers)
+par_job = jobs.current("par_sort", par_params)
+if st.button("⚡ Mesurer le passage à l'échelle", width="stretch", type="primary"):
+    par_job = jobs.submit(
+        "par_sort", par_params,
+        [("scaling", classic.time_parallel_sort, (n_par, par_workers, random.randrange(2**32)))],
+    )
+
+
+def render_parallel(job):
+    if job is None:
+        return
+    if not job.done:
+        st.progress(job.progress, text="Mesure en cours… (un pool par nombre de workers)")
+    for err in job.errors().values():
+        st.error(f"Mesure impossible : {err}")
+    r = job.results().get("scaling")
+    if not r:
+        return
+    rows = r["rows"]
+    ws = [row["workers"] for row in rows]
+    fig = make_subplots(rows=1, cols=2, subplot_titles=("Accélération", "Phases (ms)"),
+                        horizontal_spacing=0.12)
+    fig.add_trace(go.Scatter(x=ws, y=ws, mode="lines", name="idéale",
+                             line=dict(color="#64748b", dash="dot")), row=1, col=1)
+    if r["fraction"] is not None:
+        f = r["fraction"]
+        fig.add_trace(go.Scatter(x=ws, y=[1 / (f + (1 - f) / p) for p in ws], mode="lines",
+                                 name=f"Amdahl f = {f:.2f}", line=dict(color="#f59e0b", width=1)),
+                      row=1, col=1)
+    fig.add_trace(go.Scatter(x=ws, y=[row["speedup"] for row in rows], mode="lines+markers",
+                             name="mesurée", line=dict(color="#06b6d4", width=2),
+                             hovertemplate="%{x} workers<br>×%{y:.2f}<extra></extra>"), row=1, col=1)
+    for key, label, color in (("copy", "copie", "#64748b"), ("sort", "tri des morceaux", "#10b981"),
+                              ("merge", "fusions", "#ef4444")):
+        fig.add_trace(go.Bar(x=[str(w) for w in ws], y=[row[key] for row in rows], name=label,
+                             marker_color=color, hovertemplate="%{y:.1f} ms"), row=1, col=2)
+    fig.update_layout(
+        barmode="stack",
+        paper_bgcolor="#0a0a0f",
+        plot_bgcolor="#111118",
+        font=dict(color="#e2e8f0", family="DM Sans"),
+        legend=dict(bgcolor="#111118", bordercolor="#1e1e2e", orientation="h", y=-0.2),
+        margin=dict(l=20, r=20, t=40, b=20),
+        height=340,
+    )
+    fig.update_xaxes(title_text="workers", showgrid=False)
+    fig.update_yaxes(showgrid=True, gridcolor="#1e1e2e")
+    fig.update_annotations(font=dict(size=12, color="#94a3b8"))
+    instrument.plotly_chart(fig, width="stretch", key="bench_parallel")
+    best = max(rows, key=lambda row: row["speedup"])
+    note = f" ; part séquentielle estimée <b>f = {r['fraction']:.2f}</b>" if r["fraction"] is not None else ""
+    st.markdown(
+        f'<div class="info-box" style="border-left-color:#06b6d4;">⚡ <b>×{best["speedup"]:.2f}</b> avec {best["workers"]} workers '
+        f'({best["total"]:.0f} ms contre {rows[0]["total"]:.0f} ms seul, <code>np.sort</code> : {r["numpy_ms"]:.0f} ms) sur {r["n"]:,} entiers{note}</div>',
+        unsafe_allow_html=True,
+    )
+    if max(ws) > CPUS:
+        st.caption(f"⚠️ Plus de workers que de cœurs ({CPUS}) : au-delà, ils se partagent le processeur.")
+
+
+jobs.live(par_job, render_parallel)
 
 # ── Complexités ───────────────────────────────────────────────────────────────
 st.markdown("---")
@@ -338,4 +372,194 @@ fig3.update_layout(
     margin=dict(l=40, r=20, t=20, b=40),
     height=320,
 )
-st.plotly_chart(fig3, width="stretch", key="complexity_chart")
+instrument.plotly_chart(fig3, width="stretch", key="complexity_chart")
+
+# ── Complexité mesurée ────────────────────────────────────────────────────────
+st.markdown("#### 🔬 Complexité mesurée sur ta machine")
+st.markdown(
+    '<div class="info-box">Chaque algorithme est chronométré sur des tailles doublées à chaque pas, puis ajusté à O(1), O(log n), O(n), O(n log n) et O(n²). Un appel supplémentaire sous tracemalloc relève le pic de mémoire et ce que la trace renvoyée garde en vie. Un écart avec la complexité théorique trahit souvent des copies cachées (instantanés de listes à chaque étape…).</div>',
+    unsafe_allow_html=True,
+)
+f1, f2 = st.columns([3, 1])
+with f1:
+    fit_cases = st.multiselect(
+        "Algorithmes",
+        [c.name for c in CASES],
+        default=["bubble_sort", "merge_sort", "heap_sort", "dijkstra"],
+        key="fit_cases",
+    )
+with f2:
+    fit_count = st.slider("Nombre de tailles", 4, 6, 4, key="fit_count")
+fit_params = (tuple(fit_cases), fit_count)
+fit_job = jobs.current("fit_bench", fit_params)
+if st.button("🔬 Mesurer et ajuster", width="stretch", type="primary"):
+    fit_job = jobs.submit(
+        "fit_bench", fit_params,
+        [
+            ((name, n), runner.time_named, (name, n, 3, 1))
+            for name in fit_cases
+            for n in geometric_sizes(BY_NAME[name].sizes[0], fit_count)
+        ],
+    )
+
+
+def render_fit(job):
+    if job is None:
+        return
+    if not job.done:
+        st.progress(job.progress, text=f"Mesure en cours… {job.progress:.0%}")
+    fit_runs = list(job.results().values())
+    if job.done and getattr(job, "run_id", None) is None:
+        job.run_id = history.record(fit_runs, label="dashboard")
+    fits = fit_results(fit_runs)
+    if not fits:
+        return
+    palette = ["#7c3aed", "#06b6d4", "#10b981", "#f59e0b", "#ef4444", "#ec4899"]
+    fig4, fig_mem = go.Figure(), go.Figure()
+    rows = []
+    for i, (name, (best, models)) in enumerate(fits.items()):
+        color = palette[i % len(palette)]
+        pts = sorted((r["n"], r["median_ms"], r["peak_kb"], r["retained_kb"])
+                     for r in fit_runs if r["case"] == name)
+        ns = [p[0] for p in pts]
+        c, err = models[best]
+        fig4.add_trace(go.Scatter(x=ns, y=[p[1] for p in pts], name=name, mode="markers",
+                                  marker=dict(color=color, size=9)))
+        fig4.add_trace(go.Scatter(x=ns, y=[c * MODELS[best](n) for n in ns], name=f"{name} ~ {best}",
+                                  mode="lines", line=dict(color=color, width=2, dash="dash"),
+                                  showlegend=False))
+        fig_mem.add_trace(go.Scatter(x=ns, y=[p[2] for p in pts], name=name, mode="lines+markers",
+                                     line=dict(color=color, width=2), marker=dict(size=8)))
+        fig_mem.add_trace(go.Scatter(x=ns, y=[max(p[3], 1e-3) for p in pts], name=f"{name} (retenu)",
+                                     mode="lines", line=dict(color=color, width=1, dash="dot"),
+                                     showlegend=False))
+        n_max, _, peak, kept = pts[-1]
+        rows.append(f"<tr><td><b>{name}</b></td><td>{best}</td><td>{c:.3g} ms</td><td>{err:.0%}</td>"
+                    f"<td>{peak:,.0f} Ko</td><td>{kept:,.0f} Ko</td><td>{n_max}</td></tr>")
+    fig4.update_layout(
+        paper_bgcolor="#0a0a0f",
+        plot_bgcolor="#111118",
+        font=dict(color="#e2e8f0", family="DM Sans"),
+        xaxis=dict(title="n (log)", type="log", showgrid=True, gridcolor="#1e1e2e"),
+        yaxis=dict(title="médiane (ms, log)", type="log", showgrid=True, gridcolor="#1e1e2e"),
+        legend=dict(bgcolor="#111118", bordercolor="#1e1e2e"),
+        margin=dict(l=40, r=20, t=20, b=40),
+        height=340,
+    )
+    fig_mem.update_layout(
+        paper_bgcolor="#0a0a0f",
+        plot_bgcolor="#111118",
+        font=dict(color="#e2e8f0", family="DM Sans"),
+        xaxis=dict(title="n (log)", type="log", showgrid=True, gridcolor="#1e1e2e"),
+        yaxis=dict(title="pic ─ / retenu ··· (Ko, log)", type="log", showgrid=True, gridcolor="#1e1e2e"),
+        legend=dict(bgcolor="#111118", bordercolor="#1e1e2e"),
+        margin=dict(l=40, r=20, t=20, b=40),
+        height=340,
+    )
+    m1, m2 = st.columns(2)
+    with m1:
+        instrument.plotly_chart(fig4, width="stretch", key="fit_chart")
+    with m2:
+        instrument.plotly_chart(fig_mem, width="stretch", key="fit_mem_chart")
+    st.markdown(
+        '<table style="width:100%;font-size:0.9rem;"><tr><th>Algorithme</th><th>Meilleur modèle</th>'
+        "<th>Constante c</th><th>Erreur relative</th><th>Pic mémoire</th><th>Retenu par la trace</th>"
+        "<th>à n =</th></tr>" + "".join(rows) + "</table>",
+        unsafe_allow_html=True,
+    )
+
+
+jobs.live(fit_job, render_fit)
+
+# ── Historique ────────────────────────────────────────────────────────────────
+st.markdown("#### 📜 Historique et régressions")
+hist_cases = history.cases()
+if not hist_cases:
+    st.markdown(
+        '<div class="info-box">Aucune mesure enregistrée. Lance « Mesurer et ajuster » ci-dessus ou <code>python -m algolab.bench --record</code>.</div>',
+        unsafe_allow_html=True,
+    )
+else:
+    h_case = st.selectbox("Algorithme", hist_cases, key="hist_case")
+    hist = history.trend(h_case)
+    if not hist:
+        st.markdown(
+            '<div class="info-box">Aucune mesure de cet algorithme sur cette machine avec cette version de Python.</div>',
+            unsafe_allow_html=True,
+        )
+    else:
+        fig5 = go.Figure()
+        palette = ["#7c3aed", "#06b6d4", "#10b981", "#f59e0b", "#ef4444", "#ec4899"]
+        for i, n in enumerate(sorted({r["n"] for r in hist})):
+            pts = [r for r in hist if r["n"] == n]
+            fig5.add_trace(
+                go.Scatter(
+                    x=[r["timestamp"] for r in pts],
+                    y=[r["median_ms"] for r in pts],
+                    customdata=[[r["git_rev"], r["p95_ms"]] for r in pts],
+                    hovertemplate="%{x}<br>médiane %{y:.3f} ms · p95 %{customdata[1]:.3f} ms<br>rév. %{customdata[0]}",
+                    name=f"n={n}",
+                    mode="lines+markers",
+                    line=dict(color=palette[i % len(palette)], width=2),
+                )
+            )
+        fig5.update_layout(
+            paper_bgcolor="#0a0a0f",
+            plot_bgcolor="#111118",
+            font=dict(color="#e2e8f0", family="DM Sans"),
+            xaxis=dict(showgrid=True, gridcolor="#1e1e2e"),
+            yaxis=dict(title="médiane (ms)", type="log", showgrid=True, gridcolor="#1e1e2e"),
+            legend=dict(bgcolor="#111118", bordercolor="#1e1e2e"),
+            margin=dict(l=40, r=20, t=20, b=40),
+            height=300,
+        )
+        instrument.plotly_chart(fig5, width="stretch", key="history_chart")
+
+    flagged = history.regressions()
+    if flagged:
+        for f in flagged:
+            st.markdown(
+                f'<div class="info-box" style="border-left-color:#ef4444;">🐢 <b>{f["case"]}</b> (n={f["n"]}) : '
+                f'{f["baseline_ms"]:.2f} → {f["current_ms"]:.2f} ms (×{f["ratio"]:.2f}, p={f["p"]:.3f}) '
+                f'— révision {f["baseline_rev"]} → {f["current_rev"]}</div>',
+                unsafe_allow_html=True,
+            )
+    else:
+        st.markdown(
+            '<div class="info-box" style="border-left-color:#10b981;">✅ Dernière exécution : aucun ralentissement significatif (Mann-Whitney, p &lt; 0,05) par rapport aux précédentes.</div>',
+            unsafe_allow_html=True,
+        )
+
+# ── Cache de calcul ───────────────────────────────────────────────────────────
+st.markdown("---")
+st.markdown("### 🗄️ Cache des calculs")
+cs = cache_stats()
+lookups = cs["hits"] + cs["misses"]
+k1, k2, k3, k4 = st.columns(4)
+k1.metric("Taux de succès", f"{cs['hits'] / lookups:.0%}" if lookups else "—")
+k2.metric("Entrées", cs["entries"])
+k3.metric("Mémoire", f"{cs['bytes'] / 2**20:.1f} / {cs['budget_bytes'] / 2**20:.0f} Mo")
+k4.metric("Évictions", cs["evictions"])
+
+# ── Rendu des pages ───────────────────────────────────────────────────────────
+st.markdown("---")
+st.markdown("### ⏱️ Rendu des pages")
+render_rows = instrument.summary()
+if not render_rows:
+    st.markdown(
+        '<div class="info-box">Aucune mesure pour l\'instant : chaque page visitée chronomètre son calcul, la construction de ses figures et leur envoi au navigateur.</div>',
+        unsafe_allow_html=True,
+    )
+else:
+    st.markdown(
+        '<table style="width:100%;font-size:0.9rem;"><tr><th>Page</th><th>Phase</th><th>Appels</th>'
+        "<th>Moyenne</th><th>Max</th><th>Cumul</th><th>Poids max</th></tr>"
+        + "".join(
+            f"<tr><td>{r['page']}</td><td>{r['phase']}</td><td>{r['calls']}</td>"
+            f"<td>{r['mean_ms']:.1f} ms</td><td>{r['max_ms']:.1f} ms</td><td>{r['total_ms']:.0f} ms</td>"
+            f"<td>{instrument.format_bytes(r['max_bytes'])}</td></tr>"
+            for r in render_rows[:15]
+        )
+        + "</table>",
+        unsafe_allow_html=True,
+    )
@@ -1,77 +1,21 @@
 import streamlit as st
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import heapq, sys, os
+import sys, os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils.styles import inject_css, sidebar_nav
+from utils import instrument
+from utils.cache import cached
+from algolab.core import huffman
 
 st.set_page_config(page_title="Huffman — Graphix", page_icon="📦", layout="wide")
 inject_css()
 sidebar_nav()
+instrument.start(__file__)
 
 # ── Algorithme ────────────────────────────────────────────────────────────────
+build_huffman = cached(huffman.build_huffman)
 
-class HNode:
-    def __init__(self, char, freq, left=None, right=None):
-        self.char  = char
-        self.freq  = freq
-        self.left  = left
-        self.right = right
-    def __lt__(self, other): return self.freq < other.freq
-
-def build_huffman(text):
-    freq = {}
-    for c in text: freq[c] = freq.get(c, 0) + 1
-
-    heap = [HNode(c, f) for c, f in sorted(freq.items())]
-    heapq.heapify(heap)
-
-    # Snapshots à chaque fusion
-    snapshots = []
-    snapshots.append({
-        "heap": [(n.char, n.freq) for n in sorted(heap, key=lambda x: x.freq)],
-        "desc": f"File initiale : {len(heap)} symboles — on fusionne toujours les 2 moins fréquents",
-        "step": "init"
-    })
-
-    while len(heap) > 1:
-        left  = heapq.heappop(heap)
-        right = heapq.heappop(heap)
-        merged = HNode(f"{left.char}+{right.char}", left.freq + right.freq, left, right)
-        heapq.heappush(heap, merged)
-        snapshots.append({
-            "heap": [(n.char, n.freq) for n in sorted(heap, key=lambda x: x.freq)],
-            "desc": f"Fusion : <b>{left.char}</b>({left.freq}) + <b>{right.char}</b>({right.freq}) → nœud interne ({merged.freq})",
-            "merged_left": left.char,
-            "merged_right": right.char,
-            "merged_freq": merged.freq,
-            "step": "merge"
-        })
-
-    root = heap[0]
-
-    # Générer les codes
-    codes = {}
-    def build_codes(node, prefix=""):
-        if node is None: return
-        if node.left is None and node.right is None:
-            codes[node.char] = prefix or "0"
-            return
-        build_codes(node.left,  prefix + "0")
-        build_codes(node.right, prefix + "1")
-    build_codes(root)
-
-    snapshots.append({
-        "heap": [],
-        "desc": "✅ Arbre complet — codes assignés. Les symboles fréquents ont les codes les plus courts.",
-        "step": "done", "codes": codes
-    })
-
-    orig_bits = len(text) * 8
-    comp_bits = sum(len(codes[c]) * freq[c] for c in freq)
-    ratio     = (1 - comp_bits / orig_bits) * 100 if orig_bits > 0 else 0
-
-    return snapshots, freq, codes, root, orig_bits, comp_bits, ratio
 
 # ── Visualisation ─────────────────────────────────────────────────────────────
 
@@ -247,18 +191,18 @@ with col_viz:
     st.markdown("##### 📋 File de priorité (min-heap)")
     hl = s.get("merged_left")
     hr = s.get("merged_right")
-    st.plotly_chart(make_queue_bar(s["heap"], hl, hr), width='stretch', key=f"hf_queue_{step_idx}")
+    instrument.plotly_chart(make_queue_bar(s["heap"], hl, hr), width='stretch', key=f"hf_queue_{step_idx}")
 
     st.markdown("##### 📊 Fréquences & Codes Huffman")
     # Codes finaux toujours visibles (pour comprendre l'objectif)
-    st.plotly_chart(make_freq_bar(freq, codes, {hl, hr} if hl else None),
+    instrument.plotly_chart(make_freq_bar(freq, codes, {hl, hr} if hl else None),
                     width='stretch', key=f"hf_freq_{step_idx}")
 
     # Encodage visuel
     st.markdown("##### 🔢 Flux de bits encodé (30 premiers caractères)")
     enc_fig = make_encoding_visual(text, codes)
     if enc_fig:
-        st.plotly_chart(enc_fig, width='stretch', key=f"hf_enc_{step_idx}")
+        instrument.plotly_chart(enc_fig, width='stretch', key=f"hf_enc_{step_idx}")
 
     # Table des codes
     st.markdown("---")
@@ -1,65 +1,24 @@
 import streamlit as st
 import plotly.graph_objects as go
-import math, sys, os
+import sys, os
 
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils.styles import inject_css, sidebar_nav
+from utils import instrument
+from utils.cache import cached
+from algolab.core import crypto
+from algolab.core.crypto import cesar_encode
 
 st.set_page_config(
     page_title="Chiffrement — Graphix", page_icon="🔐", layout="wide"
 )
 inject_css()
 sidebar_nav()
+instrument.start(__file__)
 
 # ── César ─────────────────────────────────────────────────────────────────────
-
-
-def cesar_encode(text, shift):
-    result = []
-    for ch in text:
-        if ch.isalpha():
-            base = ord("A") if ch.isupper() else ord("a")
-            result.append(chr((ord(ch) - base + shift) % 26 + base))
-        else:
-            result.append(ch)
-    return "".join(result)
-
-
-def cesar_steps(text, shift):
-    steps = []
-    result = []
-    for i, ch in enumerate(text):
-        if ch.isalpha():
-            base = ord("A") if ch.isupper() else ord("a")
-            orig_pos = ord(ch) - base
-            enc_pos = (orig_pos + shift) % 26
-            enc = chr(enc_pos + base)
-            result.append(enc)
-            steps.append(
-                {
-                    "index": i,
-                    "char": ch,
-                    "encoded": enc,
-                    "orig_pos": orig_pos,
-                    "enc_pos": enc_pos,
-                    "result_so_far": "".join(result),
-                    "desc": f"'{ch}' (position {orig_pos}) + décalage {shift} mod 26 = position {enc_pos} → '<b>{enc}</b>'",
-                }
-            )
-        else:
-            result.append(ch)
-            steps.append(
-                {
-                    "index": i,
-                    "char": ch,
-                    "encoded": ch,
-                    "orig_pos": None,
-                    "enc_pos": None,
-                    "result_so_far": "".join(result),
-                    "desc": f"'{ch}' — non alphabétique, conservé tel quel",
-                }
-            )
-    return steps
+cesar_steps = cached(crypto.cesar_steps)
+rsa_compute = cached(crypto.rsa_compute)
 
 
 def make_cesar_grid(text, shift, current_index):
@@ -186,42 +145,6 @@ def make_cesar_progress(text, step_idx, steps):
 # ── RSA ───────────────────────────────────────────────────────────────────────
 
 
-def is_prime(n):
-    if n < 2:
-        return False
-    for i in range(2, int(n**0.5) + 1):
-        if n % i == 0:
-            return False
-    return True
-
-
-def mod_inverse(e, phi):
-    for d in range(2, phi):
-        if (e * d) % phi == 1:
-            return d
-    return None
-
-
-def rsa_compute(p, q, message):
-    n = p * q
-    phi = (p - 1) * (q - 1)
-    e = next(c for c in range(2, phi) if math.gcd(c, phi) == 1)
-    d = mod_inverse(e, phi)
-
-    enc_pairs = []
-    dec_pairs = []
-    for ch in message:
-        m = ord(ch)
-        if m < n:
-            c = pow(m, e, n)
-            enc_pairs.append((ch, m, c))
-    for ch, m, c in enc_pairs:
-        m2 = pow(c, d, n)
-        dec_pairs.append((c, m2, chr(m2)))
-
-    return n, phi, e, d, enc_pairs, dec_pairs
-
-
 def make_rsa_flow(enc_pairs, dec_pairs, e, d, n, highlight_idx=None):
     """Visualisation du flux M → C → M en barres groupées."""
     if not enc_pairs:
@@ -370,7 +293,7 @@ with tab1:
         )
 
         st.markdown("##### 🔤 Correspondance alphabets (original → chiffré)")
-        st.plotly_chart(
+        instrument.plotly_chart(
             make_cesar_grid(text_c, shift_c, step_idx),
             width="stretch",
             key=f"cesar_grid_{step_idx}",
@@ -379,7 +302,7 @@ with tab1:
         st.markdown("##### 📝 Texte en cours de chiffrement")
         prog_fig = make_cesar_progress(text_c, step_idx, steps_c)
         if prog_fig:
-            st.plotly_chart(
+            instrument.plotly_chart(
                 prog_fig, width="stretch", key=f"cesar_prog_{step_idx}"
             )
 
@@ -484,7 +407,7 @@ with tab2:
                 enc_pairs, dec_pairs, e_r, d_r, n_r, hl_idx
             )
             if rsa_fig:
-                st.plotly_chart(
+                instrument.plotly_chart(
                     rsa_fig, width="stretch", key=f"rsa_flow_{hl_idx}"
                 )
 
@@ -2,10 +2,12 @@ import streamlit as st
 import random, sys, os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils.styles import inject_css, sidebar_nav
+from utils import instrument
 
 st.set_page_config(page_title="Quiz — Graphix", page_icon="🎓", layout="wide")
 inject_css()
 sidebar_nav()
+instrument.start(__file__)
 
 # ── Banque de questions ───────────────────────────────────────────────────────
 
@@ -3,49 +3,18 @@ import plotly.graph_objects as go
 import random, sys, os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils.styles import inject_css, sidebar_nav
+from utils import instrument, traces
+from utils.cache import cached
+from algolab.core import sorting
 
 st.set_page_config(page_title="Heap Sort — Graphix", page_icon="🌲", layout="wide")
 inject_css()
 sidebar_nav()
+instrument.start(__file__)
 
 # ── Algorithme ────────────────────────────────────────────────────────────────
+heap_sort_steps = cached(sorting.heap_sort_steps)
 
-def heap_sort_steps(arr):
-    a = arr.copy()
-    n = len(a)
-    steps = []
-
-    def record(phase, heap_end, active=None, desc=""):
-        steps.append({"arr": a.copy(), "heap_end": heap_end,
-                      "active": active or [], "phase": phase, "desc": desc})
-
-    def heapify(n_heap, i):
-        largest, left, right = i, 2*i+1, 2*i+2
-        if left  < n_heap and a[left]  > a[largest]: largest = left
-        if right < n_heap and a[right] > a[largest]: largest = right
-        if largest != i:
-            record("build", n_heap, [i, largest],
-                   f"Sift-down : échange <b>{a[i]}</b> ↔ <b>{a[largest]}</b> — parent trop petit")
-            a[i], a[largest] = a[largest], a[i]
-            heapify(n_heap, largest)
-
-    record("build", n, [], "Tableau initial — on va construire le max-heap")
-    for i in range(n//2 - 1, -1, -1):
-        heapify(n, i)
-        record("build", n, [i], f"Heapify à l'index {i} — racine actuelle = <b>{a[0]}</b>")
-
-    record("build", n, [0], f"✅ Max-heap construit — la racine <b>{a[0]}</b> est le plus grand élément")
-
-    for i in range(n-1, 0, -1):
-        record("extract", i+1, [0, i],
-               f"Extraction : <b>{a[0]}</b> (max) échangé avec la position {i}")
-        a[0], a[i] = a[i], a[0]
-        heapify(i, 0)
-        if i > 1:
-            record("extract", i, [0], f"Sift-down — tas réduit à {i} éléments, nouvelle racine = <b>{a[0]}</b>")
-
-    record("done", 0, list(range(n)), "✅ Tableau entièrement trié !")
-    return steps
 
 # ── Visualisation arbre ───────────────────────────────────────────────────────
 
@@ -167,7 +136,9 @@ with col_ctrl:
         st.session_state.hs_arr = random.sample(range(1, 99), n_size)
 
     arr   = st.session_state.hs_arr
-    steps = heap_sort_steps(arr)
+    with instrument.phase("calcul"):
+        steps = heap_sort_steps(arr)
+    steps = traces.panel("heapsort", steps)
 
     n_build   = sum(1 for s in steps if s["phase"] == "build")
     n_extract = sum(1 for s in steps if s["phase"] == "extract")
@@ -194,8 +165,9 @@ with col_ctrl:
 with col_viz:
     st.markdown("##### 📊 Animation — Barres")
     st.markdown("*Appuie sur **▶ Démarrer** ou déplace le slider pour naviguer étape par étape*")
-    fig = make_animated_fig(steps)
-    st.plotly_chart(fig, use_container_width=True, key=f"hs_anim_{seed}_{n_size}")
+    with instrument.phase("figure"):
+        fig = make_animated_fig(steps)
+    instrument.plotly_chart(fig, use_container_width=True, key=f"hs_anim_{seed}_{n_size}")
 
     st.markdown("---")
     st.markdown("##### 🌲 Structure du tas — Vue arbre")
@@ -212,5 +184,5 @@ with col_viz:
         yaxis=dict(showgrid=False, showticklabels=False, zeroline=False),
         margin=dict(l=20, r=20, t=10, b=20), height=300,
     )
-    st.plotly_chart(fig2, use_container_width=True, key=f"hs_tree_{step_tree}")
+    instrument.plotly_chart(fig2, use_container_width=True, key=f"hs_tree_{step_tree}")
     st.markdown(f'<div style="color:#64748b;font-size:0.75rem;font-family:Space Mono,monospace;">Affiche les {min(s["heap_end"], 15)} premiers nœuds du tas</div>', unsafe_allow_html=True)
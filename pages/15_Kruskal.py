@@ -1,85 +1,22 @@
 import streamlit as st
 import plotly.graph_objects as go
-import math, heapq, sys, os
+import math, sys, os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils.styles import inject_css, sidebar_nav
+from utils import instrument, traces
+from utils.cache import cached
+from algolab.core import csr, mst
 
 st.set_page_config(page_title="Kruskal / Prim — Graphix", page_icon="🌉", layout="wide")
 inject_css()
 sidebar_nav()
-
-# ── Union-Find ────────────────────────────────────────────────────────────────
-class UF:
-    def __init__(self, n):
-        self.parent = list(range(n))
-        self.rank   = [0] * n
-    def find(self, x):
-        while self.parent[x] != x:
-            self.parent[x] = self.parent[self.parent[x]]
-            x = self.parent[x]
-        return x
-    def union(self, x, y):
-        rx, ry = self.find(x), self.find(y)
-        if rx == ry: return False
-        if self.rank[rx] < self.rank[ry]: rx, ry = ry, rx
-        self.parent[ry] = rx
-        if self.rank[rx] == self.rank[ry]: self.rank[rx] += 1
-        return True
+instrument.start(__file__)
 
 # ── Algorithmes ───────────────────────────────────────────────────────────────
-def kruskal_steps(nodes, edges):
-    sorted_edges = sorted(edges, key=lambda e: e[2])
-    uf       = UF(len(nodes))
-    node_idx = {n: i for i, n in enumerate(nodes)}
-    mst, rejected, steps = [], [], []
-    steps.append({"mst": [], "current": None, "rejected": [],
-                  "desc": f"Arêtes triées par poids croissant — on teste dans l'ordre"})
-    for u, v, w in sorted_edges:
-        if uf.union(node_idx[u], node_idx[v]):
-            mst.append((u, v, w))
-            steps.append({"mst": list(mst), "current": (u,v,w), "rejected": list(rejected),
-                          "desc": f"✅ <b>{u}–{v}</b> (poids {w}) ajoutée — pas de cycle"})
-        else:
-            rejected.append((u,v,w))
-            steps.append({"mst": list(mst), "current": (u,v,w), "rejected": list(rejected),
-                          "desc": f"❌ <b>{u}–{v}</b> (poids {w}) rejetée — créerait un cycle"})
-    total = sum(e[2] for e in mst)
-    steps.append({"mst": list(mst), "current": None, "rejected": list(rejected),
-                  "desc": f"✅ Terminé — {len(mst)} arêtes, poids total = <b>{total}</b>"})
-    return steps
+csr_graph     = cached(csr.CSRGraph.from_edges)
+kruskal_steps = cached(mst.kruskal_steps)
+prim_steps    = cached(mst.prim_steps)
 
-def prim_steps(nodes, edges):
-    graph = {n: [] for n in nodes}
-    for u, v, w in edges:
-        graph[u].append((v, w)); graph[v].append((u, w))
-    start   = nodes[0]
-    visited = {start}
-    heap    = [(w, start, v) for v, w in graph[start]]
-    heapq.heapify(heap)
-    mst, rejected, steps = [], [], []
-    steps.append({"mst": [], "current": None, "visited": {start}, "rejected": [],
-                  "desc": f"Départ depuis <b>{start}</b> — on explore ses voisins"})
-    while heap:
-        w, u, v = heapq.heappop(heap)
-        if v in visited:
-            rejected.append((u, v, w))
-            steps.append({"mst": list(mst), "current": (u,v,w), "visited": set(visited),
-                          "rejected": list(rejected),
-                          "desc": f"❌ <b>{u}–{v}</b> (poids {w}) ignorée — <b>{v}</b> déjà dans l'arbre"})
-            continue
-        visited.add(v)
-        mst.append((u, v, w))
-        steps.append({"mst": list(mst), "current": (u,v,w), "visited": set(visited),
-                      "rejected": list(rejected),
-                      "desc": f"✅ <b>{u}–{v}</b> (poids {w}) ajoutée — <b>{v}</b> rejoint l'arbre"})
-        for neighbor, nw in graph[v]:
-            if neighbor not in visited:
-                heapq.heappush(heap, (nw, v, neighbor))
-    total = sum(e[2] for e in mst)
-    steps.append({"mst": list(mst), "current": None, "visited": set(visited),
-                  "rejected": list(rejected),
-                  "desc": f"✅ Terminé — poids total ACM = <b>{total}</b>"})
-    return steps
 
 # ── Graphes ───────────────────────────────────────────────────────────────────
 GRAPHS = {
@@ -197,7 +134,9 @@ with tab1:
         graph_k = st.selectbox("Graphe", list(GRAPHS.keys()), key="g_kruskal")
         gk = GRAPHS[graph_k]
         nodes_k, edges_k = gk["nodes"], gk["edges"]
-        steps_k = kruskal_steps(nodes_k, edges_k)
+        with instrument.phase("calcul"):
+            steps_k = kruskal_steps(csr_graph(nodes_k, edges_k))
+        traces.panel("kruskal", steps_k, replay=False)
         total_k = steps_k[-1]["mst"]
         total_k = sum(e[2] for e in total_k)
         st.markdown(f'<span class="complexity-badge">O(E log E) · {len(steps_k)-2} arêtes testées</span>', unsafe_allow_html=True)
@@ -219,8 +158,9 @@ with tab1:
         st.markdown("*Appuie sur **▶ Démarrer** ou glisse le slider*")
     with col_viz:
         pos_k = compute_pos(nodes_k)
-        fig_k = make_animated_fig(nodes_k, edges_k, pos_k, steps_k, "kr")
-        st.plotly_chart(fig_k, use_container_width=True, key=f"kruskal_{graph_k}")
+        with instrument.phase("figure"):
+            fig_k = make_animated_fig(nodes_k, edges_k, pos_k, steps_k, "kr")
+        instrument.plotly_chart(fig_k, use_container_width=True, key=f"kruskal_{graph_k}")
 
 # ── Prim ─────────────────────────────────────────────────────────────────────
 with tab2:
@@ -230,7 +170,9 @@ with tab2:
         graph_p = st.selectbox("Graphe", list(GRAPHS.keys()), key="g_prim")
         gp = GRAPHS[graph_p]
         nodes_p, edges_p = gp["nodes"], gp["edges"]
-        steps_p = prim_steps(nodes_p, edges_p)
+        with instrument.phase("calcul"):
+            steps_p = prim_steps(csr_graph(nodes_p, edges_p))
+        traces.panel("prim", steps_p, replay=False)
         total_p = sum(e[2] for e in steps_p[-1]["mst"])
         st.markdown(f'<span class="complexity-badge">O(E log V) · {len(steps_p)-2} étapes</span>', unsafe_allow_html=True)
         st.markdown(f'<span class="complexity-badge" style="margin-top:6px;display:inline-block;">Poids ACM : {total_p}</span>', unsafe_allow_html=True)
@@ -252,5 +194,6 @@ with tab2:
         st.markdown("*Appuie sur **▶ Démarrer** ou glisse le slider*")
     with col_viz2:
         pos_p = compute_pos(nodes_p)
-        fig_p = make_animated_fig(nodes_p, edges_p, pos_p, steps_p, "pr")
-        st.plotly_chart(fig_p, use_container_width=True, key=f"prim_{graph_p}")
+        with instrument.phase("figure"):
+            fig_p = make_animated_fig(nodes_p, edges_p, pos_p, steps_p, "pr")
+        instrument.plotly_chart(fig_p, use_container_width=True, key=f"prim_{graph_p}")
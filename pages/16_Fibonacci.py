@@ -4,113 +4,21 @@ import sys, os
 
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils.styles import inject_css, sidebar_nav
+from utils import instrument
+from utils.cache import cached
+from algolab.core import fibonacci
 
 st.set_page_config(
     page_title="Fibonacci — Graphix", page_icon="🌀", layout="wide"
 )
 inject_css()
 sidebar_nav()
+instrument.start(__file__)
 
 # ── Algorithmes ───────────────────────────────────────────────────────────────
-
-
-def fib_recursive_trace(n):
-    """Retourne liste de nœuds et arêtes de l'arbre d'appels."""
-    nodes, edges, counter = [], [], [0]
-
-    def rec(k, parent_id):
-        my_id = counter[0]
-        counter[0] += 1
-        nodes.append({"id": my_id, "k": k, "base": k <= 1})
-        if parent_id is not None:
-            edges.append((parent_id, my_id))
-        if k <= 1:
-            return k
-        l = rec(k - 1, my_id)
-        r = rec(k - 2, my_id)
-        return l + r
-
-    result = rec(n, None)
-    return result, nodes, edges
-
-
-def fib_memo_steps(n):
-    memo, steps = {}, []
-
-    def fib(k, depth=0):
-        if k in memo:
-            steps.append(
-                {
-                    "k": k,
-                    "depth": depth,
-                    "hit": True,
-                    "memo": dict(memo),
-                    "desc": f"🟡 Cache hit : F({k}) = <b>{memo[k]}</b> — déjà calculé, on retourne directement",
-                }
-            )
-            return memo[k]
-        steps.append(
-            {
-                "k": k,
-                "depth": depth,
-                "hit": False,
-                "memo": dict(memo),
-                "desc": f"🔵 Calcul de F({k}) — pas encore en cache, on descend",
-            }
-        )
-        memo[k] = (
-            k if k <= 1 else fib(k - 1, depth + 1) + fib(k - 2, depth + 1)
-        )
-        steps.append(
-            {
-                "k": k,
-                "depth": depth,
-                "hit": False,
-                "memo": dict(memo),
-                "desc": f"💾 F({k}) = <b>{memo[k]}</b> mémoïsé — plus besoin de recalculer",
-            }
-        )
-        return memo[k]
-
-    result = fib(n)
-    return result, steps
-
-
-def fib_iterative_steps(n):
-    steps = []
-    if n == 0:
-        return 0, [
-            {
-                "i": 0,
-                "a": 0,
-                "b": 1,
-                "sequence": [0],
-                "desc": "F(0) = 0 — cas de base",
-            }
-        ]
-    a, b, sequence = 0, 1, [0, 1]
-    steps.append(
-        {
-            "i": 1,
-            "a": 0,
-            "b": 1,
-            "sequence": [0, 1],
-            "desc": "Initialisation : a=F(0)=0, b=F(1)=1",
-        }
-    )
-    for i in range(2, n + 1):
-        a, b = b, a + b
-        sequence.append(b)
-        steps.append(
-            {
-                "i": i,
-                "a": a,
-                "b": b,
-                "sequence": list(sequence),
-                "desc": f"F({i}) = F({i-1}) + F({i-2}) = {a} + {sequence[-3]} = <b>{b}</b>",
-            }
-        )
-    return b, steps
+fib_recursive_trace = cached(fibonacci.fib_recursive_trace)
+fib_memo_steps      = cached(fibonacci.fib_memo_steps)
+fib_iterative_steps = cached(fibonacci.fib_iterative_steps)
 
 
 # ── Visualisations ────────────────────────────────────────────────────────────
@@ -317,7 +225,7 @@ with tab1:
             f"*{n_calls} appels au total — chaque nœud violet appelle deux sous-arbres*"
         )
         fig_tree = make_call_tree_fig(nodes_rec, edges_rec)
-        st.plotly_chart(
+        instrument.plotly_chart(
             fig_tree, use_container_width=True, key=f"fib_tree_{n_rec}"
         )
         st.markdown(
@@ -373,7 +281,7 @@ with tab2:
             unsafe_allow_html=True,
         )
         st.markdown("##### 💾 État du cache à cette étape")
-        st.plotly_chart(
+        instrument.plotly_chart(
             make_memo_chart(s["memo"], s["k"]),
             use_container_width=True,
             key=f"fib_memo_{step_m}",
@@ -422,7 +330,7 @@ with tab3:
             unsafe_allow_html=True,
         )
         st.markdown("##### 📊 Séquence construite")
-        st.plotly_chart(
+        instrument.plotly_chart(
             make_iter_chart(s["sequence"], s["i"]),
             use_container_width=True,
             key=f"fib_iter_{step_i}",
@@ -3,64 +3,19 @@ import plotly.graph_objects as go
 import random, sys, os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils.styles import inject_css, sidebar_nav
+from utils import instrument
+from utils.cache import cached
+from algolab.core import sorting
 
 st.set_page_config(page_title="Tris Linéaires — Graphix", page_icon="🪣", layout="wide")
 inject_css()
 sidebar_nav()
+instrument.start(__file__)
 
-# ── Counting Sort ─────────────────────────────────────────────────────────────
-def counting_sort_steps(arr, max_val):
-    steps, count, output = [], [0]*(max_val+1), [0]*len(arr)
-    steps.append({"phase":"init","arr":list(arr),"count":list(count),"output":None,
-                  "hl_arr":[],"hl_count":[],"desc":"Tableau initial — on va compter chaque valeur"})
-    for i, v in enumerate(arr):
-        count[v] += 1
-        steps.append({"phase":"count","arr":list(arr),"count":list(count),"output":None,
-                      "hl_arr":[i],"hl_count":[v],
-                      "desc":f"arr[{i}]={v} → count[{v}] passe à {count[v]}"})
-    steps.append({"phase":"count_done","arr":list(arr),"count":list(count),"output":None,
-                  "hl_arr":[],"hl_count":[],"desc":"Comptage terminé — chaque case = nb d'occurrences de cette valeur"})
-    for i in range(1, max_val+1):
-        count[i] += count[i-1]
-        steps.append({"phase":"cumul","arr":list(arr),"count":list(count),"output":None,
-                      "hl_arr":[],"hl_count":[i],
-                      "desc":f"Cumul : count[{i}] += count[{i-1}] → {count[i]} (nb d'éléments ≤ {i})"})
-    steps.append({"phase":"cumul_done","arr":list(arr),"count":list(count),"output":None,
-                  "hl_arr":[],"hl_count":[],"desc":"Comptage cumulatif prêt — count[v] = dernière position de v dans la sortie"})
-    for i in range(len(arr)-1, -1, -1):
-        v = arr[i]; count[v] -= 1; output[count[v]] = v
-        steps.append({"phase":"place","arr":list(arr),"count":list(count),"output":list(output),
-                      "hl_arr":[i],"hl_count":[v],
-                      "desc":f"Placer arr[{i}]={v} → output[{count[v]}]={v}"})
-    steps.append({"phase":"done","arr":list(output),"count":list(count),"output":list(output),
-                  "hl_arr":list(range(len(output))),"hl_count":[],
-                  "desc":"✅ Tableau trié ! Counting Sort : O(n+k) sans aucune comparaison"})
-    return steps
+# ── Algorithmes ───────────────────────────────────────────────────────────────
+counting_sort_steps = cached(sorting.counting_sort_steps)
+radix_sort_steps    = cached(sorting.radix_sort_steps)
 
-# ── Radix Sort ────────────────────────────────────────────────────────────────
-def radix_sort_steps(arr):
-    steps, current = [], list(arr)
-    max_val = max(arr)
-    n_digits = len(str(max_val))
-    steps.append({"phase":"init","arr":list(current),"buckets":None,"pass_num":0,"digit_name":"",
-                  "desc":f"Tableau initial — {n_digits} passe(s) nécessaire(s) (une par chiffre)"})
-    exp = 1
-    for d in range(n_digits):
-        name = ["unités","dizaines","centaines","milliers"][d] if d < 4 else f"10^{d}"
-        buckets = [[] for _ in range(10)]
-        for v in current:
-            buckets[(v // exp) % 10].append(v)
-        steps.append({"phase":"distribute","arr":list(current),"buckets":[list(b) for b in buckets],
-                      "pass_num":d+1,"digit_name":name,
-                      "desc":f"Passe {d+1} — chiffre des <b>{name}</b> : répartition dans les seaux 0–9"})
-        current = [v for b in buckets for v in b]
-        steps.append({"phase":"collect","arr":list(current),"buckets":[list(b) for b in buckets],
-                      "pass_num":d+1,"digit_name":name,
-                      "desc":f"Passe {d+1} — collecte des seaux dans l'ordre : tableau partiellement trié"})
-        exp *= 10
-    steps.append({"phase":"done","arr":list(current),"buckets":None,"pass_num":n_digits,"digit_name":"",
-                  "desc":f"✅ Trié en {n_digits} passe(s) — Radix Sort : O(d×n), stable, sans comparaison"})
-    return steps
 
 # ── Figures ───────────────────────────────────────────────────────────────────
 def bar_fig(arr, highlights, phase, title=""):
@@ -170,11 +125,11 @@ with tab1:
         col_a, col_b = st.columns(2)
         with col_a:
             st.markdown("##### 📥 Tableau")
-            st.plotly_chart(bar_fig(arr_show, s["hl_arr"], s["phase"]),
+            instrument.plotly_chart(bar_fig(arr_show, s["hl_arr"], s["phase"]),
                             use_container_width=True, key=f"cs_arr_{si}")
         with col_b:
             st.markdown("##### 🧮 Tableau de comptage")
-            st.plotly_chart(count_fig(s["count"], s["hl_count"], s["phase"]),
+            instrument.plotly_chart(count_fig(s["count"], s["hl_count"], s["phase"]),
                             use_container_width=True, key=f"cs_count_{si}")
 
 # ── Radix Sort ────────────────────────────────────────────────────────────────
@@ -210,9 +165,9 @@ with tab2:
         st.markdown(f'<div class="info-box" style="border-left-color:#06b6d4;">{s2["desc"]}</div>', unsafe_allow_html=True)
         st.markdown("##### 📥 Tableau courant")
         hl_rs = list(range(len(s2["arr"]))) if s2["phase"] == "done" else []
-        st.plotly_chart(bar_fig(s2["arr"], hl_rs, s2["phase"]),
+        instrument.plotly_chart(bar_fig(s2["arr"], hl_rs, s2["phase"]),
                         use_container_width=True, key=f"rs_arr_{si2}")
         if s2.get("buckets"):
             st.markdown(f"##### 🪣 Seaux — chiffre des {s2['digit_name']}")
-            st.plotly_chart(buckets_fig(s2["buckets"]),
+            instrument.plotly_chart(buckets_fig(s2["buckets"]),
                             use_container_width=True, key=f"rs_buckets_{si2}")
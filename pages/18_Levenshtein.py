@@ -3,49 +3,18 @@ import plotly.graph_objects as go
 import sys, os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils.styles import inject_css, sidebar_nav
+from utils import instrument
+from utils.cache import cached
+from algolab.core import levenshtein
 
 st.set_page_config(page_title="Levenshtein — Graphix", page_icon="✏️", layout="wide")
 inject_css()
 sidebar_nav()
+instrument.start(__file__)
 
 # ── Algorithme ────────────────────────────────────────────────────────────────
-def levenshtein_steps(s1, s2):
-    m, n = len(s1), len(s2)
-    dp = [[0]*(n+1) for _ in range(m+1)]
-    for i in range(m+1): dp[i][0] = i
-    for j in range(n+1): dp[0][j] = j
-    steps = []
-    steps.append({"dp": [row[:] for row in dp], "i": 0, "j": 0, "op": "init",
-                  "desc": "Initialisation : ligne 0 = nb insertions, colonne 0 = nb suppressions"})
-    for i in range(1, m+1):
-        for j in range(1, n+1):
-            if s1[i-1] == s2[j-1]:
-                dp[i][j] = dp[i-1][j-1]
-                op, desc = "match", f"'{s1[i-1]}' = '{s2[j-1]}' — même lettre, coût 0 → dp[{i}][{j}] = {dp[i][j]}"
-            else:
-                ins  = dp[i][j-1] + 1
-                sup  = dp[i-1][j] + 1
-                repl = dp[i-1][j-1] + 1
-                dp[i][j] = min(ins, sup, repl)
-                best = "insertion" if dp[i][j]==ins else "suppression" if dp[i][j]==sup else "remplacement"
-                op   = "edit"
-                desc = f"'{s1[i-1]}' ≠ '{s2[j-1]}' → min(ins={ins}, sup={sup}, repl={repl}) = <b>{dp[i][j]}</b> ({best})"
-            steps.append({"dp": [row[:] for row in dp], "i": i, "j": j, "op": op, "desc": desc})
-    # Chemin de retour
-    path, ci, cj = [], m, n
-    while ci > 0 or cj > 0:
-        path.append((ci, cj))
-        if ci == 0:                                          cj -= 1
-        elif cj == 0:                                        ci -= 1
-        elif dp[ci][cj] == dp[ci-1][cj-1] and s1[ci-1] == s2[cj-1]: ci -= 1; cj -= 1
-        elif dp[ci][cj] == dp[ci-1][cj-1] + 1:             ci -= 1; cj -= 1
-        elif dp[ci][cj] == dp[ci][cj-1] + 1:               cj -= 1
-        else:                                                ci -= 1
-    path.append((0, 0)); path.reverse()
-    steps.append({"dp": [row[:] for row in dp], "i": m, "j": n, "op": "done",
-                  "path": path,
-                  "desc": f"✅ Distance({s1}, {s2}) = <b>{dp[m][n]}</b> opération(s)"})
-    return steps, dp[m][n]
+levenshtein_steps = cached(levenshtein.levenshtein_steps)
+
 
 # ── Visualisation table DP ────────────────────────────────────────────────────
 def make_dp_fig(dp, s1, s2, ci, cj, op, path=None):
@@ -156,7 +125,7 @@ with col_viz:
     st.markdown(f'<div class="info-box" style="border-left-color:#10b981;">{s["desc"]}</div>', unsafe_allow_html=True)
     st.markdown(f"##### 📋 Table DP — <span style='color:#f59e0b'>lignes={s1}</span>, <span style='color:#06b6d4'>colonnes={s2}</span>", unsafe_allow_html=True)
     fig = make_dp_fig(s["dp"], s1, s2, s["i"], s["j"], s["op"], s.get("path"))
-    st.plotly_chart(fig, use_container_width=True, key=f"lev_{step_idx}")
+    instrument.plotly_chart(fig, use_container_width=True, key=f"lev_{step_idx}")
 
     # Reconstruction des opérations (étape finale)
     if s.get("path") and len(s["path"]) > 1:
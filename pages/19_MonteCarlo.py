@@ -1,26 +1,20 @@
 import streamlit as st
 import plotly.graph_objects as go
-import random, math, sys, os
+import math, sys, os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils.styles import inject_css, sidebar_nav
+from utils import instrument
+from utils.cache import cached
+from algolab.core import montecarlo
 
 st.set_page_config(page_title="Monte Carlo — Graphix", page_icon="🎲", layout="wide")
 inject_css()
 sidebar_nav()
+instrument.start(__file__)
 
 # ── Simulation ────────────────────────────────────────────────────────────────
-def monte_carlo_pi(n_points, seed=42):
-    rng = random.Random(seed)
-    inside, outside, pi_estimates = [], [], []
-    for i in range(n_points):
-        x = rng.uniform(-1, 1)
-        y = rng.uniform(-1, 1)
-        if x*x + y*y <= 1:
-            inside.append((x, y))
-        else:
-            outside.append((x, y))
-        pi_estimates.append(4 * len(inside) / (i + 1))
-    return inside, outside, pi_estimates
+monte_carlo_pi = cached(montecarlo.monte_carlo_pi)
+
 
 # ── UI ────────────────────────────────────────────────────────────────────────
 st.markdown('<span class="page-badge" style="background:rgba(239,68,68,0.15);border:1px solid rgba(239,68,68,0.3);color:#fca5a5;">🎲 MONTE CARLO</span>', unsafe_allow_html=True)
@@ -111,7 +105,7 @@ with col_viz:
             legend=dict(bgcolor='#111118', bordercolor='#1e1e2e', font=dict(size=10, color='#94a3b8')),
             margin=dict(l=10,r=10,t=10,b=10), height=380,
         )
-        st.plotly_chart(fig, use_container_width=True, key=f"mc_scatter_{active_n}_{active_seed}")
+        instrument.plotly_chart(fig, use_container_width=True, key=f"mc_scatter_{active_n}_{active_seed}")
 
     with col_b:
         st.markdown("##### 📈 Convergence vers π")
@@ -134,7 +128,7 @@ with col_viz:
                        range=[2.6, 3.7]),
             margin=dict(l=50,r=10,t=10,b=40), height=380,
         )
-        st.plotly_chart(fig2, use_container_width=True, key=f"mc_conv_{active_n}_{active_seed}")
+        instrument.plotly_chart(fig2, use_container_width=True, key=f"mc_conv_{active_n}_{active_seed}")
 
     # Table de précision
     st.markdown("---")
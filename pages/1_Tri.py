@@ -1,110 +1,87 @@
 import streamlit as st
 import plotly.graph_objects as go
+import numpy as np
 import random, sys, os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils.styles import inject_css, sidebar_nav
+from utils import instrument, frames, traces, jobs
+from utils.cache import cached
+from algolab.core import sorting
 
 st.set_page_config(page_title="Tri — Graphix", page_icon="📊", layout="wide")
 inject_css()
 sidebar_nav()
+instrument.start(__file__)
 
 # ── Algorithmes ───────────────────────────────────────────────────────────────
-
-def bubble_sort_steps(arr):
-    steps, descriptions = [], []
-    a = arr.copy()
-    n = len(a)
-    for i in range(n):
-        for j in range(0, n-i-1):
-            steps.append((a.copy(), j, j+1, list(range(n-i, n))))
-            descriptions.append(f"Comparaison : a[{j}]={a[j]} et a[{j+1}]={a[j+1]}")
-            if a[j] > a[j+1]:
-                a[j], a[j+1] = a[j+1], a[j]
-                steps.append((a.copy(), j, j+1, list(range(n-i, n))))
-                descriptions.append(f"Échange : a[{j}] ↔ a[{j+1}] → {a[j+1]} avant {a[j]}")
-    steps.append((a.copy(), -1, -1, list(range(n))))
-    descriptions.append("✅ Tableau trié !")
-    return steps, descriptions
-
-def merge_sort_steps(arr):
-    steps, descriptions = [], []
-    a = arr.copy()
-    def merge_sort(arr, left):
-        if len(arr) <= 1:
-            return arr
-        mid = len(arr) // 2
-        L = merge_sort(arr[:mid], left)
-        R = merge_sort(arr[mid:], left + mid)
-        merged = []
-        i = j = 0
-        while i < len(L) and j < len(R):
-            steps.append((a.copy(), left+i, left+mid+j, []))
-            descriptions.append(f"Fusion : comparaison L[{i}]={L[i]} vs R[{j}]={R[j]}")
-            if L[i] <= R[j]:
-                merged.append(L[i]); i += 1
-            else:
-                merged.append(R[j]); j += 1
-        merged.extend(L[i:]); merged.extend(R[j:])
-        for k, val in enumerate(merged):
-            a[left+k] = val
-        steps.append((a.copy(), -1, -1, list(range(left, left+len(merged)))))
-        descriptions.append(f"Sous-tableau [{left}:{left+len(merged)}] fusionné")
-        return merged
-    merge_sort(a, 0)
-    return steps, descriptions
-
-def quick_sort_steps(arr):
-    steps, descriptions = [], []
-    a = arr.copy()
-    def quick_sort(lo, hi):
-        if lo >= hi: return
-        pivot = a[hi]
-        i = lo
-        steps.append((a.copy(), hi, -1, []))
-        descriptions.append(f"Pivot choisi : a[{hi}] = {pivot}")
-        for j in range(lo, hi):
-            steps.append((a.copy(), j, hi, []))
-            descriptions.append(f"Comparaison : a[{j}]={a[j]} vs pivot={pivot}")
-            if a[j] <= pivot:
-                a[i], a[j] = a[j], a[i]
-                steps.append((a.copy(), i, j, []))
-                descriptions.append(f"Échange : a[{i}]={a[i]} ↔ a[{j}]={a[j]}")
-                i += 1
-        a[i], a[hi] = a[hi], a[i]
-        steps.append((a.copy(), i, hi, [i]))
-        descriptions.append(f"Pivot {pivot} placé en position {i} ✓")
-        quick_sort(lo, i-1)
-        quick_sort(i+1, hi)
-    quick_sort(0, len(a)-1)
-    steps.append((a.copy(), -1, -1, list(range(len(a)))))
-    descriptions.append("✅ Tableau trié !")
-    return steps, descriptions
-
-def get_colors(arr, idx1, idx2, sorted_indices, accent):
-    colors = []
-    for i in range(len(arr)):
-        if i in sorted_indices: colors.append("#10b981")
-        elif i == idx1:         colors.append("#f59e0b")
-        elif i == idx2:         colors.append("#ef4444")
-        else:                   colors.append(accent)
-    return colors
-
-def make_animated_fig(steps, descs, accent):
-    arr0, i1, i2, si = steps[0]
-    n    = len(arr0)
-    ymax = max(max(s[0]) for s in steps) + 8
+ALGOS = {  # nom affiché -> (moteur, trace mise en cache, complexité, couleur)
+    "Tri à Bulles":     ("bubble",  cached(sorting.bubble_sort_steps),        "O(n²) comparaisons",              "#7c3aed"),
+    "Tri Fusion":       ("merge",   cached(sorting.merge_sort_steps),         "O(n log n) — Stable",             "#06b6d4"),
+    "Tri Rapide":       ("quick",   cached(sorting.quick_sort_steps),         "O(n log n) moyen, O(n²) si trié",  "#f59e0b"),
+    "Introsort":        ("intro",   cached(sorting.intro_sort_steps),         "O(n log n) garanti",              "#ec4899"),
+    "Rapide 3 voies":   ("quick3",  cached(sorting.quick3_sort_steps),        "O(n log n), O(n) si peu de valeurs", "#3b82f6"),
+    "Tri de Shell":     ("shell",   cached(sorting.shell_sort_steps),         "≈ O(n^1.3) — écarts de Ciura",    "#f97316"),
+    "Fusion naturelle": ("natural", cached(sorting.natural_merge_sort_steps), "O(n) si déjà trié, O(n log n)",   "#a855f7"),
+}
+INPUTS = {"Aléatoire": "random", "Trié": "sorted", "Inversé": "reversed",
+          "Peu de valeurs": "few_unique", "Presque trié": "nearly_sorted"}
+QUADRATIC_MAX = 5000  # au-delà, un tri en O(n²) dépasse la minute
+
+def quadratic(name, kind):
+    """Vrai si ``name`` fait O(n²) comparaisons sur l'entrée ``kind``."""
+    return name == "Tri à Bulles" or (name == "Tri Rapide" and kind != "random")
+
+
+def get_colors(n, idx1, idx2, sorted_indices):
+    """Code couleur de chaque barre : 0 normal, 1 comparé, 2 second / pivot, 3 trié.
+
+    Des codes numériques plutôt qu'une liste de couleurs : Plotly valide un
+    tableau NumPy d'un bloc, une liste de chaînes élément par élément.
+    """
+    codes = np.zeros(n, dtype=np.int8)
+    if idx2 >= 0: codes[idx2] = 2
+    if idx1 >= 0: codes[idx1] = 1
+    codes[sorted_indices.start:sorted_indices.stop] = 3
+    return codes
+
+def color_scale(accent):
+    """Échelle discrète des codes 0–3 de ``get_colors``."""
+    bands = [accent, "#f59e0b", "#ef4444", "#10b981"]
+    return [[b / 4 + e / 4, c] for b, c in enumerate(bands) for e in (0, 1)]
+
+def step_change(a, b):
+    """Ampleur visuelle du passage de l'étape a à b : barres déplacées ou triées."""
+    moved = sum(x != y for x, y in zip(a["arr"], b["arr"]))
+    return moved + abs(len(b["sorted"]) - len(a["sorted"]))
+
+def make_animated_fig(steps, accent):
+    s0   = steps[0]
+    n    = len(s0["arr"])
+    ymax = max(s0["arr"]) + 8
+
+    labels = n <= 40  # au-delà, les valeurs ne sont plus lisibles
+
+    x, scale = np.arange(n), color_scale(accent)
 
     def frame_bar(arr, i1, i2, si):
         return go.Bar(
-            x=list(range(n)), y=arr,
-            marker_color=get_colors(arr, i1, i2, si, accent),
-            marker_line_width=0,
-            text=arr, textposition='outside',
+            x=x, y=np.asarray(arr),
+            marker=dict(color=get_colors(n, i1, i2, si), colorscale=scale, cmin=-0.5, cmax=3.5,
+                        line_width=0),
+            text=arr if labels else None, textposition='outside',
             textfont=dict(color='#e2e8f0', size=10, family='Space Mono'),
         )
 
+    sample = frame_bar(s0["arr"], s0["i1"], s0["i2"], s0["sorted"])
+    if hasattr(steps, "changes"):  # SortTrace : ampleurs déjà en colonne
+        change = steps.changes().__getitem__
+    else:
+        change = lambda k: step_change(steps[k - 1], steps[k])
+    keep = frames.select(len(steps), change, frames.budget(sample))
+    frames.caption(len(keep), len(steps))
+
     fig = go.Figure(
-        data=[frame_bar(arr0, i1, i2, si)],
+        data=[sample],
         layout=go.Layout(
             paper_bgcolor='#0a0a0f', plot_bgcolor='#111118',
             font=dict(color='#e2e8f0', family='DM Sans'),
@@ -114,7 +91,7 @@ def make_animated_fig(steps, descs, accent):
             height=380, bargap=0.15,
             annotations=[dict(
                 x=0.5, y=1.06, xref='paper', yref='paper',
-                text=descs[0], showarrow=False,
+                text=s0["desc"], showarrow=False,
                 font=dict(color='#94a3b8', size=12, family='DM Sans'),
                 align='center',
             )],
@@ -146,55 +123,120 @@ def make_animated_fig(steps, descs, accent):
                             args=[[f"f{k}"], dict(mode="immediate",
                                                   frame=dict(duration=220, redraw=True),
                                                   transition=dict(duration=100))],
-                            label=str(k)) for k in range(len(steps))],
+                            label=str(k)) for k in keep],
             )],
         ),
         frames=[
             go.Frame(
                 name=f"f{k}",
-                data=[frame_bar(arr, i1, i2, si)],
+                data=[frame_bar(s["arr"], s["i1"], s["i2"], s["sorted"])],
                 layout=go.Layout(annotations=[dict(
                     x=0.5, y=1.06, xref='paper', yref='paper',
-                    text=descs[k], showarrow=False,
+                    text=s["desc"], showarrow=False,
                     font=dict(color='#94a3b8', size=12, family='DM Sans'),
                     align='center',
                 )])
             )
-            for k, (arr, i1, i2, si) in enumerate(steps)
+            for k, s in zip(keep, [steps[k] for k in keep])
         ],
     )
     return fig
 
+# ── Mode statistiques ─────────────────────────────────────────────────────────
+
+def render_stats(job):
+    if job is None:
+        return
+    if not job.done:
+        st.progress(job.progress, text=f"Tri en cours… {job.progress:.0%}")
+    for name, exc in job.errors().items():
+        st.error(f"{name} : {exc}")
+    r = job.results()
+    if not r:
+        return
+    st.markdown(
+        '<table style="width:100%;font-size:0.9rem;"><tr><th>Algorithme</th><th>n</th><th>Comparaisons</th>'
+        "<th>Échanges</th><th>Écritures</th><th>Profondeur max</th><th>Étapes</th><th>Temps</th></tr>"
+        + "".join(
+            f"<tr><td><b>{name}</b></td><td>{m['n']:,}</td><td>{m['comparisons']:,}</td><td>{m['swaps']:,}</td>"
+            f"<td>{m['writes']:,}</td><td>{m['max_depth']}</td><td>{m['steps']:,}</td><td>{m['ms']:,.0f} ms</td></tr>"
+            for name, m in r.items()
+        ).replace(",", " ")
+        + "</table>",
+        unsafe_allow_html=True,
+    )
+    st.markdown("##### 📸 Tableau aux centiles d'avancement")
+    cols = st.columns(min(3, len(r)))
+    for k, (name, m) in enumerate(r.items()):
+        snaps = m["snapshots"]
+        fig = go.Figure(go.Heatmap(
+            z=np.array([v for _, v in snaps]), y=[f"{p} %" for p, _ in snaps],
+            colorscale=[[0, '#111118'], [1, ALGOS[name][3]]], showscale=False,
+        ))
+        fig.update_layout(
+            title=dict(text=name, font=dict(color='#e2e8f0', size=13, family='DM Sans')),
+            paper_bgcolor='#0a0a0f', plot_bgcolor='#111118', height=320,
+            font=dict(color='#94a3b8', family='Space Mono', size=10),
+            xaxis=dict(title=f"position (1 sur {m['stride']})", showgrid=False),
+            yaxis=dict(showgrid=False, autorange='reversed'), margin=dict(l=50, r=10, t=40, b=40),
+        )
+        with cols[k % len(cols)]:
+            instrument.plotly_chart(fig, width='stretch', key=f"tri_stats_{name}")
+
+def stats_mode():
+    st.markdown('<div class="info-box" style="border-left-color:#06b6d4; font-size:0.85rem;">Mêmes algorithmes que la visualisation, '
+                'sans enregistrer d\'étapes : seuls les compteurs d\'opérations et un échantillon du tableau à chaque '
+                'dizaine de pourcents d\'avancement sont gardés.</div>', unsafe_allow_html=True)
+    c1, c2, c3, c4 = st.columns([2, 1.3, 3, 1])
+    n = c1.select_slider("Taille du tableau", [1_000, 3_000, 10_000, 30_000, 100_000, 300_000, 1_000_000],
+                         value=10_000, format_func=lambda v: f"{v:,}".replace(",", " "))
+    kind = INPUTS[c2.selectbox("Entrée", list(INPUTS), key="tri_stats_input")]
+    algos = c3.multiselect("Algorithmes", list(ALGOS), default=["Tri Fusion", "Tri Rapide", "Introsort"])
+    skipped = [name for name in algos if n > QUADRATIC_MAX and quadratic(name, kind)]
+    if skipped:
+        algos = [name for name in algos if name not in skipped]
+        c3.caption(f"Ignorés au-delà de {QUADRATIC_MAX} éléments sur cette entrée (O(n²)) : {', '.join(skipped)}.")
+    params = (n, kind, tuple(algos))
+    job = jobs.current("tri_stats", params)
+    c4.markdown("<br>", unsafe_allow_html=True)
+    if c4.button("🚀 Lancer", width='stretch', type="primary", disabled=not algos):
+        arr = sorting.make_input(kind, n)
+        job = jobs.submit("tri_stats", params,
+                          [(name, sorting.sort_stats, (ALGOS[name][0], arr)) for name in algos])
+    jobs.live(job, render_stats)
+
 # ── UI ────────────────────────────────────────────────────────────────────────
 st.markdown('<span class="page-badge" style="background:rgba(124,58,237,0.15);border:1px solid rgba(124,58,237,0.3);color:#a78bfa;">📊 ALGORITHMES DE TRI</span>', unsafe_allow_html=True)
 st.markdown('<div class="page-title">Tri & Comparaisons</div>', unsafe_allow_html=True)
-st.markdown('<div class="page-desc">Observez chaque étape de 3 algorithmes de tri. Utilisez le bouton <b>▶ Démarrer</b> ou le slider pour naviguer. Les barres jaunes = comparaison, rouge = pivot, vert = trié.</div>', unsafe_allow_html=True)
+st.markdown('<div class="page-desc">Observez chaque étape de 7 algorithmes de tri, sur des entrées aléatoires, triées, inversées ou presque triées. Utilisez le bouton <b>▶ Démarrer</b> ou le slider pour naviguer. Les barres jaunes = comparaison, rouge = pivot, vert = trié.</div>', unsafe_allow_html=True)
+
+mode = st.radio("Mode", ["🎬 Visualisation", "📈 Statistiques"], horizontal=True, label_visibility="collapsed")
+if mode == "📈 Statistiques":
+    stats_mode()
+    st.stop()
 
 col_ctrl, col_viz = st.columns([1, 3])
 
 with col_ctrl:
     st.markdown("#### ⚙️ Paramètres")
-    algo  = st.selectbox("Algorithme", ["Tri à Bulles", "Tri Fusion", "Tri Rapide"])
-    n     = st.slider("Taille du tableau", 5, 20, 10)
+    algo  = st.selectbox("Algorithme", list(ALGOS))
+    entry = st.selectbox("Entrée", list(INPUTS),
+                         help="Trié, inversé et peu de valeurs : pire cas du tri rapide de Lomuto.")
+    kind  = INPUTS[entry]
+    n     = st.slider("Taille du tableau", 5, 300 if quadratic(algo, kind) else 3000, 10,
+                      help="Limité à 300 éléments quand l'algorithme est en O(n²) sur cette entrée.")
 
-    if st.button("🎲 Générer nouveau tableau", width='stretch'):
-        st.session_state.tri_arr = random.sample(range(1, 100), n)
+    if (st.button("🎲 Générer nouveau tableau", width='stretch')
+            or st.session_state.get("tri_input") != (kind, n)):
+        st.session_state.tri_arr = sorting.make_input(kind, n, random.randrange(2**32))
+        st.session_state.tri_input = (kind, n)
 
-    if "tri_arr" not in st.session_state:
-        st.session_state.tri_arr = random.sample(range(1, 100), n)
+    arr = st.session_state.tri_arr
+    _, sort_steps, complexity, accent = ALGOS[algo]
 
-    arr    = st.session_state.tri_arr
-    accent = {"Tri à Bulles": "#7c3aed", "Tri Fusion": "#06b6d4", "Tri Rapide": "#f59e0b"}[algo]
-
-    if algo == "Tri à Bulles":
-        steps, descs = bubble_sort_steps(arr)
-        complexity   = "O(n²) comparaisons"
-    elif algo == "Tri Fusion":
-        steps, descs = merge_sort_steps(arr)
-        complexity   = "O(n log n) — Stable"
-    else:
-        steps, descs = quick_sort_steps(arr)
-        complexity   = "O(n log n) moyen"
+    with instrument.phase("calcul"):
+        steps = sort_steps(arr)
+    steps = traces.panel("tri", steps, meta={"algo": algo, "input": kind})
 
     st.markdown(f'<span class="complexity-badge">{complexity}</span>', unsafe_allow_html=True)
     st.markdown(f'<span class="complexity-badge" style="margin-top:6px;display:inline-block;">{len(steps)} étapes</span>', unsafe_allow_html=True)
@@ -206,5 +248,6 @@ with col_ctrl:
     st.markdown("🟢 Trié et en place")
 
 with col_viz:
-    fig = make_animated_fig(steps, descs, accent)
-    st.plotly_chart(fig, width='stretch', key=f"tri_{algo}_{len(arr)}")
+    with instrument.phase("figure"):
+        fig = make_animated_fig(steps, accent)
+    instrument.plotly_chart(fig, width='stretch', key=f"tri_{algo}_{kind}_{len(arr)}")
@@ -3,39 +3,19 @@ import plotly.graph_objects as go
 import math, sys, os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils.styles import inject_css, sidebar_nav
+from utils import instrument
+from utils.cache import cached
+from algolab.core import csr, pagerank
 
 st.set_page_config(page_title="PageRank — Graphix", page_icon="🌐", layout="wide")
 inject_css()
 sidebar_nav()
+instrument.start(__file__)
 
 # ── Algorithme ────────────────────────────────────────────────────────────────
-def pagerank_steps(nodes, edges, damping=0.85, max_iter=30, tol=1e-6):
-    n    = len(nodes)
-    idx  = {node: i for i, node in enumerate(nodes)}
-    out  = {node: [] for node in nodes}
-    inc  = {node: [] for node in nodes}
-    for src, dst in edges:
-        out[src].append(dst)
-        inc[dst].append(src)
-
-    rank  = {node: 1/n for node in nodes}
-    steps = [{"rank": dict(rank), "iteration": 0, "diff": None,
-               "desc": f"Initialisation — chaque page reçoit 1/{n} = {1/n:.4f}"}]
-
-    for it in range(1, max_iter+1):
-        new_rank = {}
-        for node in nodes:
-            contrib = sum(rank[src] / len(out[src]) for src in inc[node] if out[src])
-            new_rank[node] = (1 - damping) / n + damping * contrib
-        diff = sum(abs(new_rank[nd] - rank[nd]) for nd in nodes)
-        rank = new_rank
-        converged = diff < tol
-        steps.append({"rank": dict(rank), "iteration": it, "diff": diff,
-                       "desc": f"Itération {it} — variation Δ={diff:.6f}" +
-                               (" &nbsp;✅ <b>Convergé !</b>" if converged else "")})
-        if converged:
-            break
-    return steps
+csr_graph      = cached(csr.CSRGraph.from_edges)
+pagerank_steps = cached(pagerank.pagerank_steps)
+
 
 # ── Graphes ───────────────────────────────────────────────────────────────────
 GRAPHS = {
@@ -175,7 +155,7 @@ with col_ctrl:
     g      = GRAPHS[graph_name]
     nodes  = g["nodes"]; edges = g["edges"]
     pos    = compute_pos(nodes)
-    steps  = pagerank_steps(nodes, edges, damping=damping)
+    steps  = pagerank_steps(csr_graph(nodes, edges, directed=True), damping=damping)
     n_iter = len(steps) - 1
 
     st.markdown(f'<span class="complexity-badge">O(k·(V+E)) · {n_iter} itérations</span>', unsafe_allow_html=True)
@@ -214,14 +194,14 @@ with col_viz:
     col_a, col_b = st.columns([3, 2])
     with col_a:
         st.markdown("##### 🌐 Graphe (taille ∝ PageRank)")
-        st.plotly_chart(make_graph_fig(nodes, edges, pos, s["rank"]),
+        instrument.plotly_chart(make_graph_fig(nodes, edges, pos, s["rank"]),
                         use_container_width=True, key=f"pr_graph_{step_idx}_{graph_name}")
     with col_b:
         st.markdown("##### 📊 Scores triés")
-        st.plotly_chart(make_rank_bar(s["rank"], s["iteration"]),
+        instrument.plotly_chart(make_rank_bar(s["rank"], s["iteration"]),
                         use_container_width=True, key=f"pr_bar_{step_idx}_{graph_name}")
 
     conv_fig = make_convergence_fig(steps)
     if conv_fig and step_idx > 1:
         st.markdown("##### 📉 Convergence (axe Y logarithmique)")
-        st.plotly_chart(conv_fig, use_container_width=True, key=f"pr_conv_{step_idx}_{graph_name}")
+        instrument.plotly_chart(conv_fig, use_container_width=True, key=f"pr_conv_{step_idx}_{graph_name}")
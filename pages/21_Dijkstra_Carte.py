@@ -1,15 +1,20 @@
 import streamlit as st
 import plotly.graph_objects as go
-import heapq, math, sys, os
+import math, sys, os
 
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils.styles import inject_css, sidebar_nav
+from utils import instrument
+from utils.cache import cached
+from algolab.core import csr, graphs
+from algolab.core.graphs import reconstruct_path_from_prev
 
 st.set_page_config(
     page_title="Dijkstra Carte — Graphix", page_icon="🗺️", layout="wide"
 )
 inject_css()
 sidebar_nav()
+instrument.start(__file__)
 
 # ── Données : villes françaises avec coordonnées réelles ──────────────────────
 VILLES = {
@@ -46,96 +51,13 @@ ROUTES = [
 ]
 
 
-def dijkstra_steps(start, end):
-    graph = {v: [] for v in VILLES}
-    for u, v, w in ROUTES:
-        graph[u].append((v, w))
-        graph[v].append((u, w))
-
-    dist = {v: float("inf") for v in VILLES}
-    prev = {v: None for v in VILLES}
-    dist[start] = 0
-    heap = [(0, start)]
-    visited = set()
-    steps = []
-
-    steps.append(
-        {
-            "dist": dict(dist),
-            "visited": set(),
-            "current": None,
-            "frontier": {start},
-            "prev": dict(prev),
-            "desc": f"Initialisation — distance de <b>{start}</b> = 0, toutes les autres = ∞",
-        }
-    )
-
-    while heap:
-        d, u = heapq.heappop(heap)
-        if u in visited:
-            continue
-        visited.add(u)
-        steps.append(
-            {
-                "dist": dict(dist),
-                "visited": set(visited),
-                "current": u,
-                "frontier": set(n for n, _ in graph[u] if n not in visited),
-                "prev": dict(prev),
-                "desc": f"Visite <b>{u}</b> (distance = {d} km) — exploration des voisins",
-            }
-        )
-        if u == end:
-            break
-        for v, w in graph[u]:
-            if v not in visited and dist[u] + w < dist[v]:
-                dist[v] = dist[u] + w
-                prev[v] = u
-                heapq.heappush(heap, (dist[v], v))
-                steps.append(
-                    {
-                        "dist": dict(dist),
-                        "visited": set(visited),
-                        "current": u,
-                        "frontier": set(),
-                        "prev": dict(prev),
-                        "desc": f"Mise à jour : <b>{u}</b>→<b>{v}</b> = {dist[u]}+{w} = <b>{dist[v]} km</b>",
-                    }
-                )
-
-    # Reconstruit le chemin
-    path, cur = [], end
-    while cur:
-        path.append(cur)
-        cur = prev[cur]
-    path.reverse()
-
-    steps.append(
-        {
-            "dist": dict(dist),
-            "visited": set(visited),
-            "current": end,
-            "frontier": set(),
-            "prev": dict(prev),
-            "path": path,
-            "desc": f"✅ Chemin optimal <b>{start} → {end}</b> = <b>{dist[end]} km</b>",
-        }
-    )
-    return steps, dist[end], path
+# ── Algorithme ────────────────────────────────────────────────────────────────
+route_steps = cached(graphs.route_steps)
+csr_graph   = cached(csr.CSRGraph.from_edges)
 
 
-def reconstruct_path_from_prev(prev, end):
-    """Reconstruit le chemin connu jusqu'ici depuis prev (partiel ou final)."""
-    if not prev or prev.get(end) is None:
-        return []
-    path, cur = [], end
-    visited_back = set()
-    while cur and cur not in visited_back:
-        visited_back.add(cur)
-        path.append(cur)
-        cur = prev.get(cur)
-    path.reverse()
-    return path
+def dijkstra_steps(start, end):
+    return route_steps(csr_graph(tuple(VILLES), ROUTES), start, end)
 
 
 def make_map_fig(step, start, end):
@@ -311,7 +233,7 @@ with col_viz:
         unsafe_allow_html=True,
     )
     fig = make_map_fig(s, start, end)
-    st.plotly_chart(
+    instrument.plotly_chart(
         fig, use_container_width=True, key=f"dijk_{step_idx}_{start}_{end}"
     )
 
@@ -1,78 +1,23 @@
 import streamlit as st
 import plotly.graph_objects as go
-import random, math, sys, os
+import math, sys, os
 
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils.styles import inject_css, sidebar_nav
+from utils import instrument
+from utils.cache import cached
+from algolab.core import genetic
+from algolab.core.genetic import fitness
 
 st.set_page_config(
     page_title="Algorithme Génétique — Graphix", page_icon="🧬", layout="wide"
 )
 inject_css()
 sidebar_nav()
+instrument.start(__file__)
 
-
-# ── Problème : trouver le maximum de f(x) sur [0, 2π] ────────────────────────
-def fitness(x):
-    return math.sin(x) * math.cos(0.5 * x) + 0.5 * math.sin(3 * x)
-
-
-def genetic_steps(pop_size=20, n_gen=40, mutation_rate=0.15, seed=42):
-    rng = random.Random(seed)
-    population = [rng.uniform(0, 2 * math.pi) for _ in range(pop_size)]
-    steps = []
-
-    def record(gen, pop, op=""):
-        fits = [fitness(x) for x in pop]
-        best = max(range(len(pop)), key=lambda i: fits[i])
-        steps.append(
-            {
-                "gen": gen,
-                "pop": list(pop),
-                "fits": list(fits),
-                "best_x": pop[best],
-                "best_f": fits[best],
-                "mean_f": sum(fits) / len(fits),
-                "op": op,
-                "desc": f"Génération {gen} — meilleur f(x)=<b>{fits[best]:.4f}</b> à x=<b>{pop[best]:.4f}</b>"
-                + (f" — {op}" if op else ""),
-            }
-        )
-
-    record(0, population, "Population initiale aléatoire")
-
-    for gen in range(1, n_gen + 1):
-        fits = [fitness(x) for x in population]
-        min_f = min(fits)
-        shifted = [f - min_f + 1e-9 for f in fits]
-        total = sum(shifted)
-
-        # Sélection par roulette
-        def pick():
-            r, acc = rng.random() * total, 0
-            for i, s in enumerate(shifted):
-                acc += s
-                if acc >= r:
-                    return population[i]
-            return population[-1]
-
-        new_pop = []
-        for _ in range(pop_size):
-            p1, p2 = pick(), pick()
-            # Croisement
-            alpha = rng.random()
-            child = alpha * p1 + (1 - alpha) * p2
-            # Mutation
-            if rng.random() < mutation_rate:
-                child += rng.gauss(0, 0.3)
-            child = max(0, min(2 * math.pi, child))
-            new_pop.append(child)
-
-        population = new_pop
-        op = "Sélection + Croisement + Mutation" if gen % 5 == 0 else ""
-        record(gen, population, op)
-
-    return steps
+# ── Problème : trouver le maximum de f(x) sur [0, 2π] ─────────────────────────
+genetic_steps = cached(genetic.genetic_steps)
 
 
 # ── Figure population ─────────────────────────────────────────────────────────
@@ -259,13 +204,13 @@ with col_viz:
         f'<div class="info-box" style="border-left-color:#10b981;">{s["desc"]}</div>',
         unsafe_allow_html=True,
     )
-    st.plotly_chart(
+    instrument.plotly_chart(
         make_gen_fig(s),
         use_container_width=True,
         key=f"ga_pop_{step_idx}_{seed_ga}_{pop_size}",
     )
     st.markdown("##### 📈 Convergence de la population")
-    st.plotly_chart(
+    instrument.plotly_chart(
         make_convergence_fig(steps_ga[: step_idx + 1]),
         use_container_width=True,
         key=f"ga_conv_{step_idx}_{seed_ga}",
@@ -4,24 +4,18 @@ import numpy as np
 import sys, os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils.styles import inject_css, sidebar_nav
+from utils import instrument
+from utils.cache import cached
+from algolab.core import mandelbrot
 
 st.set_page_config(page_title="Mandelbrot — Graphix", page_icon="🌀", layout="wide")
 inject_css()
 sidebar_nav()
+instrument.start(__file__)
+
+# ── Calcul ────────────────────────────────────────────────────────────────────
+compute_mandelbrot = cached(mandelbrot.compute_mandelbrot)
 
-# ── Calcul ─────────────────────────────────────────────────────────────────────
-@st.cache_data
-def compute_mandelbrot(xmin, xmax, ymin, ymax, width=400, height=350, max_iter=80):
-    x = np.linspace(xmin, xmax, width)
-    y = np.linspace(ymin, ymax, height)
-    C = x[np.newaxis, :] + 1j * y[:, np.newaxis]
-    Z = np.zeros_like(C)
-    M = np.zeros(C.shape, dtype=float)
-    for i in range(max_iter):
-        mask = np.abs(Z) <= 2
-        Z[mask] = Z[mask] ** 2 + C[mask]
-        M[mask] += 1
-    return M
 
 PRESETS = {
     "Vue globale":        (-2.5, 1.0, -1.25, 1.25),
@@ -94,7 +88,7 @@ with col_viz:
                    scaleanchor='x'),
         margin=dict(l=50, r=10, t=10, b=50), height=500,
     )
-    st.plotly_chart(fig, use_container_width=True, key=f"mandel_{preset}_{colorscale_name}_{max_iter}_{width}_{xmin:.4f}_{xmax:.4f}_{ymin:.4f}_{ymax:.4f}")
+    instrument.plotly_chart(fig, use_container_width=True, key=f"mandel_{preset}_{colorscale_name}_{max_iter}_{width}_{xmin:.4f}_{xmax:.4f}_{ymin:.4f}_{ymax:.4f}")
 
     # Info zone
     c_center = complex((xmin+xmax)/2, (ymin+ymax)/2)
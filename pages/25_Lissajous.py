@@ -4,10 +4,12 @@ import numpy as np
 import sys, os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils.styles import inject_css, sidebar_nav
+from utils import instrument
 
 st.set_page_config(page_title="Lissajous — Graphix", page_icon="🐢", layout="wide")
 inject_css()
 sidebar_nav()
+instrument.start(__file__)
 
 PRESETS_LIS = {
     "Cercle":           (1, 1, 0.0),
@@ -106,7 +108,7 @@ with tab1:
                        range=[-1.15,1.15], showticklabels=False, scaleanchor='x'),
             margin=dict(l=10, r=10, t=10, b=10), height=480,
         )
-        st.plotly_chart(fig, use_container_width=True,
+        instrument.plotly_chart(fig, use_container_width=True,
                         key=f"lis_{a}_{b}_{delta:.2f}_{n_pts}_{pal_l}")
 
         st.markdown(f"""
@@ -162,5 +164,5 @@ with tab2:
             yaxis=dict(showgrid=False, zeroline=False, showticklabels=False, scaleanchor='x'),
             margin=dict(l=10, r=10, t=10, b=10), height=480,
         )
-        st.plotly_chart(fig2, use_container_width=True,
+        instrument.plotly_chart(fig2, use_container_width=True,
                         key=f"epi_{R_val}_{r_val}_{d_val}_{pal_e}")
@@ -4,52 +4,20 @@ import sys, os
 
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils.styles import inject_css, sidebar_nav
+from utils import instrument
+from utils.cache import cached
+from algolab.core import sieve
+from algolab.core.sieve import primes_up_to
 
 st.set_page_config(
     page_title="Crible d'Ératosthène — Graphix", page_icon="🔢", layout="wide"
 )
 inject_css()
 sidebar_nav()
-
+instrument.start(__file__)
 
 # ── Algorithme ────────────────────────────────────────────────────────────────
-def sieve_steps(n):
-    is_prime = [True] * (n + 1)
-    is_prime[0] = is_prime[1] = False
-    steps = []
-    steps.append(
-        {
-            "is_prime": list(is_prime),
-            "current": None,
-            "multiples": [],
-            "desc": "Initialisation — tous les nombres supposés premiers sauf 0 et 1",
-        }
-    )
-    p = 2
-    while p * p <= n:
-        if is_prime[p]:
-            multiples = list(range(p * p, n + 1, p))
-            for m in multiples:
-                is_prime[m] = False
-            steps.append(
-                {
-                    "is_prime": list(is_prime),
-                    "current": p,
-                    "multiples": multiples,
-                    "desc": f"Élimination des multiples de <b>{p}</b> : {p}², {p}²+{p}, … ({len(multiples)} nombre(s) barrés)",
-                }
-            )
-        p += 1
-    primes = [i for i in range(2, n + 1) if is_prime[i]]
-    steps.append(
-        {
-            "is_prime": list(is_prime),
-            "current": None,
-            "multiples": [],
-            "desc": f"✅ Terminé — <b>{len(primes)}</b> nombres premiers jusqu'à {n}",
-        }
-    )
-    return steps
+sieve_steps = cached(sieve.sieve_steps)
 
 
 def make_sieve_fig(step, n, cols=20):
@@ -196,7 +164,7 @@ with col_ctrl:
         value=100,
     )
     steps_er = sieve_steps(n_max)
-    primes_final = [i for i, p in enumerate(steps_er[-1]["is_prime"]) if p]
+    primes_final = primes_up_to(n_max)
 
     st.markdown(
         f'<span class="complexity-badge">O(n log log n)</span>',
@@ -232,7 +200,7 @@ with col_viz:
 
     cols_grid = 20 if n_max <= 200 else 25
     fig = make_sieve_fig(s, n_max, cols=cols_grid)
-    st.plotly_chart(fig, use_container_width=True, key=f"er_{si}_{n_max}")
+    instrument.plotly_chart(fig, use_container_width=True, key=f"er_{si}_{n_max}")
 
     # Premiers trouvés jusqu'à maintenant
     found = [i for i, p in enumerate(s["is_prime"]) if p and i >= 2]
@@ -245,7 +213,7 @@ with col_viz:
     # Distribution des écarts
     if len(found) > 5:
         st.markdown("##### 📊 Écarts entre nombres premiers consécutifs")
-        st.plotly_chart(
+        instrument.plotly_chart(
             make_prime_distribution(found, n_max),
             use_container_width=True,
             key=f"er_dist_{si}_{n_max}",
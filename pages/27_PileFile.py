@@ -3,10 +3,12 @@ import plotly.graph_objects as go
 import sys, os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils.styles import inject_css, sidebar_nav
+from utils import instrument
 
 st.set_page_config(page_title="Pile & File — Graphix", page_icon="📚", layout="wide")
 inject_css()
 sidebar_nav()
+instrument.start(__file__)
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 def make_stack_fig(stack, highlight=None, label="Pile (LIFO)"):
@@ -147,7 +149,7 @@ with tab1:
 
     with col_viz:
         st.markdown(f'<div class="info-box" style="border-left-color:#06b6d4;">Pile actuelle : <b>[{", ".join(map(str,st.session_state.stack))}]</b> &nbsp;|&nbsp; Sommet (TOP) = <b>{st.session_state.stack[-1] if st.session_state.stack else "vide"}</b></div>', unsafe_allow_html=True)
-        st.plotly_chart(make_stack_fig(st.session_state.stack, st.session_state.stack_hl),
+        instrument.plotly_chart(make_stack_fig(st.session_state.stack, st.session_state.stack_hl),
                         use_container_width=True, key=f"stack_{len(st.session_state.stack)}_{st.session_state.stack_log[-1] if st.session_state.stack_log else ''}")
 
 # ── File ──────────────────────────────────────────────────────────────────────
@@ -192,7 +194,7 @@ with tab2:
     with col_viz2:
         front_val = st.session_state.queue[0] if st.session_state.queue else "vide"
         st.markdown(f'<div class="info-box" style="border-left-color:#06b6d4;">File : <b>[{", ".join(map(str,st.session_state.queue))}]</b> &nbsp;|&nbsp; Front = <b>{front_val}</b></div>', unsafe_allow_html=True)
-        st.plotly_chart(make_queue_fig(st.session_state.queue, st.session_state.queue_hl),
+        instrument.plotly_chart(make_queue_fig(st.session_state.queue, st.session_state.queue_hl),
                         use_container_width=True, key=f"queue_{len(st.session_state.queue)}_{st.session_state.queue_log[-1] if st.session_state.queue_log else ''}")
         st.markdown("""
         <div class="info-box" style="border-left-color:#10b981; font-size:0.82rem; margin-top:1rem;">
@@ -4,217 +4,20 @@ import sys, os
 
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils.styles import inject_css, sidebar_nav
+from utils import instrument
+from utils.cache import cached
+from algolab.core import rbtree
+from algolab.core.rbtree import RED
 
 st.set_page_config(
     page_title="Arbre Rouge-Noir — Graphix", page_icon="🔴", layout="wide"
 )
 inject_css()
 sidebar_nav()
+instrument.start(__file__)
 
-# ── Implémentation Arbre Rouge-Noir ───────────────────────────────────────────
-RED, BLACK = True, False
-
-
-class Node:
-    def __init__(self, key):
-        self.key = key
-        self.color = RED
-        self.left = None
-        self.right = None
-        self.parent = None
-
-
-class RBTree:
-    def __init__(self):
-        self.NIL = Node(None)
-        self.NIL.color = BLACK
-        self.NIL.left = self.NIL.right = self.NIL
-        self.root = self.NIL
-
-    def _snapshot(self, op="", detail=""):
-        def collect(node, depth=0, pos_x=0, x_offset=[0]):
-            if node == self.NIL:
-                return [], []
-            nodes_l, edges_l = [], []
-            left_n, left_e = collect(node.left, depth + 1)
-            right_n, right_e = collect(node.right, depth + 1)
-            nodes_l += left_n + right_n
-            edges_l += left_e + right_e
-            # Position x basée sur ordre in-order
-            in_order = sorted([n["key"] for n in nodes_l])
-            if in_order:
-                my_x = sum([n["x"] for n in nodes_l]) / len(nodes_l)
-            else:
-                my_x = x_offset[0]
-                x_offset[0] += 1.0
-            nodes_l.append(
-                {"key": node.key, "color": node.color, "x": my_x, "y": -depth}
-            )
-            if node.parent and node.parent != self.NIL:
-                edges_l.append((node.parent.key, node.key))
-            return nodes_l, edges_l
-
-        # Recalcul de positions propre par parcours in-order
-        keys_in_order = []
-
-        def inorder(n):
-            if n == self.NIL:
-                return
-            inorder(n.left)
-            keys_in_order.append(n.key)
-            inorder(n.right)
-
-        inorder(self.root)
-
-        nodes_info, edges_info = {}, []
-
-        def assign_pos(node, depth=0):
-            if node == self.NIL:
-                return
-            assign_pos(node.left, depth + 1)
-            x = keys_in_order.index(node.key)
-            nodes_info[node.key] = {
-                "color": node.color,
-                "x": float(x),
-                "y": float(-depth),
-            }
-            assign_pos(node.right, depth + 1)
-            if node.parent and node.parent != self.NIL:
-                edges_info.append((node.parent.key, node.key))
-
-        assign_pos(self.root)
-        return {
-            "nodes": dict(nodes_info),
-            "edges": list(edges_info),
-            "op": op,
-            "detail": detail,
-        }
-
-    def _rotate_left(self, x):
-        y = x.right
-        x.right = y.left
-        if y.left != self.NIL:
-            y.left.parent = x
-        y.parent = x.parent
-        if x.parent == self.NIL:
-            self.root = y
-        elif x == x.parent.left:
-            x.parent.left = y
-        else:
-            x.parent.right = y
-        y.left = x
-        x.parent = y
-
-    def _rotate_right(self, x):
-        y = x.left
-        x.left = y.right
-        if y.right != self.NIL:
-            y.right.parent = x
-        y.parent = x.parent
-        if x.parent == self.NIL:
-            self.root = y
-        elif x == x.parent.right:
-            x.parent.right = y
-        else:
-            x.parent.left = y
-        y.right = x
-        x.parent = y
-
-    def insert(self, key, steps):
-        z = Node(key)
-        z.left = z.right = z.parent = self.NIL
-        # BST insert
-        y, x = self.NIL, self.root
-        while x != self.NIL:
-            y = x
-            x = x.left if z.key < x.key else x.right
-        z.parent = y
-        if y == self.NIL:
-            self.root = z
-        elif z.key < y.key:
-            y.left = z
-        else:
-            y.right = z
-        steps.append(
-            self._snapshot("insert", f"Insertion BST de <b>{key}</b> (rouge)")
-        )
-        self._fix_insert(z, steps)
-
-    def _fix_insert(self, z, steps):
-        while z.parent.color == RED:
-            if z.parent == z.parent.parent.left:
-                y = z.parent.parent.right
-                if y.color == RED:
-                    z.parent.color = BLACK
-                    y.color = BLACK
-                    z.parent.parent.color = RED
-                    z = z.parent.parent
-                    steps.append(
-                        self._snapshot(
-                            "recolor",
-                            f"Recoloration : oncle rouge → parent+oncle noirs, grand-parent rouge",
-                        )
-                    )
-                else:
-                    if z == z.parent.right:
-                        z = z.parent
-                        self._rotate_left(z)
-                        steps.append(
-                            self._snapshot(
-                                "rotate_left",
-                                f"Rotation gauche sur <b>{z.key}</b>",
-                            )
-                        )
-                    z.parent.color = BLACK
-                    z.parent.parent.color = RED
-                    self._rotate_right(z.parent.parent)
-                    steps.append(
-                        self._snapshot(
-                            "rotate_right", f"Rotation droite + recoloration"
-                        )
-                    )
-            else:
-                y = z.parent.parent.left
-                if y.color == RED:
-                    z.parent.color = BLACK
-                    y.color = BLACK
-                    z.parent.parent.color = RED
-                    z = z.parent.parent
-                    steps.append(
-                        self._snapshot("recolor", f"Recoloration symétrique")
-                    )
-                else:
-                    if z == z.parent.left:
-                        z = z.parent
-                        self._rotate_right(z)
-                        steps.append(
-                            self._snapshot(
-                                "rotate_right",
-                                f"Rotation droite sur <b>{z.key}</b>",
-                            )
-                        )
-                    z.parent.color = BLACK
-                    z.parent.parent.color = RED
-                    self._rotate_left(z.parent.parent)
-                    steps.append(
-                        self._snapshot(
-                            "rotate_left", f"Rotation gauche + recoloration"
-                        )
-                    )
-        self.root.color = BLACK
-
-
-def build_tree(values):
-    tree = RBTree()
-    steps = []
-    for v in values:
-        tree.insert(v, steps)
-    steps.append(
-        tree._snapshot(
-            "done", f"✅ Arbre Rouge-Noir valide — {len(values)} nœuds"
-        )
-    )
-    return steps
+# ── Arbre Rouge-Noir ──────────────────────────────────────────────────────────
+build_tree = cached(rbtree.build_tree)
 
 
 def make_rbt_fig(snapshot, highlight_op=None):
@@ -287,30 +90,6 @@ def make_rbt_fig(snapshot, highlight_op=None):
     return fig
 
 
-def check_properties(snapshot):
-    """Vérification des 5 propriétés RBT."""
-    nodes = snapshot["nodes"]
-    if not nodes:
-        return []
-    props = [
-        ("1. Chaque nœud est rouge ou noir", True),
-        (
-            "2. La racine est noire",
-            next(iter(nodes.values()))["color"] == BLACK if nodes else True,
-        ),
-        (
-            "3. Tout nœud rouge a deux enfants noirs",
-            all(True for info in nodes.values()),
-        ),  # simplifié
-        (
-            "4. Tous les chemins racine→feuille ont le même nombre de nœuds noirs",
-            True,
-        ),
-        ("5. L'arbre est approximativement équilibré (h ≤ 2 log₂(n+1))", True),
-    ]
-    return props
-
-
 # ── UI ────────────────────────────────────────────────────────────────────────
 st.markdown(
     '<span class="page-badge" style="background:rgba(220,38,38,0.15);border:1px solid rgba(220,38,38,0.3);color:#fca5a5;">🔴 ARBRE ROUGE-NOIR</span>',
@@ -399,7 +178,7 @@ with col_viz:
 
     col_a, col_b = st.columns([3, 1])
     with col_a:
-        st.plotly_chart(
+        instrument.plotly_chart(
             make_rbt_fig(s),
             use_container_width=True,
             key=f"rbt_{step_idx}_{example}",
@@ -3,81 +3,20 @@ import plotly.graph_objects as go
 import sys, os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils.styles import inject_css, sidebar_nav
+from utils import instrument
+from utils.cache import cached
+from algolab.core import hashing
+from algolab.core.hashing import hash_fn
 
 st.set_page_config(page_title="Table de Hachage — Graphix", page_icon="#️⃣", layout="wide")
 inject_css()
 sidebar_nav()
+instrument.start(__file__)
 
-# ── Hash functions ────────────────────────────────────────────────────────────
-def hash_fn(key, size, method="modulo"):
-    if isinstance(key, int):
-        h = key
-    else:
-        h = sum(ord(c) * (31 ** i) for i, c in enumerate(str(key))) % (10**9)
-    if method == "modulo":   return h % size
-    if method == "carré":    return (h * h // 100) % size
-    if method == "djb2":
-        v = 5381
-        for c in str(key): v = ((v << 5) + v) + ord(c)
-        return abs(v) % size
-    return h % size
+# ── Algorithmes ───────────────────────────────────────────────────────────────
+chaining_steps       = cached(hashing.chaining_steps)
+linear_probing_steps = cached(hashing.linear_probing_steps)
 
-# ── Chaînage ──────────────────────────────────────────────────────────────────
-def chaining_steps(keys, size, hash_method):
-    table  = [[] for _ in range(size)]
-    steps  = []
-    steps.append({"table": [list(b) for b in table], "current_key": None, "current_idx": None,
-                  "collisions": 0, "desc": f"Table de {size} buckets vide — méthode : {hash_method}"})
-    collisions = 0
-    for key in keys:
-        idx = hash_fn(key, size, hash_method)
-        if table[idx]:
-            collisions += 1
-            desc = f"🔴 Collision : <b>{key}</b> → bucket[{idx}] déjà occupé → chaîné"
-        else:
-            desc = f"✅ <b>{key}</b> → hash={idx} → bucket[{idx}] libre"
-        table[idx].append(key)
-        steps.append({"table": [list(b) for b in table], "current_key": key,
-                      "current_idx": idx, "collisions": collisions, "desc": desc})
-    steps.append({"table": [list(b) for b in table], "current_key": None, "current_idx": None,
-                  "collisions": collisions,
-                  "desc": f"✅ {len(keys)} clés insérées, {collisions} collision(s), facteur de charge = {len(keys)/size:.2f}"})
-    return steps
-
-# ── Sondage linéaire ──────────────────────────────────────────────────────────
-def linear_probing_steps(keys, size, hash_method):
-    table  = [None] * size
-    steps  = []
-    steps.append({"table": list(table), "current_key": None, "current_idx": None,
-                  "probes": [], "collisions": 0,
-                  "desc": f"Table de {size} slots vide — sondage linéaire"})
-    collisions = 0
-    for key in keys:
-        idx   = hash_fn(key, size, hash_method)
-        orig  = idx
-        probes = [idx]
-        probe_count = 0
-        while table[idx] is not None and probe_count < size:
-            idx = (idx + 1) % size
-            probes.append(idx)
-            probe_count += 1
-        if probe_count > 0:
-            collisions += 1
-            desc = f"🔴 Collision : <b>{key}</b> → hash={orig} occupé → sondage → slot[{idx}] libre ({probe_count} sonde(s))"
-        else:
-            desc = f"✅ <b>{key}</b> → hash={idx} → slot libre"
-        if probe_count < size:
-            table[idx] = key
-            steps.append({"table": list(table), "current_key": key, "current_idx": idx,
-                          "probes": list(probes), "collisions": collisions, "desc": desc})
-        else:
-            steps.append({"table": list(table), "current_key": key, "current_idx": None,
-                          "probes": list(probes), "collisions": collisions,
-                          "desc": f"⚠️ Table pleine ! <b>{key}</b> ne peut pas être inséré"})
-    steps.append({"table": list(table), "current_key": None, "current_idx": None,
-                  "probes": [], "collisions": collisions,
-                  "desc": f"✅ {sum(1 for t in table if t)} clés insérées sur {size} slots, {collisions} collision(s)"})
-    return steps
 
 # ── Figures ───────────────────────────────────────────────────────────────────
 def make_chaining_fig(step, size):
@@ -190,7 +129,7 @@ with tab1:
         si_c = st.slider("Étape", 0, len(steps_c)-1, 0, key="ht_step_c")
         s = steps_c[si_c]
         st.markdown(f'<div class="info-box" style="border-left-color:#7c3aed;">{s["desc"]}</div>', unsafe_allow_html=True)
-        st.plotly_chart(make_chaining_fig(s, size_c), use_container_width=True,
+        instrument.plotly_chart(make_chaining_fig(s, size_c), use_container_width=True,
                         key=f"ht_chain_{si_c}_{size_c}_{raw_c}")
 
 # ── Sondage linéaire ──────────────────────────────────────────────────────────
@@ -230,7 +169,7 @@ with tab2:
         si_p = st.slider("Étape", 0, len(steps_p)-1, 0, key="ht_step_p")
         s2   = steps_p[si_p]
         st.markdown(f'<div class="info-box" style="border-left-color:#06b6d4;">{s2["desc"]}</div>', unsafe_allow_html=True)
-        st.plotly_chart(make_probing_fig(s2, size_p), use_container_width=True,
+        instrument.plotly_chart(make_probing_fig(s2, size_p), use_container_width=True,
                         key=f"ht_probe_{si_p}_{size_p}_{raw_p}")
 
         # Distribution des longueurs de chaînes
@@ -252,7 +191,7 @@ with tab2:
                 yaxis=dict(showgrid=False, showticklabels=False),
                 margin=dict(l=10,r=10,t=10,b=40), height=140, showlegend=False,
             )
-            st.plotly_chart(fig3, use_container_width=True, key=f"ht_dist_{si_p}_{size_p}")
+            instrument.plotly_chart(fig3, use_container_width=True, key=f"ht_dist_{si_p}_{size_p}")
 
 # ── Fonctions de hachage ──────────────────────────────────────────────────────
 with tab3:
@@ -284,4 +223,5 @@ with tab3:
             yaxis=dict(showgrid=True, gridcolor='#1e1e2e'),
             margin=dict(l=20,r=10,t=35,b=30), height=200, showlegend=False,
         )
-        col_fn.plotly_chart(fig_fn, use_container_width=True, key=f"ht_fn_{fn}_{size_demo}")
+        with col_fn:
+            instrument.plotly_chart(fig_fn, use_container_width=True, key=f"ht_fn_{fn}_{size_demo}")
@@ -3,30 +3,22 @@ import plotly.graph_objects as go
 import sys, os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils.styles import inject_css, sidebar_nav
+from utils import instrument, frames, jobs, player
+from utils.cache import cached
+from algolab.core import hanoi
+from algolab.core.hanoi import hanoi_state, hanoi_states
 
 st.set_page_config(page_title="Hanoï — Graphix", page_icon="🗼", layout="wide")
 inject_css()
 sidebar_nav()
+instrument.start(__file__)
 
 # ── Algorithme ────────────────────────────────────────────────────────────────
 
 DISK_COLORS = ["#7c3aed","#06b6d4","#10b981","#f59e0b","#ef4444","#ec4899","#8b5cf6","#14b8a6"]
 
-def hanoi_moves(n):
-    moves = []
-    def solve(k, src, tgt, aux):
-        if k == 0: return
-        solve(k-1, src, aux, tgt)
-        moves.append((src, tgt, k))
-        solve(k-1, aux, tgt, src)
-    solve(n, 'A', 'C', 'B')
-    return moves
-
-def build_state(n_disks, moves_done):
-    towers = {'A': list(range(n_disks, 0, -1)), 'B': [], 'C': []}
-    for src, tgt, _ in moves_done:
-        towers[tgt].append(towers[src].pop())
-    return towers
+hanoi_moves = cached(hanoi.hanoi_moves)
+
 
 def make_hanoi_frame_data(towers, n_disks, highlight=None):
     """Retourne shapes + annotations pour un état donné des tours."""
@@ -48,7 +40,7 @@ def make_hanoi_frame_data(towers, n_disks, highlight=None):
             font=dict(color='#e2e8f0', size=16, family='Space Mono')))
         # Disques
         for row, disk in enumerate(towers[t]):
-            w = disk * 0.8 + 0.4
+            w = disk * min(0.8, 5.6 / n_disks) + 0.4  # largeur bornée au-delà de 7 disques
             color  = DISK_COLORS[(disk-1) % len(DISK_COLORS)]
             border = "#ffffff" if highlight == disk else color
             lw     = 2 if highlight == disk else 0
@@ -61,27 +53,18 @@ def make_hanoi_frame_data(towers, n_disks, highlight=None):
 
     return shapes, annotations
 
-def make_animated_fig(n_disks, all_moves):
-    total = len(all_moves)
+def step_desc(n_disks, k):
+    total = 2**n_disks - 1
+    if k == 0:
+        return f"État initial : {n_disks} disques sur la tour A"
+    elif k == total:
+        return "✅ Terminé ! Tous les disques sont sur la tour C."
+    else:
+        src, tgt, disk = hanoi.hanoi_move(n_disks, k)
+        return f"Mouvement {k:,}/{total:,} — Disque <b>{disk}</b> : Tour {src} → Tour {tgt}"
 
-    def step_desc(k):
-        if k == 0:
-            return f"État initial : {n_disks} disques sur la tour A"
-        elif k == total:
-            return "✅ Terminé ! Tous les disques sont sur la tour C."
-        else:
-            src, tgt, disk = all_moves[k-1]
-            return f"Mouvement {k}/{total} — Disque <b>{disk}</b> : Tour {src} → Tour {tgt}"
-
-    # Pré-calcul de tous les états
-    all_states = []
-    for k in range(total + 1):
-        towers = build_state(n_disks, all_moves[:k])
-        highlight = all_moves[k-1][2] if k > 0 else None
-        shapes, annots = make_hanoi_frame_data(towers, n_disks, highlight)
-        all_states.append((shapes, annots, step_desc(k)))
-
-    base_layout = dict(
+def hanoi_layout(n_disks):
+    return dict(
         paper_bgcolor='#0a0a0f', plot_bgcolor='#111118',
         xaxis=dict(range=[0, 6.5], showgrid=False, showticklabels=False, zeroline=False),
         yaxis=dict(range=[-1.2, n_disks+1.8], showgrid=False, showticklabels=False, zeroline=False),
@@ -89,12 +72,43 @@ def make_animated_fig(n_disks, all_moves):
         height=420,
     )
 
+def make_state_fig(n_disks, k):
+    """Figure d'un seul état (lecture à la demande, grand n)."""
+    towers = hanoi_state(n_disks, k)  # forme close : O(n) quel que soit k
+    highlight = hanoi.hanoi_move(n_disks, k)[2] if k > 0 else None
+    shapes, annots = make_hanoi_frame_data(towers, n_disks, highlight)
+    return go.Figure(
+        data=[go.Scatter(x=[None], y=[None], mode='markers', showlegend=False)],
+        layout=go.Layout(
+            **hanoi_layout(n_disks),
+            shapes=shapes,
+            annotations=annots + [dict(
+                x=0.5, y=1.08, xref='paper', yref='paper',
+                text=step_desc(n_disks, k), showarrow=False,
+                font=dict(color='#94a3b8', size=12, family='DM Sans'), align='center')],
+        ),
+    )
+
+def make_animated_fig(n_disks, all_moves):
+    total = len(all_moves)
+
+    # Pré-calcul des états animés (budget de frames : les gros disques d'abord)
+    sh0, an0 = make_hanoi_frame_data(hanoi_state(n_disks, 0), n_disks)
+    keep = frames.select(total + 1, lambda k: all_moves[k-1][2],
+                         frames.budget({"shapes": sh0, "annotations": an0}))
+    frames.caption(len(keep), total + 1, "états")
+    all_states = []
+    for k, towers in hanoi_states(n_disks, all_moves, keep):
+        highlight = all_moves[k-1][2] if k > 0 else None
+        shapes, annots = make_hanoi_frame_data(towers, n_disks, highlight)
+        all_states.append((shapes, annots, step_desc(n_disks, k)))
+
     sh0, an0, desc0 = all_states[0]
     fig = go.Figure(
         # Trace fantôme invisible — les disques sont dans les shapes/annotations
         data=[go.Scatter(x=[None], y=[None], mode='markers', showlegend=False)],
         layout=go.Layout(
-            **base_layout,
+            **hanoi_layout(n_disks),
             shapes=sh0,
             annotations=an0 + [dict(
                 x=0.5, y=1.08, xref='paper', yref='paper',
@@ -127,7 +141,7 @@ def make_animated_fig(n_disks, all_moves):
                             args=[[f"h{k}"], dict(mode="immediate",
                                                   frame=dict(duration=500, redraw=True),
                                                   transition=dict(duration=150))],
-                            label=str(k)) for k in range(total+1)],
+                            label=str(k)) for k in keep],
             )],
         ),
         frames=[
@@ -142,11 +156,91 @@ def make_animated_fig(n_disks, all_moves):
                         font=dict(color='#94a3b8', size=12, family='DM Sans'), align='center')],
                 )
             )
-            for k, (sh, an, desc) in enumerate(all_states)
+            for k, (sh, an, desc) in zip(keep, all_states)
         ],
     )
     return fig
 
+# ── Grand n : coups parcourus sans être stockés ──────────────────────────────
+STREAM_LIMITS = {10**6: "10⁶", 10**7: "10⁷", 10**8: "10⁸"}
+STREAM_CHUNKS = 16
+
+
+def submit_stream(n_disks, limit):
+    """Coups 1 … limit répartis en intervalles comptés dans le pool."""
+    bounds = [1 + limit * i // STREAM_CHUNKS for i in range(STREAM_CHUNKS + 1)]
+    return jobs.submit("hanoi_stream", (n_disks, limit), [
+        (lo, hanoi.stream_counts, (n_disks, lo, hi)) for lo, hi in zip(bounds, bounds[1:]) if hi > lo
+    ])
+
+
+def render_stream(job):
+    if job is None:
+        return
+    n, limit = job.params
+    if not job.done:
+        st.progress(job.progress, text=f"Parcours des coups… {job.progress:.0%}")
+    r = job.results()
+    if not r:
+        return
+    per_disk = [sum(c) for c in zip(*(x["per_disk"] for x in r.values()))]
+    moves = sum(x["moves"] for x in r.values())
+    rate = moves / sum(x["ms"] for x in r.values()) * 1000
+    disks = list(range(1, n + 1))
+    fig = go.Figure([
+        go.Bar(x=disks, y=per_disk, name="comptés", marker_color=[DISK_COLORS[(d-1) % len(DISK_COLORS)] for d in disks],
+               hovertemplate="Disque %{x}<br>%{y:,} coups<extra></extra>"),
+        go.Scatter(x=disks, y=hanoi.disk_moves(n, limit), name="attendus : 2ⁿ⁻ᵈ", mode="markers",
+                   marker=dict(color="#e2e8f0", symbol="line-ew-open", size=14)),
+    ])
+    fig.update_layout(
+        paper_bgcolor='#0a0a0f', plot_bgcolor='#111118',
+        font=dict(color='#e2e8f0', family='DM Sans'),
+        xaxis=dict(title="disque", dtick=1 if n <= 16 else 2, showgrid=False),
+        yaxis=dict(title="coups", type="log", showgrid=True, gridcolor='#1e1e2e'),
+        legend=dict(bgcolor='#111118', bordercolor='#1e1e2e'),
+        margin=dict(l=40, r=20, t=20, b=40), height=320,
+    )
+    instrument.plotly_chart(fig, width='stretch', key="hanoi_stream")
+    if job.done:
+        ok = per_disk == hanoi.disk_moves(n, limit)
+        st.markdown(
+            f'<div class="info-box" style="border-left-color:#06b6d4;">{"✅" if ok else "⚠️"} <b>{moves:,}</b> coups parcourus, '
+            f'<b>{rate / 1e6:.2f} M coups/s</b> par processus ; les 2ⁿ − 1 = {2**n - 1:,} coups prendraient '
+            f'≈ {(2**n - 1) / rate:,.0f} s sur un seul cœur. Fréquences par disque {"conformes" if ok else "différentes de"} '
+            f'la forme close.</div>',
+            unsafe_allow_html=True,
+        )
+
+
+def large_n_mode(n_disks):
+    total = 2**n_disks - 1
+    st.markdown(
+        '<div class="info-box" style="border-left-color:#06b6d4;">Le coup k se lit dans l\'écriture binaire de k : '
+        'le disque déplacé est le rang du bit de poids faible, le départ <code>(k & (k−1)) mod 3</code> et '
+        'l\'arrivée <code>((k | (k−1)) + 1) mod 3</code>. Les coups sont produits un à un, sans liste, '
+        'et la configuration après n\'importe quel coup se calcule en O(n).</div>',
+        unsafe_allow_html=True,
+    )
+    m1, m2, m3 = st.columns(3)
+    m1.metric("Coups", f"{total:,}")
+    m2.metric("Liste de coups", f"≈ {total * 72 / 2**30:,.2f} Go", help="Tuple de 3 éléments + pointeur de liste, par coup.")
+    m3.metric("Générateur", "O(1) / coup")
+
+    st.markdown("#### 🧭 Configurations échantillonnées")
+    samples = sorted({total * i // 16 for i in range(17)})
+    k = st.select_slider("Après le coup", samples, key=f"hanoi_sample_{n_disks}", format_func=lambda k: f"{k:,}")
+    instrument.plotly_chart(make_state_fig(n_disks, k), width='stretch', key="hanoi_sample")
+
+    st.markdown("#### 📈 Fréquences par disque et débit")
+    limits = [l for l in STREAM_LIMITS if l < total] + [total]
+    limit = st.select_slider("Coups à parcourir", limits, min(10**6, total), key="hanoi_limit",
+                             format_func=lambda l: STREAM_LIMITS.get(l, f"tous ({l:,})"))
+    job = jobs.current("hanoi_stream", (n_disks, limit))
+    if st.button("🚀 Parcourir les coups", width='stretch', type="primary"):
+        job = submit_stream(n_disks, limit)
+    jobs.live(job, render_stream)
+
 # ── UI ────────────────────────────────────────────────────────────────────────
 st.markdown('<span class="page-badge" style="background:rgba(6,182,212,0.15);border:1px solid rgba(6,182,212,0.3);color:#67e8f9;">🗼 TOURS DE HANOÏ</span>', unsafe_allow_html=True)
 st.markdown('<div class="page-title">Tours de Hanoï</div>', unsafe_allow_html=True)
@@ -156,10 +250,13 @@ col_ctrl, col_viz = st.columns([1, 3])
 
 with col_ctrl:
     st.markdown("#### ⚙️ Paramètres")
-    n_disks = st.slider("Nombre de disques", 2, 7, 3)
+    mode = st.radio("Lecture", ["Animation", "À la demande", "Grand n"], horizontal=True,
+                    help="« À la demande » n'envoie que l'état affiché : jusqu'à 16 disques. "
+                         "« Grand n » (jusqu'à 30) ne garde aucun coup en mémoire.")
+    n_disks = st.slider("Nombre de disques", 2, {"Animation": 7, "À la demande": 16, "Grand n": 30}[mode], 3)
 
     total_moves = 2**n_disks - 1
-    st.markdown(f'<span class="complexity-badge">Total : {total_moves} mouvements</span>', unsafe_allow_html=True)
+    st.markdown(f'<span class="complexity-badge">Total : {total_moves:,} mouvements</span>', unsafe_allow_html=True)
     st.markdown(f'<span class="complexity-badge" style="margin-top:6px;display:inline-block;">O(2ⁿ) · n={n_disks}</span>', unsafe_allow_html=True)
 
     st.markdown("---")
@@ -180,6 +277,16 @@ with col_ctrl:
         st.markdown(f'<span style="color:{c};font-family:Space Mono,monospace;font-size:0.85rem;">● Disque {i}</span>', unsafe_allow_html=True)
 
 with col_viz:
-    all_moves = hanoi_moves(n_disks)
-    fig = make_animated_fig(n_disks, all_moves)
-    st.plotly_chart(fig, width='stretch', key=f"hanoi_{n_disks}")
+    if mode == "Grand n":
+        large_n_mode(n_disks)
+    elif mode == "À la demande":
+        player.play(f"hanoi_{n_disks}", 2**n_disks,
+                    lambda k: instrument.plotly_chart(make_state_fig(n_disks, k),
+                                                      width='stretch', key="hanoi_live"),
+                    label="Mouvement")
+    else:
+        with instrument.phase("calcul"):
+            all_moves = hanoi_moves(n_disks)
+        with instrument.phase("figure"):
+            fig = make_animated_fig(n_disks, all_moves)
+        instrument.plotly_chart(fig, width='stretch', key=f"hanoi_{n_disks}")
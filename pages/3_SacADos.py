@@ -1,43 +1,22 @@
 import streamlit as st
 import plotly.graph_objects as go
 import numpy as np
-import sys, os
+import sys, os, random
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils.styles import inject_css, sidebar_nav
+from utils import instrument, frames, jobs, traces
+from utils.cache import cached
+from algolab.core import knapsack
+from algolab.bench import classic
 
 st.set_page_config(page_title="Sac à Dos — Graphix", page_icon="🎒", layout="wide")
 inject_css()
 sidebar_nav()
+instrument.start(__file__)
 
 # ── Algorithme ────────────────────────────────────────────────────────────────
+knapsack_dp = cached(knapsack.knapsack_dp)
 
-def knapsack_dp(weights, values, capacity):
-    n  = len(weights)
-    dp = np.zeros((n+1, capacity+1), dtype=int)
-    steps = []
-
-    for i in range(1, n+1):
-        for w in range(capacity+1):
-            if weights[i-1] <= w:
-                take   = values[i-1] + dp[i-1][w - weights[i-1]]
-                notake = dp[i-1][w]
-                dp[i][w] = take if take > notake else notake
-                action = (f"Objet {i} ({values[i-1]}€, {weights[i-1]}kg) → PRIS (gain {take} > {notake})"
-                          if take > notake else
-                          f"Objet {i} ({values[i-1]}€, {weights[i-1]}kg) → IGNORÉ ({notake} ≥ {take})")
-            else:
-                dp[i][w] = dp[i-1][w]
-                action   = f"Objet {i} trop lourd ({weights[i-1]}kg > {w}kg dispo) → IGNORÉ"
-            steps.append((i, w, dp.copy(), action))
-
-    chosen, ci, cw = [], n, capacity
-    while ci > 0 and cw > 0:
-        if dp[ci][cw] != dp[ci-1][cw]:
-            chosen.append(ci-1)
-            cw -= weights[ci-1]
-        ci -= 1
-
-    return dp, steps, chosen
 
 def hex_to_rgba(h, a):
     h = h.lstrip('#')
@@ -56,24 +35,26 @@ def make_items_bar(weights, values, n, chosen_indices, current_item):
                textposition='auto', textfont=dict(color='white', size=10)),
     ]
 
-def make_dp_heatmap(dp_partial, hi, hw):
-    z    = dp_partial.astype(float)
-    rows, cols = z.shape
-    # Masquer les cellules pas encore remplies
-    for c in range(cols):
-        if c > hw:
-            z[hi][c] = float('nan')
-    text = [[str(int(v)) if not np.isnan(v) else "" for v in row] for row in z]
+def make_dp_heatmap(z):
+    """Table partielle (cellules à venir en NaN) ; valeurs écrites jusqu'à 40 colonnes."""
+    labels, gap = {}, 2 if z.shape[1] <= 40 else 0
+    if gap:
+        labels = dict(text=[[str(int(v)) if not np.isnan(v) else "" for v in row] for row in z],
+                      texttemplate="%{text}")
     return go.Heatmap(
-        z=z, text=text, texttemplate="%{text}",
+        z=z, **labels,
         textfont=dict(size=10, color='white', family='Space Mono'),
         colorscale=[[0,'#111118'],[0.5,'#1e3a5f'],[1,'#06b6d4']],
-        showscale=False, xgap=2, ygap=2,
+        showscale=False, xgap=gap, ygap=2,
     )
 
 def make_animated_fig(weights, values, names, capacity, steps, chosen):
     n       = len(weights)
     n_steps = len(steps)
+    change  = steps.changes()  # cellules « pris » en priorité
+    keep    = frames.select(n_steps, lambda k: change[k],
+                            frames.budget(make_dp_heatmap(steps.table(n_steps - 1))))
+    frames.caption(len(keep), n_steps, "cellules")
 
     # ── Figure principale : deux sous-graphiques (items + DP table) ───────────
     from plotly.subplots import make_subplots
@@ -85,10 +66,11 @@ def make_animated_fig(weights, values, names, capacity, steps, chosen):
     )
 
     # Frame initiale
-    si0, sw0, dp0, act0 = steps[0]
+    s0 = steps[0]
+    si0, sw0, act0 = s0["i"], s0["w"], s0["action"]
     for tr in make_items_bar(weights, values, n, [], si0-1):
         fig.add_trace(tr, row=1, col=1)
-    fig.add_trace(make_dp_heatmap(dp0[:si0+1, :capacity+1], si0, sw0), row=2, col=1)
+    fig.add_trace(make_dp_heatmap(steps.table(0)), row=2, col=1)
 
     fig.update_layout(
         paper_bgcolor='#0a0a0f', plot_bgcolor='#111118',
@@ -146,17 +128,19 @@ def make_animated_fig(weights, values, names, capacity, steps, chosen):
                         args=[[f"k{k}"], dict(mode="immediate",
                                               frame=dict(duration=80, redraw=True),
                                               transition=dict(duration=40))],
-                        label=str(k)) for k in range(n_steps)],
+                        label=str(k)) for k in keep],
         )],
     )
 
     # Frames
-    frames = []
-    for k, (si, sw, dp_s, action) in enumerate(steps):
+    fig_frames = []
+    for k in keep:
+        s = steps[k]
+        si, sw, action = s["i"], s["w"], s["action"]
         done_chosen = chosen if k == n_steps-1 else []
         bar_traces  = make_items_bar(weights, values, n, done_chosen, si-1)
-        dp_trace    = make_dp_heatmap(dp_s[:si+1, :capacity+1], si, sw)
-        frames.append(go.Frame(
+        dp_trace    = make_dp_heatmap(steps.table(k))
+        fig_frames.append(go.Frame(
             name=f"k{k}",
             data=bar_traces + [dp_trace],
             traces=[0, 1, 2],
@@ -181,7 +165,7 @@ def make_animated_fig(weights, values, names, capacity, steps, chosen):
                 )],
             )
         ))
-    fig.frames = frames
+    fig.frames = fig_frames
     return fig
 
 # ── UI ────────────────────────────────────────────────────────────────────────
@@ -201,7 +185,9 @@ col_ctrl, col_viz = st.columns([1, 3])
 
 with col_ctrl:
     st.markdown("#### ⚙️ Paramètres")
-    capacity = st.slider("Capacité du sac (kg)", 3, 15, 6)
+    capacity = st.number_input("Capacité du sac (kg)", 3, 5000, 6, step=1,
+                               help="La table garde une valeur et une décision par cellule : "
+                                    "quelques milliers restent légers.")
     n_items  = st.slider("Nombre d'objets", 3, 8, 5)
 
     st.markdown("---")
@@ -218,7 +204,9 @@ with col_ctrl:
     values  = [x[1] for x in items_data]
     names   = [x[2] for x in items_data]
 
-    dp_final, steps, chosen = knapsack_dp(weights, values, capacity)
+    with instrument.phase("calcul"):
+        dp_final, steps, chosen = knapsack_dp(weights, values, capacity)
+    traces.panel("sacados", steps, meta={"capacity": capacity}, replay=False)
     total_value  = sum(values[i]  for i in chosen)
     total_weight = sum(weights[i] for i in chosen)
 
@@ -228,8 +216,9 @@ with col_ctrl:
     st.metric("📦 Objets sélectionnés",  f"{len(chosen)} / {n_items}")
 
 with col_viz:
-    fig = make_animated_fig(weights, values, names, capacity, steps, chosen)
-    st.plotly_chart(fig, width='stretch', key=f"ks_{n_items}_{capacity}_{weights}")
+    with instrument.phase("figure"):
+        fig = make_animated_fig(weights, values, names, capacity, steps, chosen)
+    instrument.plotly_chart(fig, width='stretch', key=f"ks_{n_items}_{capacity}_{weights}")
 
     if chosen:
         st.markdown("---")
@@ -244,3 +233,129 @@ with col_viz:
                 <span style="color:#64748b;">{values[c]}€ · {weights[c]}kg</span>
             </div>
             """, unsafe_allow_html=True)
+
+# ── Grandes instances ─────────────────────────────────────────────────────────
+st.markdown("---")
+st.markdown("### ⚡ Grandes instances — DP vectorisée")
+st.markdown(
+    '<div class="info-box">Chaque objet est traité en une seule opération NumPy : '
+    '<code>dp[w:] = max(dp[w:], dp[:-w] + v)</code> sur un tableau 1-D roulant. Un bit par cellule '
+    '(pris / ignoré, compacté par <code>np.packbits</code>) suffit pour retrouver la solution. '
+    'Variante bornée : chaque objet devient des lots de 1, 2, 4… exemplaires ; illimitée : '
+    'maximum préfixe par classe de capacité modulo le poids.</div>',
+    unsafe_allow_html=True,
+)
+KINDS = {"0/1": "01", "Borné (1 à 5 exemplaires)": "bounded", "Illimité": "unbounded"}
+g1, g2, g3 = st.columns(3)
+big_kind = KINDS[g1.radio("Variante", list(KINDS), key="ks_big_kind")]
+big_n = g2.select_slider("Objets", [100, 1000, 10**4], 1000, key="ks_big_n", format_func="{:,}".format)
+big_c = g3.select_slider("Capacité", [10**4, 10**5, 10**6], 10**5, key="ks_big_c", format_func="{:,}".format)
+rows = big_n * (3 if big_kind == "bounded" else 1)
+st.caption(f"Matrice pris / ignoré : ≈ {rows * (big_c + 1) / 8 / 2**20:,.1f} Mo "
+           f"({'≈ ' if big_kind == 'bounded' else ''}{rows:,} lignes × {big_c + 1:,} capacités, un bit chacune).")
+big_params = (big_kind, big_n, big_c)
+big_job = jobs.current("ks_big", big_params)
+if st.button("🚀 Résoudre", width='stretch', type="primary", key="ks_big_run"):
+    big_job = jobs.submit("ks_big", big_params,
+                          [("dp", classic.time_knapsack, (big_n, big_c, big_kind, random.randrange(2**32)))])
+
+
+def render_big(job):
+    if job is None:
+        return
+    if not job.done:
+        st.progress(job.progress, text="Résolution en cours…")
+    for err in job.errors().values():
+        st.error(f"Résolution impossible : {err}")
+    r = job.results().get("dp")
+    if not r:
+        return
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("💰 Valeur optimale", f"{r['value']:,}")
+    m2.metric("📦 Exemplaires pris", f"{r['taken']:,}")
+    m3.metric("⏱️ Durée", f"{r['ms'] / 1000:.2f} s")
+    m4.metric("🧮 Cellules / s", f"{r['nodes'] / r['ms'] * 1000:.2e}")
+    st.caption(f"Matrice compactée : {r['packed_bytes'] / 2**20:,.1f} Mo.")
+
+
+jobs.live(big_job, render_big)
+
+# ── Trois approches ───────────────────────────────────────────────────────────
+st.markdown("---")
+st.markdown("### 🏁 DP, séparation-évaluation, rencontre au milieu")
+st.markdown(
+    '<div class="info-box">La DP est pseudo-polynomiale : son coût suit la capacité, inutilisable pour des '
+    'poids de l\'ordre de 10⁹. La <b>séparation-évaluation</b> explore d\'abord le nœud de meilleure borne '
+    '(remplissage glouton fractionnaire) et s\'arrête dès que cette borne ne peut plus battre la meilleure '
+    'solution. La <b>rencontre au milieu</b> énumère les 2^(n/2) sous-ensembles de chaque moitié et associe '
+    'à chacun, par recherche dichotomique, le meilleur complément de l\'autre moitié (n ≤ 40).</div>',
+    unsafe_allow_html=True,
+)
+SOLVERS = {"dp": ("DP vectorisée", "#06b6d4"), "bb": ("Séparation-évaluation", "#f59e0b"),
+           "mitm": ("Rencontre au milieu", "#10b981")}
+SCALES = {10**3: "10³", 10**6: "10⁶", 10**9: "10⁹"}
+DP_MAX_CAPACITY = 10**6
+h1, h2 = st.columns(2)
+cmp_scale = h1.select_slider("Capacité (poids jusqu'à C/10)", list(SCALES), 10**6, key="ks_cmp_c",
+                             format_func=SCALES.get)
+cmp_max = h2.slider("Objets (jusqu'à)", 10, 40, 30, step=5, key="ks_cmp_n")
+cmp_sizes = list(range(10, cmp_max + 1, 5))
+cmp_solvers = [s for s in SOLVERS if s != "dp" or cmp_scale <= DP_MAX_CAPACITY]
+if cmp_scale > DP_MAX_CAPACITY:
+    st.caption(f"DP écartée : une table de {cmp_scale:,} capacités par objet est hors de portée.")
+cmp_params = (cmp_scale, cmp_max)
+cmp_job = jobs.current("ks_cmp", cmp_params)
+if st.button("🏁 Comparer", width='stretch', type="primary", key="ks_cmp_run"):
+    seed = random.randrange(2**32)
+    cmp_job = jobs.submit("ks_cmp", cmp_params, [
+        ((solver, n), classic.time_knapsack, (n, cmp_scale, "01", seed + n, solver))
+        for n in cmp_sizes for solver in cmp_solvers
+    ])
+
+
+def render_cmp(job):
+    if job is None:
+        return
+    if not job.done:
+        st.progress(job.progress, text=f"Mesure en cours… {job.progress:.0%}")
+    for (solver, n), err in job.errors().items():
+        st.error(f"{SOLVERS[solver][0]}, n = {n} : {err}")
+    r = job.results()
+    if not r:
+        return
+    fig = go.Figure()
+    for solver, (label, color) in SOLVERS.items():
+        pts = sorted((n, m) for (s, n), m in r.items() if s == solver)
+        if pts:
+            fig.add_trace(go.Scatter(
+                x=[n for n, _ in pts], y=[m["ms"] for _, m in pts], name=label, mode="lines+markers",
+                line=dict(color=color, width=2),
+                customdata=[[m["nodes"], m["nodes"] / max(m["ms"], 1e-6) * 1000] for _, m in pts],
+                hovertemplate="n=%{x}<br>%{y:.2f} ms<br>%{customdata[0]:,} nœuds · %{customdata[1]:.2e}/s<extra></extra>",
+            ))
+    fig.update_layout(
+        paper_bgcolor='#0a0a0f', plot_bgcolor='#111118',
+        font=dict(color='#e2e8f0', family='DM Sans'),
+        xaxis=dict(title="objets", showgrid=False),
+        yaxis=dict(title="durée (ms)", type="log", showgrid=True, gridcolor='#1e1e2e'),
+        legend=dict(bgcolor='#111118', bordercolor='#1e1e2e'),
+        margin=dict(l=40, r=20, t=20, b=40), height=340,
+    )
+    instrument.plotly_chart(fig, width='stretch', key="ks_cmp")
+    n = max(n for _, n in r)
+    rows = "".join(
+        f"<tr><td>{SOLVERS[s][0]}</td><td>{m['value']:,}</td><td>{m['ms']:.2f}</td><td>{m['nodes']:,}</td>"
+        f"<td>{m['nodes'] / max(m['ms'], 1e-6) * 1000:.2e}</td><td>{'✓' if m.get('complete', True) else '⚠️ plafond'}</td></tr>"
+        for (s, k), m in r.items() if k == n
+    )
+    st.markdown(
+        f"<b>n = {n}</b> (même instance pour les trois)"
+        f'<table style="width:100%;font-size:0.9rem;"><tr><th>Approche</th><th>Valeur</th><th>ms</th>'
+        f"<th>Nœuds</th><th>Nœuds / s</th><th>Optimum prouvé</th></tr>{rows}</table>",
+        unsafe_allow_html=True,
+    )
+    st.caption("Nœuds : cellules de la table (DP), nœuds développés (séparation-évaluation), "
+               "sous-ensembles énumérés (rencontre au milieu).")
+
+
+jobs.live(cmp_job, render_cmp)
@@ -1,12 +1,18 @@
 import streamlit as st
 import plotly.graph_objects as go
-import heapq, collections, math, sys, os
+import math, sys, os, time
+import numpy as np
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils.styles import inject_css, sidebar_nav
+from utils import instrument, traces
+from utils.cache import cached
+from algolab.core import csr, graphio, graphs, pagerank
+from algolab.core.graphs import get_path_edges
 
 st.set_page_config(page_title="Graphes — Graphix", page_icon="🕸️", layout="wide")
 inject_css()
 sidebar_nav()
+instrument.start(__file__)
 
 # ── Graphes prédéfinis ────────────────────────────────────────────────────────
 
@@ -40,67 +46,11 @@ def compute_layout(nodes):
     return pos
 
 # ── Algorithmes ───────────────────────────────────────────────────────────────
+csr_graph      = cached(csr.CSRGraph.from_edges)  # construit une fois par graphe
+dijkstra_steps = cached(graphs.dijkstra_steps)
+bfs_steps      = cached(graphs.bfs_steps)
+dfs_steps      = cached(graphs.dfs_steps)
 
-def dijkstra_steps(nodes, edges, start):
-    graph = collections.defaultdict(list)
-    for u, v, w in edges:
-        graph[u].append((v, w)); graph[v].append((u, w))
-    dist = {n: float('inf') for n in nodes}
-    dist[start] = 0
-    prev = {n: None for n in nodes}
-    pq, visited, steps = [(0, start)], set(), []
-    while pq:
-        d, u = heapq.heappop(pq)
-        if u in visited: continue
-        visited.add(u)
-        steps.append({"visited": set(visited), "current": u, "dist": dict(dist), "prev": dict(prev),
-                      "desc": f"Visite <b>{u}</b> (distance={d})"})
-        for v, w in graph[u]:
-            if v not in visited and dist[u]+w < dist[v]:
-                dist[v] = dist[u]+w; prev[v] = u
-                heapq.heappush(pq, (dist[v], v))
-                steps.append({"visited": set(visited), "current": v, "dist": dict(dist), "prev": dict(prev),
-                               "desc": f"Mise à jour : dist[<b>{v}</b>] = {dist[v]} (via {u})"})
-    return steps, dist, prev
-
-def bfs_steps(nodes, edges, start):
-    graph = collections.defaultdict(list)
-    for u, v, _ in edges:
-        graph[u].append(v); graph[v].append(u)
-    visited, queue, steps = set([start]), collections.deque([start]), []
-    while queue:
-        u = queue.popleft()
-        steps.append({"visited": set(visited), "current": u,
-                      "desc": f"Défilement : <b>{u}</b> | File : {list(queue) or ['vide']}"})
-        for v in sorted(graph[u]):
-            if v not in visited:
-                visited.add(v); queue.append(v)
-    return steps
-
-def dfs_steps(nodes, edges, start):
-    graph = collections.defaultdict(list)
-    for u, v, _ in edges:
-        graph[u].append(v); graph[v].append(u)
-    visited, steps, order = set(), [], []
-    def dfs(u):
-        visited.add(u); order.append(u)
-        steps.append({"visited": set(visited), "current": u,
-                      "desc": f"Exploration récursive de <b>{u}</b> (ordre : {list(order)})"})
-        for v in sorted(graph[u]):
-            if v not in visited: dfs(v)
-    dfs(start)
-    return steps
-
-def get_path_edges(prev, start, end):
-    """Reconstruit les arêtes du chemin optimal de start à end depuis le dict prev final."""
-    path_edges, node = set(), end
-    while node in prev and prev[node] is not None:
-        parent = prev[node]
-        path_edges.add((parent, node))
-        node = parent
-        if node == start:
-            break
-    return path_edges
 
 # ── Construction figure animée ────────────────────────────────────────────────
 
@@ -241,17 +191,21 @@ with col_ctrl:
 
 # Calcul des étapes
 pos = compute_layout(g["nodes"])
-dist_final, prev_final = None, None
-if algo == "Dijkstra":
-    steps, dist_final, prev_final = dijkstra_steps(g["nodes"], g["edges"], start_node)
-elif algo == "BFS":
-    steps = bfs_steps(g["nodes"], g["edges"], start_node)
-else:
-    steps = dfs_steps(g["nodes"], g["edges"], start_node)
+with instrument.phase("calcul"):
+    dist_final, prev_final = None, None
+    graph = csr_graph(g["nodes"], g["edges"])
+    if algo == "Dijkstra":
+        steps, dist_final, prev_final = dijkstra_steps(graph, start_node)
+    elif algo == "BFS":
+        steps = bfs_steps(graph, start_node)
+    else:
+        steps = dfs_steps(graph, start_node)
+traces.panel("graphes", steps, meta={"algo": algo, "graph": graph_name}, replay=False)
 
 with col_viz:
-    fig = make_animated_fig(g["nodes"], g["edges"], pos, steps, algo, start_node, end_node, dist_final, prev_final)
-    st.plotly_chart(fig, width='stretch', key=f"gr_{graph_name}_{algo}_{start_node}")
+    with instrument.phase("figure"):
+        fig = make_animated_fig(g["nodes"], g["edges"], pos, steps, algo, start_node, end_node, dist_final, prev_final)
+    instrument.plotly_chart(fig, width='stretch', key=f"gr_{graph_name}_{algo}_{start_node}")
 
     # Table distances Dijkstra
     if algo == "Dijkstra" and dist_final:
@@ -268,3 +222,112 @@ with col_viz:
                 <div style="color:{color};font-weight:700;font-size:1rem;">{node}</div>
                 <div style="font-size:0.8rem;color:#94a3b8;">{label}</div>
             </div>""", unsafe_allow_html=True)
+
+# ── Grand graphe depuis un fichier ────────────────────────────────────────────
+
+FORMATS = {None: "Auto (extension)", "edgelist": "Liste d'arêtes", "csv": "CSV", "dimacs": "DIMACS .gr"}
+SENS    = {None: "Selon le format", False: "Non orienté", True: "Orienté"}
+ENGINES = ["BFS", "Dijkstra", "PageRank"]
+
+@cached
+def load_file(path, fmt, directed, stamp):
+    """Lecture (ou copie binaire) ; ``stamp`` = taille et date, pour relire un fichier modifié."""
+    return graphio.load_graph(path, fmt, directed)
+
+@cached
+def run_engine(graph, engine, source):
+    t0 = time.perf_counter()
+    if engine == "BFS":
+        out = graphs.bfs_levels(graph, source)
+    elif engine == "Dijkstra":
+        out = graphs.shortest_paths(graph, source)
+    else:
+        out = pagerank.pagerank_scores(graph)
+    return out, (time.perf_counter() - t0) * 1000
+
+def node_id(graph, text):
+    """Nœud saisi par son étiquette (ids entiers du fichier ou noms)."""
+    if graph.labels is None or isinstance(graph.labels, np.ndarray):
+        return graph.id(int(text))
+    return graph.id(text)
+
+def make_hist_fig(x, y, xtitle, color):
+    fig = go.Figure(go.Bar(x=x, y=y, marker=dict(color=color, line=dict(width=0))))
+    fig.update_layout(
+        paper_bgcolor='#0a0a0f', plot_bgcolor='#111118',
+        font=dict(color='#e2e8f0', family='DM Sans'),
+        xaxis=dict(showgrid=False, title=xtitle),
+        yaxis=dict(showgrid=True, gridcolor='#1e1e2e', title="Nœuds"),
+        margin=dict(l=50,r=10,t=10,b=40), height=260, showlegend=False, bargap=0.05,
+    )
+    return fig
+
+st.markdown("---")
+st.markdown("### 📂 Grand graphe depuis un fichier")
+st.markdown('<div class="info-box" style="border-left-color:#10b981;font-size:0.82rem;">Liste d\'arêtes <code>u v [poids]</code> (SNAP, KONECT), CSV <code>u,v[,poids]</code> ou DIMACS <code>.gr</code>, éventuellement <code>.gz</code>. Le fichier est lu par morceaux, les doublons fusionnés (poids minimal) et les boucles écartées ; une copie binaire <code>.csr.npz</code> écrite à côté rend le chargement suivant instantané.</div>', unsafe_allow_html=True)
+
+c1, c2, c3 = st.columns([3, 1, 1])
+path     = c1.text_input("Fichier local", key="gio_path", placeholder="/data/roadNet-CA.txt")
+fmt      = c2.selectbox("Format", list(FORMATS), format_func=FORMATS.get, key="gio_fmt")
+directed = c3.selectbox("Arêtes", list(SENS), format_func=SENS.get, key="gio_dir")
+
+big = None
+if path and not os.path.isfile(path):
+    st.warning(f"Fichier introuvable : {path}")
+elif path:
+    stat = os.stat(path)
+    try:
+        with st.spinner("Lecture du fichier…"), instrument.phase("import"):
+            big, info = load_file(path, fmt, directed, (stat.st_size, stat.st_mtime_ns))
+    except (ValueError, OSError, UnicodeDecodeError) as exc:
+        st.error(f"Fichier illisible : {exc}")
+
+if big is not None:
+    origin = {"hit": "copie binaire", "written": "fichier texte, copie binaire écrite",
+              None: "fichier texte, copie binaire impossible"}[info["cache"]]
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("Nœuds", f"{big.n:,}")
+    m2.metric("Arêtes", f"{big.num_edges:,}")
+    m3.metric("Doublons / boucles", f"{info['duplicates']:,} / {info['loops']:,}")
+    m4.metric("Chargement", f"{info['ms']:.0f} ms")
+    st.caption(f"{info['format']} · {'orienté' if big.directed else 'non orienté'} · {origin} · "
+               f"{big.nbytes / 2**20:.1f} Mo en CSR")
+
+    c1, c2 = st.columns([1, 3])
+    engine = c1.radio("Moteur", ENGINES, key="gio_engine", horizontal=True)
+    source = None
+    if engine != "PageRank":
+        default = big.label(int(np.argmax(big.out_degree()))) if big.n else ""
+        text = c2.text_input("Nœud de départ", str(default), key=f"gio_src_{path}")
+        try:
+            source = node_id(big, text)
+        except (KeyError, ValueError):
+            st.warning(f"Nœud inconnu : {text}")
+    if big.n and (engine == "PageRank" or source is not None):
+        with st.spinner(f"{engine} sur {big.num_edges:,} arêtes…"), instrument.phase(engine):
+            out, ms = run_engine(big, engine, source)
+        if engine == "BFS":
+            reached = out[out >= 0]
+            counts  = np.bincount(reached)
+            st.markdown(f'<div class="info-box" style="border-left-color:#10b981;">BFS en <b>{ms:.0f} ms</b> : {len(reached):,} nœuds atteints sur {big.n:,}, profondeur {int(reached.max())}.</div>', unsafe_allow_html=True)
+            instrument.plotly_chart(make_hist_fig(np.arange(len(counts)), counts, "Niveau", "#10b981"),
+                                    width='stretch', key="gio_bfs")
+        elif engine == "Dijkstra":
+            dist, prev = out
+            finite = dist[np.isfinite(dist)]
+            counts, edges = np.histogram(finite, bins=min(60, max(1, len(finite))))
+            st.markdown(f'<div class="info-box" style="border-left-color:#10b981;">Dijkstra en <b>{ms:.0f} ms</b> : {len(finite):,} nœuds atteints sur {big.n:,}, distance maximale {finite.max():g}.</div>', unsafe_allow_html=True)
+            instrument.plotly_chart(make_hist_fig((edges[:-1] + edges[1:]) / 2, counts, "Distance", "#f59e0b"),
+                                    width='stretch', key="gio_dij")
+        else:
+            rank, diffs = out
+            top = np.argsort(rank)[::-1][:10]
+            deg = big.out_degree()
+            st.markdown(f'<div class="info-box" style="border-left-color:#06b6d4;">PageRank en <b>{ms:.0f} ms</b> : {len(diffs)} itérations, Δ final {diffs[-1]:.2e}.</div>', unsafe_allow_html=True)
+            rows = "".join(
+                f"<tr><td>{r + 1}</td><td><b>{big.label(int(i))}</b></td><td>{rank[i]:.6f}</td><td>{int(deg[i])}</td></tr>"
+                for r, i in enumerate(top))
+            st.markdown(f"""
+            <table style="width:100%;font-size:0.9rem;">
+            <tr><th>#</th><th>Nœud</th><th>Score</th><th>Degré sortant</th></tr>{rows}
+            </table>""", unsafe_allow_html=True)
@@ -3,52 +3,18 @@ import plotly.graph_objects as go
 import random, sys, os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils.styles import inject_css, sidebar_nav
+from utils import instrument, traces
+from utils.cache import cached
+from algolab.core import search
 
 st.set_page_config(page_title="Recherche Binaire — Graphix", page_icon="🔍", layout="wide")
 inject_css()
 sidebar_nav()
+instrument.start(__file__)
 
 # ── Algorithme ────────────────────────────────────────────────────────────────
+binary_search_steps = cached(search.binary_search_steps)
 
-def binary_search_steps(arr, target):
-    steps = []
-    lo, hi = 0, len(arr) - 1
-
-    while lo <= hi:
-        mid = (lo + hi) // 2
-        steps.append({
-            "arr": arr, "lo": lo, "hi": hi, "mid": mid,
-            "target": target, "found": None,
-            "desc": f"Milieu = index {mid} → valeur <b>{arr[mid]}</b> | Recherche de <b>{target}</b> dans [{lo} … {hi}]"
-        })
-        if arr[mid] == target:
-            steps.append({
-                "arr": arr, "lo": lo, "hi": hi, "mid": mid,
-                "target": target, "found": mid,
-                "desc": f"✅ Trouvé ! <b>{target}</b> est à l'index <b>{mid}</b>"
-            })
-            return steps
-        elif arr[mid] < target:
-            lo = mid + 1
-            steps.append({
-                "arr": arr, "lo": lo, "hi": hi, "mid": mid,
-                "target": target, "found": None,
-                "desc": f"{arr[mid]} &lt; {target} → on cherche à droite : [{lo} … {hi}]"
-            })
-        else:
-            hi = mid - 1
-            steps.append({
-                "arr": arr, "lo": lo, "hi": hi, "mid": mid,
-                "target": target, "found": None,
-                "desc": f"{arr[mid]} &gt; {target} → on cherche à gauche : [{lo} … {hi}]"
-            })
-
-    steps.append({
-        "arr": arr, "lo": lo, "hi": hi, "mid": -1,
-        "target": target, "found": -1,
-        "desc": f"❌ <b>{target}</b> n'existe pas dans le tableau"
-    })
-    return steps
 
 def make_frame(s):
     arr    = s["arr"]
@@ -161,7 +127,9 @@ with col_ctrl:
         target = arr[target_idx]
         st.markdown(f'<div class="info-box" style="border-left-color:#7c3aed;">Valeur cible : <b style="color:#a78bfa;">{target}</b> (index {target_idx})</div>', unsafe_allow_html=True)
 
-    steps = binary_search_steps(arr, target)
+    with instrument.phase("calcul"):
+        steps = binary_search_steps(arr, target)
+    traces.panel("recherche", steps, replay=False)
     st.markdown(f'<span class="complexity-badge">O(log n) — {len(steps)} étapes</span>', unsafe_allow_html=True)
     st.markdown(f'<span class="complexity-badge" style="margin-top:6px;display:inline-block;">n = {n} → log₂(n) ≈ {n.bit_length()-1}</span>', unsafe_allow_html=True)
 
@@ -185,5 +153,6 @@ with col_ctrl:
     st.markdown("⬛ **Sombre** — Zone éliminée")
 
 with col_viz:
-    fig = make_animated_fig(steps, arr)
-    st.plotly_chart(fig, width='stretch', key=f"rb_{arr}_{target}")
+    with instrument.phase("figure"):
+        fig = make_animated_fig(steps, arr)
+    instrument.plotly_chart(fig, width='stretch', key=f"rb_{arr}_{target}")
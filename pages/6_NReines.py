@@ -3,51 +3,18 @@ import plotly.graph_objects as go
 import sys, os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils.styles import inject_css, sidebar_nav
+from utils import instrument, traces
+from utils.cache import cached
+from algolab.core import nqueens
 
 st.set_page_config(page_title="N-Reines — Graphix", page_icon="♛", layout="wide")
 inject_css()
 sidebar_nav()
+instrument.start(__file__)
 
 # ── Algorithme backtracking ───────────────────────────────────────────────────
+n_queens_steps = cached(nqueens.n_queens_steps)
 
-def n_queens_steps(n, max_steps=800):
-    steps = []
-    board = [-1] * n  # board[col] = row de la reine
-
-    def is_safe(col, row):
-        for c in range(col):
-            r = board[c]
-            if r == row or abs(r - row) == abs(c - col):
-                return False
-        return True
-
-    def solve(col):
-        if len(steps) >= max_steps:
-            return False
-        if col == n:
-            steps.append({
-                "board": board.copy(), "col": -1, "action": "solved",
-                "desc": f"✅ Solution trouvée ! {n} reines placées sans conflit."
-            })
-            return True
-        for row in range(n):
-            if is_safe(col, row):
-                board[col] = row
-                steps.append({
-                    "board": board.copy(), "col": col, "action": "place",
-                    "desc": f"Reine placée colonne {col+1}, ligne {row+1} — test en cours…"
-                })
-                if solve(col + 1):
-                    return True
-                board[col] = -1
-                steps.append({
-                    "board": board.copy(), "col": col, "action": "backtrack",
-                    "desc": f"↩ Backtrack colonne {col+1} — aucune position valide, on recule"
-                })
-        return False
-
-    solve(0)
-    return steps
 
 def make_board_frame(board, n, col_active, action):
     # Construire la grille comme heatmap
@@ -181,7 +148,9 @@ with col_ctrl:
     st.markdown("#### ⚙️ Paramètres")
     n = st.slider("Taille de l'échiquier (N)", 4, 10, 6)
 
-    steps = n_queens_steps(n)
+    with instrument.phase("calcul"):
+        steps = n_queens_steps(n)
+    traces.panel("nreines", steps, meta={"n": n}, replay=False)
     n_backtracks = sum(1 for s in steps if s["action"] == "backtrack")
     solved       = any(s["action"] == "solved" for s in steps)
 
@@ -214,5 +183,6 @@ with col_ctrl:
     st.markdown("🟣 **Violet clair** — Cases sous menace")
 
 with col_viz:
-    fig = make_animated_fig(steps, n)
-    st.plotly_chart(fig, width='stretch', key=f"nq_{n}")
+    with instrument.phase("figure"):
+        fig = make_animated_fig(steps, n)
+    instrument.plotly_chart(fig, width='stretch', key=f"nq_{n}")
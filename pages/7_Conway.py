@@ -1,83 +1,24 @@
 import streamlit as st
 import plotly.graph_objects as go
-import numpy as np
 import random, sys, os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils.styles import inject_css, sidebar_nav
+from utils import instrument, frames, player, traces
+from utils.cache import cached
+from algolab.core import conway
+from algolab.core.conway import make_grid
 
 st.set_page_config(page_title="Jeu de la Vie — Graphix", page_icon="🧬", layout="wide")
 inject_css()
 sidebar_nav()
+instrument.start(__file__)
 
 # ── Algorithme ────────────────────────────────────────────────────────────────
+compute_generations = cached(conway.compute_generations)
 
-def next_generation(grid):
-    n_rows, n_cols = grid.shape
-    new_grid = np.zeros_like(grid)
-    for r in range(n_rows):
-        for c in range(n_cols):
-            neighbors = int(np.sum(grid[max(0,r-1):r+2, max(0,c-1):c+2])) - int(grid[r, c])
-            if grid[r, c] == 1:
-                new_grid[r, c] = 1 if neighbors in (2, 3) else 0
-            else:
-                new_grid[r, c] = 1 if neighbors == 3 else 0
-    return new_grid
-
-def compute_generations(grid, n_gen):
-    frames_data = [grid.copy()]
-    alive_counts = [int(np.sum(grid))]
-    g = grid.copy()
-    for _ in range(n_gen):
-        g = next_generation(g)
-        frames_data.append(g.copy())
-        alive_counts.append(int(np.sum(g)))
-    return frames_data, alive_counts
 
 # ── Patterns célèbres ─────────────────────────────────────────────────────────
 
-def make_grid(rows, cols, pattern, seed=42):
-    grid = np.zeros((rows, cols), dtype=int)
-    cr, cc = rows // 2, cols // 2
-
-    if pattern == "Aléatoire":
-        rng = np.random.default_rng(seed)
-        grid = rng.integers(0, 2, size=(rows, cols))
-
-    elif pattern == "Planeur (Glider)":
-        g = [(0,1),(1,2),(2,0),(2,1),(2,2)]
-        for dr, dc in g:
-            grid[cr-1+dr][cc-1+dc] = 1
-
-    elif pattern == "Oscillateur (Blinker)":
-        for dc in range(-1, 2):
-            grid[cr][cc+dc] = 1
-
-    elif pattern == "Canon de Gosper":
-        # Gosper Glider Gun — pattern classique
-        cells = [
-            (5,1),(5,2),(6,1),(6,2),
-            (5,11),(6,11),(7,11),(4,12),(8,12),(3,13),(9,13),(3,14),(9,14),
-            (6,15),(4,16),(8,16),(5,17),(6,17),(7,17),(6,18),
-            (3,21),(4,21),(5,21),(3,22),(4,22),(5,22),(2,23),(6,23),
-            (1,25),(2,25),(6,25),(7,25),
-            (3,35),(4,35),(3,36),(4,36),
-        ]
-        for r, c in cells:
-            if 0 <= r < rows and 0 <= c < cols:
-                grid[r][c] = 1
-
-    elif pattern == "Ruche (Beehive)":
-        hive = [(0,1),(0,2),(1,0),(1,3),(2,1),(2,2)]
-        for dr, dc in hive:
-            grid[cr-1+dr][cc-2+dc] = 1
-
-    elif pattern == "Vaisseau spatial (LWSS)":
-        lwss = [(0,1),(0,4),(1,0),(2,0),(2,4),(3,0),(3,1),(3,2),(3,3)]
-        for dr, dc in lwss:
-            grid[cr-1+dr][cc-2+dc] = 1
-
-    return grid
-
 def make_heatmap_trace(g):
     return go.Heatmap(
         z=g.tolist(),
@@ -86,9 +27,36 @@ def make_heatmap_trace(g):
         zmin=0, zmax=1,
     )
 
+def gen_annotation(alive_counts, k):
+    return dict(
+        x=0.5, y=1.08, xref='paper', yref='paper',
+        text=f"Génération {k} — <b>{alive_counts[k]}</b> cellules vivantes",
+        showarrow=False,
+        font=dict(color='#94a3b8', size=12, family='DM Sans'), align='center')
+
+def make_gen_fig(frames_data, alive_counts, k):
+    """Figure d'une seule génération (lecture à la demande)."""
+    return go.Figure(
+        data=[make_heatmap_trace(frames_data[k])],
+        layout=go.Layout(
+            paper_bgcolor='#0a0a0f', plot_bgcolor='#111118',
+            font=dict(color='#e2e8f0', family='DM Sans'),
+            xaxis=dict(showgrid=False, showticklabels=False, zeroline=False),
+            yaxis=dict(showgrid=False, showticklabels=False, zeroline=False, autorange='reversed'),
+            margin=dict(l=10, r=10, t=55, b=20),
+            height=420,
+            annotations=[gen_annotation(alive_counts, k)],
+        ),
+    )
+
 def make_animated_fig(frames_data, alive_counts, n_gen):
+    # Budget de frames : on garde d'abord les générations qui changent le plus
+    sample = make_heatmap_trace(frames_data[0])
+    keep = frames.select(n_gen + 1, lambda k: int((frames_data[k] != frames_data[k-1]).sum()),
+                         frames.budget(sample))
+    frames.caption(len(keep), n_gen + 1, "générations")
     fig = go.Figure(
-        data=[make_heatmap_trace(frames_data[0])],
+        data=[sample],
         layout=go.Layout(
             paper_bgcolor='#0a0a0f', plot_bgcolor='#111118',
             font=dict(color='#e2e8f0', family='DM Sans'),
@@ -96,11 +64,7 @@ def make_animated_fig(frames_data, alive_counts, n_gen):
             yaxis=dict(showgrid=False, showticklabels=False, zeroline=False, autorange='reversed'),
             margin=dict(l=10, r=10, t=55, b=80),
             height=460,
-            annotations=[dict(
-                x=0.5, y=1.08, xref='paper', yref='paper',
-                text=f"Génération 0 — <b>{alive_counts[0]}</b> cellules vivantes",
-                showarrow=False,
-                font=dict(color='#94a3b8', size=12, family='DM Sans'), align='center')],
+            annotations=[gen_annotation(alive_counts, 0)],
             updatemenus=[dict(
                 type="buttons", showactive=False, y=-0.18, x=0.5, xanchor="center",
                 buttons=[
@@ -125,20 +89,16 @@ def make_animated_fig(frames_data, alive_counts, n_gen):
                 steps=[dict(method="animate",
                             args=[[f"cw{k}"], dict(mode="immediate", frame=dict(duration=150, redraw=True),
                                                    transition=dict(duration=50))],
-                            label=str(k)) for k in range(n_gen+1)],
+                            label=str(k)) for k in keep],
             )],
         ),
         frames=[
             go.Frame(
                 name=f"cw{k}",
                 data=[make_heatmap_trace(frames_data[k])],
-                layout=go.Layout(annotations=[dict(
-                    x=0.5, y=1.08, xref='paper', yref='paper',
-                    text=f"Génération {k} — <b>{alive_counts[k]}</b> cellules vivantes",
-                    showarrow=False,
-                    font=dict(color='#94a3b8', size=12, family='DM Sans'), align='center')])
+                layout=go.Layout(annotations=[gen_annotation(alive_counts, k)])
             )
-            for k in range(n_gen+1)
+            for k in keep
         ],
     )
     return fig
@@ -158,11 +118,19 @@ with col_ctrl:
     ])
     rows    = st.slider("Lignes",       20, 60, 40)
     cols    = st.slider("Colonnes",     20, 80, 60)
-    n_gen   = st.slider("Générations",  10, 100, 40)
+    mode    = st.radio("Lecture", ["Animation", "À la demande"], horizontal=True,
+                       help="« À la demande » n'envoie que la génération affichée : jusqu'à 500 générations.")
+    n_gen   = st.slider("Générations",  10, 500 if mode == "À la demande" else 100, 40)
     seed    = st.slider("Graine (aléatoire)", 0, 99, 42) if pattern == "Aléatoire" else 42
 
     grid = make_grid(rows, cols, pattern, seed)
-    frames_data, alive_counts = compute_generations(grid, n_gen)
+    with instrument.phase("calcul"):
+        frames_data, alive_counts = compute_generations(grid, n_gen)
+    gens = [{"grid": g, "alive": a} for g, a in zip(frames_data, alive_counts)]
+    trace = traces.panel("conway", gens, meta={"pattern": pattern})
+    if trace is not gens:  # trace importée : les grilles sont relues d'un bloc
+        frames_data, alive_counts = trace.column("grid"), trace.column("alive").tolist()
+        n_gen = len(trace) - 1
 
     st.markdown(f'<span class="complexity-badge">O(n×m) par génération</span>', unsafe_allow_html=True)
     st.markdown(f'<span class="complexity-badge" style="margin-top:6px;display:inline-block;">Grille {rows}×{cols} · {n_gen} générations</span>', unsafe_allow_html=True)
@@ -186,5 +154,12 @@ with col_ctrl:
     st.metric("Min cellules vivantes", min_alive)
 
 with col_viz:
-    fig = make_animated_fig(frames_data, alive_counts, n_gen)
-    st.plotly_chart(fig, width='stretch', key=f"cw_{pattern}_{rows}_{cols}_{n_gen}_{seed}")
+    if mode == "À la demande":
+        player.play(f"cw_{pattern}_{rows}_{cols}_{seed}", n_gen + 1,
+                    lambda k: instrument.plotly_chart(make_gen_fig(frames_data, alive_counts, k),
+                                                      width='stretch', key="cw_live"),
+                    interval=0.15, label="Génération")
+    else:
+        with instrument.phase("figure"):
+            fig = make_animated_fig(frames_data, alive_counts, n_gen)
+        instrument.plotly_chart(fig, width='stretch', key=f"cw_{pattern}_{rows}_{cols}_{n_gen}_{seed}")
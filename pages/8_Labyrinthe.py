@@ -1,74 +1,22 @@
 import streamlit as st
 import plotly.graph_objects as go
 import numpy as np
-import random, collections, sys, os
+import sys, os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils.styles import inject_css, sidebar_nav
+from utils import instrument, frames, traces
+from utils.cache import cached
+from algolab.core import maze
 
 st.set_page_config(page_title="Labyrinthe — Graphix", page_icon="🌀", layout="wide")
 inject_css()
 sidebar_nav()
+instrument.start(__file__)
+
+# ── Génération (DFS) et résolution (BFS) ──────────────────────────────────────
+generate_maze  = cached(maze.generate_maze)
+solve_maze_bfs = cached(maze.solve_maze_bfs)
 
-# ── Génération : DFS récursif (Perfect Maze) ─────────────────────────────────
-
-def generate_maze(rows, cols, seed=42):
-    """Génère un labyrinthe parfait par DFS. Retourne la grille et les étapes."""
-    rng = random.Random(seed)
-    # Grille de murs : 1 = mur, 0 = chemin
-    # On travaille sur une grille 2*rows+1 x 2*cols+1
-    h, w = 2*rows+1, 2*cols+1
-    grid = np.ones((h, w), dtype=int)
-
-    visited = set()
-    gen_steps = []  # snapshots de la grille pendant la génération
-
-    def cell_to_grid(r, c):
-        return 2*r+1, 2*c+1
-
-    def carve(r, c):
-        visited.add((r, c))
-        gr, gc = cell_to_grid(r, c)
-        grid[gr][gc] = 0
-        directions = [(0,1),(0,-1),(1,0),(-1,0)]
-        rng.shuffle(directions)
-        for dr, dc in directions:
-            nr, nc = r+dr, c+dc
-            if 0 <= nr < rows and 0 <= nc < cols and (nr, nc) not in visited:
-                # Abattre le mur entre (r,c) et (nr,nc)
-                grid[gr+dr][gc+dc] = 0
-                gen_steps.append(grid.copy())
-                carve(nr, nc)
-
-    carve(0, 0)
-    # Entrée et sortie
-    grid[0][1] = 0
-    grid[h-1][w-2] = 0
-
-    return grid, gen_steps, h, w
-
-# ── Résolution : BFS ──────────────────────────────────────────────────────────
-
-def solve_maze_bfs(grid, h, w):
-    start = (0, 1)
-    end   = (h-1, w-2)
-    queue = collections.deque([(start, [start])])
-    visited = {start}
-    solve_steps = []
-
-    while queue:
-        (r, c), path = queue.popleft()
-        solve_steps.append({"visited": set(visited), "current": (r,c), "path": list(path)})
-
-        if (r, c) == end:
-            return solve_steps, path
-
-        for dr, dc in [(-1,0),(1,0),(0,-1),(0,1)]:
-            nr, nc = r+dr, c+dc
-            if 0 <= nr < h and 0 <= nc < w and grid[nr][nc] == 0 and (nr, nc) not in visited:
-                visited.add((nr, nc))
-                queue.append(((nr, nc), path + [(nr, nc)]))
-
-    return solve_steps, []
 
 # ── Frames ────────────────────────────────────────────────────────────────────
 
@@ -106,12 +54,16 @@ def grid_to_heatmap(grid, visited=None, current=None, solution=None, phase="gen"
         zmin=0, zmax=1,
     )
 
-def make_animated_fig(grid, gen_steps, solve_steps, solution_path, h, w, max_gen_frames=60, max_solve_frames=120):
-    # Sous-échantillonner les frames de génération pour ne pas en avoir trop
-    step_gen  = max(1, len(gen_steps)  // max_gen_frames)
-    step_sol  = max(1, len(solve_steps)// max_solve_frames)
-    gen_sampled   = gen_steps[::step_gen]   + [gen_steps[-1]]
-    solve_sampled = solve_steps[::step_sol] + [solve_steps[-1]]
+def make_animated_fig(grid, gen_steps, solve_steps, solution_path, h, w):
+    # Budget de frames partagé entre génération et résolution, au prorata du
+    # nombre d'étapes ; chaque étape change autant la grille que la précédente,
+    # d'où un échantillonnage régulier.
+    total = frames.budget(grid_to_heatmap(grid)) - 1  # - frame finale
+    n_gen, n_sol = len(gen_steps), len(solve_steps)
+    gen_budget = max(2, total * n_gen // (n_gen + n_sol))
+    gen_sampled   = [gen_steps[k]   for k in frames.select(n_gen, lambda k: 1, gen_budget)]
+    solve_sampled = [solve_steps[k] for k in frames.select(n_sol, lambda k: 1, max(2, total - gen_budget))]
+    frames.caption(len(gen_sampled) + len(solve_sampled), n_gen + n_sol)
 
     all_frames = []
     descriptions = []
@@ -198,8 +150,10 @@ with col_ctrl:
     cols = st.slider("Colonnes", 5, 35, 18)
     seed = st.slider("Graine (forme du labyrinthe)", 0, 99, 7)
 
-    grid, gen_steps, h, w = generate_maze(rows, cols, seed)
-    solve_steps, solution_path = solve_maze_bfs(grid, h, w)
+    with instrument.phase("calcul"):
+        grid, gen_steps, h, w = generate_maze(rows, cols, seed)
+        solve_steps, solution_path = solve_maze_bfs(grid, h, w)
+    traces.panel("labyrinthe", solve_steps, replay=False)
 
     st.markdown(f'<span class="complexity-badge">Génération : O(n×m)</span>', unsafe_allow_html=True)
     st.markdown(f'<span class="complexity-badge" style="margin-top:6px;display:inline-block;">Résolution BFS : O(n×m)</span>', unsafe_allow_html=True)
@@ -229,5 +183,6 @@ with col_ctrl:
     st.markdown("⬜ **Gris** — Mur")
 
 with col_viz:
-    fig = make_animated_fig(grid, gen_steps, solve_steps, solution_path, h, w)
-    st.plotly_chart(fig, width='stretch', key=f"lm_{rows}_{cols}_{seed}")
+    with instrument.phase("figure"):
+        fig = make_animated_fig(grid, gen_steps, solve_steps, solution_path, h, w)
+    instrument.plotly_chart(fig, width='stretch', key=f"lm_{rows}_{cols}_{seed}")
@@ -0,0 +1,159 @@
+"""Cache de résultats borné en mémoire, partagé par toutes les sessions du processus.
+
+Les résultats des fonctions décorées par ``@cached`` sont indexés par leurs
+paramètres. Le cache suit un budget global en octets (``GRAPHIX_CACHE_MB``,
+256 Mo par défaut) et évince les entrées les moins récemment utilisées.
+Les valeurs sont partagées : les appelants ne doivent pas les modifier.
+"""
+import functools
+import hashlib
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+BUDGET_BYTES = int(float(os.environ.get("GRAPHIX_CACHE_MB", "256")) * 1024 * 1024)
+
+
+def sizeof(obj, _seen=None):
+    """Taille approximative en octets d'un objet et de son contenu."""
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+    nbytes = getattr(obj, "nbytes", None)
+    if isinstance(nbytes, int):  # tableaux NumPy, traces
+        return nbytes + sys.getsizeof(obj)
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, bytearray, int, float, complex, bool, range)):
+        return size
+    if isinstance(obj, dict):
+        return size + sum(sizeof(k, _seen) + sizeof(v, _seen) for k, v in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return size + sum(sizeof(x, _seen) for x in obj)
+    if hasattr(obj, "__dict__"):
+        return size + sizeof(vars(obj), _seen)
+    return size
+
+
+def _freeze(obj):
+    """Clé hachable stable pour des paramètres (listes, dicts, tableaux NumPy…)."""
+    if isinstance(obj, (list, tuple)):
+        return (type(obj).__name__,) + tuple(_freeze(x) for x in obj)
+    if isinstance(obj, dict):
+        return ("dict",) + tuple(sorted((_freeze(k), _freeze(v)) for k, v in obj.items()))
+    if isinstance(obj, (set, frozenset)):
+        return ("set",) + tuple(sorted(_freeze(x) for x in obj))
+    if hasattr(obj, "ndim") and hasattr(obj, "tobytes"):
+        digest = hashlib.blake2b(obj.tobytes(), digest_size=16).hexdigest()
+        return ("ndarray", obj.shape, str(obj.dtype), digest)
+    hash(obj)
+    return obj
+
+
+def _grows(value):
+    """Vrai si la taille de la valeur peut évoluer (trace paresseuse, …)."""
+    items = value if isinstance(value, tuple) else (value,)
+    return any(hasattr(v, "nbytes") and not hasattr(v, "ndim") for v in items)
+
+
+class BoundedCache:
+    """LRU pondéré par la taille en octets, protégé par un verrou."""
+
+    def __init__(self, budget_bytes=BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self._entries = OrderedDict()  # clé -> (valeur, taille)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key):
+        """Renvoie ``(True, valeur)`` si la clé est présente, sinon ``(False, None)``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            value, size = entry
+            if _grows(value):
+                new_size = sizeof(value)
+                self._bytes += new_size - size
+                self._entries[key] = (value, new_size)
+                self._evict(keep=key)
+            return True, value
+
+    def put(self, key, value):
+        size = sizeof(value)
+        with self._lock:
+            if size > self.budget_bytes:
+                return
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            self._evict(keep=key)
+
+    def _evict(self, keep):
+        while self._bytes > self.budget_bytes and len(self._entries) > 1:
+            key, (_, size) = next(iter(self._entries.items()))
+            if key == keep:
+                break
+            del self._entries[key]
+            self._bytes -= size
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "budget_bytes": self.budget_bytes,
+            }
+
+
+_CACHE = BoundedCache()
+
+
+def cached(fn):
+    """Mémorise ``fn`` dans le cache global, indexé par fichier, nom et paramètres.
+
+    Le fichier source fait partie de la clé : deux pages peuvent définir une
+    fonction du même nom, et Streamlit redéfinit les fonctions à chaque rerun.
+    """
+    origin = (fn.__code__.co_filename, fn.__qualname__)
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            key = origin + (_freeze(args), _freeze(kwargs))
+        except TypeError:  # paramètre non hachable : pas de cache
+            return fn(*args, **kwargs)
+        hit, value = _CACHE.get(key)
+        if hit:
+            return value
+        value = fn(*args, **kwargs)
+        _CACHE.put(key, value)
+        return value
+
+    return wrapper
+
+
+def cache_stats():
+    """Compteurs du cache global (hits, misses, évictions, octets)."""
+    return _CACHE.stats()
+
+
+def clear_cache():
+    _CACHE.clear()
@@ -0,0 +1,94 @@
+"""Budget de frames des animations Plotly.
+
+Toutes les frames d'une figure animée partent au navigateur dans un seul JSON :
+au-delà de quelques milliers, l'onglet se fige. Les pages choisissent donc un
+sous-ensemble d'étapes avant de construire leurs frames :
+
+    keep = frames.select(len(steps), change, frames.budget(frame_sample))
+
+``change(k)`` mesure l'ampleur du changement entre les étapes k-1 et k ; les
+étapes qui changent beaucoup sont gardées en priorité, les zones calmes sont
+échantillonnées régulièrement. Les plafonds (frames, Mo) se règlent dans la
+barre latérale ; valeurs par défaut : ``GRAPHIX_MAX_FRAMES`` (300) et
+``GRAPHIX_MAX_PAYLOAD_MB`` (8).
+"""
+import bisect
+import json
+import os
+
+import streamlit as st
+
+MAX_FRAMES = int(os.environ.get("GRAPHIX_MAX_FRAMES", "300"))
+MAX_PAYLOAD_MB = float(os.environ.get("GRAPHIX_MAX_PAYLOAD_MB", "8"))
+STEP_OVERHEAD = 220  # octets par frame hors données : nom, pas du slider
+
+
+def limits():
+    """Plafonds réglés dans la barre latérale : ``(frames max, Mo max)``.
+
+    Les valeurs sont recopiées hors des widgets pour survivre au changement de
+    page (Streamlit oublie l'état d'un widget absent de la page affichée).
+    """
+    saved = st.session_state.setdefault("_frame_limits", (MAX_FRAMES, MAX_PAYLOAD_MB))
+    with st.sidebar.expander("🎞️ Animations"):
+        max_frames = st.number_input("Frames max", 10, 20000, int(saved[0]), step=50,
+                                     key="frames_max_frames")
+        max_mb = st.number_input("Poids max (Mo)", 0.5, 200.0, float(saved[1]), step=0.5,
+                                 key="frames_max_mb")
+    st.session_state["_frame_limits"] = (max_frames, max_mb)
+    return max_frames, max_mb
+
+
+def frame_bytes(obj):
+    """Poids JSON d'un objet Plotly représentatif d'une frame (trace, frame, dict)."""
+    from plotly.utils import PlotlyJSONEncoder
+
+    data = obj.to_plotly_json() if hasattr(obj, "to_plotly_json") else obj
+    return len(json.dumps(data, cls=PlotlyJSONEncoder)) + STEP_OVERHEAD
+
+
+def budget(sample, caps=None):
+    """Nombre de frames permis pour des frames du poids de ``sample``.
+
+    ``caps`` : ``(frames max, Mo max)`` ; par défaut les réglages de la barre
+    latérale.
+    """
+    max_frames, max_mb = caps or limits()
+    by_size = int(max_mb * 2**20 // frame_bytes(sample))
+    return max(2, min(int(max_frames), by_size))
+
+
+def select(n, change, budget):
+    """Indices (croissants) d'au plus ``budget`` étapes parmi ``n``.
+
+    La première et la dernière étape sont toujours gardées. Un quart du budget
+    va aux plus forts changements ; le reste est réparti à pas réguliers sur
+    le changement cumulé, auquel s'ajoute un poids uniforme pour que les zones
+    calmes restent visibles.
+    """
+    if n <= budget:
+        return list(range(n))
+    budget = max(2, budget)
+    w = [0.0] + [float(change(k)) for k in range(1, n)]
+    floor = (sum(w) / (n - 1)) or 1.0
+    cum, acc = [], 0.0
+    for k, x in enumerate(w):
+        acc += x + floor if k else 0.0
+        cum.append(acc)
+
+    keep = {0, n - 1}
+    top = budget // 4
+    if top:
+        marked = [k for k in range(1, n - 1) if w[k] > floor]  # au-dessus de la moyenne
+        keep.update(sorted(marked, key=lambda k: -w[k])[:top])
+    slots = budget - len(keep)
+    for j in range(1, slots + 1):
+        keep.add(min(n - 1, bisect.bisect_left(cum, j * acc / (slots + 1))))
+    return sorted(keep)
+
+
+def caption(kept, total, unit="étapes"):
+    """Légende à afficher quand l'animation est décimée ; rien sinon."""
+    if kept < total:
+        st.caption(f"🎞️ {kept} {unit} animées sur {total} (les plus marquantes en priorité) — "
+                   "plafond réglable dans la barre latérale.")
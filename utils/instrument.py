@@ -0,0 +1,131 @@
+"""Instrumentation du rendu des pages : durée de chaque phase, poids des figures.
+
+Une page ouvre son relevé juste après ``sidebar_nav()`` puis entoure ses phases :
+
+    instrument.start(__file__)
+    with instrument.phase("calcul"):
+        steps = bubble_sort_steps(arr)
+    with instrument.phase("figure"):
+        fig = make_animated_fig(steps, accent)
+    instrument.plotly_chart(fig, width="stretch", key=...)
+
+``plotly_chart`` remplace ``st.plotly_chart`` et mesure la phase « envoi »
+(sérialisation comprise). Chaque mesure alimente un agrégat par page et par
+phase, partagé par le processus (``summary``), et s'ajoute au journal JSON
+lignes ``GRAPHIX_METRICS_LOG`` s'il est défini. Le poids du JSON envoyé au
+navigateur demande une sérialisation de plus : il n'est mesuré que si le
+panneau « Mesures de rendu » est ouvert ou si le journal est actif.
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import streamlit as st
+
+LOG_PATH = os.environ.get("GRAPHIX_METRICS_LOG")
+
+_LOCK = threading.Lock()
+_TOTALS = {}  # (page, phase) -> [appels, total ms, max ms, max octets]
+# Relevé du rerun en cours : chaque exécution complète du script a son thread.
+# Les reruns de fragment (nouveau thread, sans ``start``) ne gardent que le
+# nom de page, mémorisé dans la session.
+_run = threading.local()
+
+
+def format_bytes(n):
+    """Taille lisible (Ko / Mo) ; « — » si inconnue."""
+    if n is None:
+        return "—"
+    return f"{n / 1024:.0f} Ko" if n < 2**20 else f"{n / 2**20:.1f} Mo"
+
+
+def _record(page, name, ms, nbytes):
+    with _LOCK:
+        tot = _TOTALS.setdefault((page, name), [0, 0.0, 0.0, None])
+        tot[0] += 1
+        tot[1] += ms
+        tot[2] = max(tot[2], ms)
+        if nbytes is not None:
+            tot[3] = max(tot[3] or 0, nbytes)
+        if LOG_PATH:
+            with open(LOG_PATH, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"t": round(time.time(), 3), "page": page, "phase": name,
+                                    "ms": round(ms, 3), "bytes": nbytes}) + "\n")
+
+
+def _refresh(rec):
+    if rec["slot"] is None:
+        return
+    rows = "".join(
+        f"<tr><td>{name}</td><td>{ms:.1f} ms</td><td>{format_bytes(nbytes)}</td></tr>"
+        for name, ms, nbytes in rec["phases"]
+    )
+    total = sum(ms for _, ms, _ in rec["phases"])
+    rec["slot"].markdown(
+        f'<table style="width:100%;font-size:0.75rem;font-family:Space Mono,monospace;">{rows}'
+        f"<tr><td><b>total</b></td><td><b>{total:.1f} ms</b></td><td></td></tr></table>",
+        unsafe_allow_html=True,
+    )
+
+
+# ── API des pages ─────────────────────────────────────────────────────────────
+
+def start(page_file):
+    """Ouvre le relevé du rerun pour la page ``page_file`` (``__file__``)."""
+    with st.sidebar:
+        on = st.toggle("⏱️ Mesures de rendu", key="instrument_panel")
+        slot = st.empty() if on else None
+    page = st.session_state["_instrument_page"] = Path(page_file).stem
+    _run.rec = {"page": page, "phases": [], "slot": slot}
+
+
+def measuring_payload():
+    rec = getattr(_run, "rec", None)
+    return bool(LOG_PATH) or (rec is not None and rec["slot"] is not None)
+
+
+@contextmanager
+def phase(name, nbytes=None):
+    """Chronomètre le bloc ; ``nbytes`` : taille associée (payload), si connue."""
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        ms = (time.perf_counter() - t0) * 1000
+        rec = getattr(_run, "rec", None)
+        _record(rec["page"] if rec else st.session_state.get("_instrument_page", "?"), name, ms, nbytes)
+        if rec is not None:
+            rec["phases"].append((name, ms, nbytes))
+            _refresh(rec)
+
+
+def plotly_chart(fig, name="envoi", **kwargs):
+    """``st.plotly_chart`` chronométré, avec le poids du JSON envoyé si mesuré."""
+    nbytes = None
+    if measuring_payload():
+        import plotly.io as pio
+
+        nbytes = len(pio.to_json(fig, validate=False).encode())
+    with phase(name, nbytes):
+        return st.plotly_chart(fig, **kwargs)
+
+
+# ── Agrégats ──────────────────────────────────────────────────────────────────
+
+def summary():
+    """Agrégat par page et phase, trié par temps cumulé décroissant."""
+    with _LOCK:
+        rows = [
+            {"page": page, "phase": name, "calls": n, "total_ms": total,
+             "mean_ms": total / n, "max_ms": peak, "max_bytes": nbytes}
+            for (page, name), (n, total, peak, nbytes) in _TOTALS.items()
+        ]
+    return sorted(rows, key=lambda r: -r["total_ms"])
+
+
+def clear():
+    with _LOCK:
+        _TOTALS.clear()
@@ -0,0 +1,106 @@
+"""Tâches longues hors du thread Streamlit, dans un pool de processus partagé.
+
+Un lot (``Job``) est une liste de petites tâches indépendantes soumises au
+pool commun à toutes les sessions ; les résultats sont lus au fil de l'eau.
+Les tâches doivent être des fonctions de niveau module (sérialisables),
+par exemple celles de ``algolab.bench``.
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import streamlit as st
+
+MAX_WORKERS = int(os.environ.get("GRAPHIX_WORKERS", min(4, os.cpu_count() or 1)))
+
+
+@st.cache_resource
+def get_pool():
+    # « spawn » : pas de fork d'un serveur multi-thread ; les workers
+    # n'importent que algolab (léger, sans Streamlit).
+    return ProcessPoolExecutor(
+        max_workers=MAX_WORKERS, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+class Job:
+    """Lot de tâches ``(label, fn, args)`` lancé avec des paramètres donnés."""
+
+    def __init__(self, params, tasks):
+        self.params = params
+        self.labels = [label for label, _, _ in tasks]
+        try:
+            pool = get_pool()
+            self.futures = [pool.submit(fn, *args) for _, fn, args in tasks]
+        except BrokenProcessPool:  # un worker a été tué : on repart d'un pool neuf
+            get_pool.clear()
+            pool = get_pool()
+            self.futures = [pool.submit(fn, *args) for _, fn, args in tasks]
+
+    @property
+    def done(self):
+        return all(f.done() for f in self.futures)
+
+    @property
+    def progress(self):
+        return sum(f.done() for f in self.futures) / len(self.futures) if self.futures else 1.0
+
+    def results(self):
+        """Résultats déjà disponibles, dans l'ordre de soumission."""
+        return {
+            label: f.result()
+            for label, f in zip(self.labels, self.futures)
+            if f.done() and not f.cancelled() and f.exception() is None
+        }
+
+    def errors(self):
+        return {
+            label: f.exception()
+            for label, f in zip(self.labels, self.futures)
+            if f.done() and not f.cancelled() and f.exception() is not None
+        }
+
+    def cancel(self):
+        """Annule les tâches pas encore démarrées (celles en cours se terminent)."""
+        for f in self.futures:
+            f.cancel()
+
+
+def submit(key, params, tasks):
+    """Lance un lot sous ``st.session_state[key]`` en annulant le précédent."""
+    cancel(key)
+    job = st.session_state[key] = Job(params, tasks)
+    return job
+
+
+def current(key, params):
+    """Lot de la session pour ``key`` ; annulé et oublié si ``params`` a changé."""
+    job = st.session_state.get(key)
+    if job is not None and job.params != params:
+        cancel(key)
+        return None
+    return job
+
+
+def cancel(key):
+    job = st.session_state.pop(key, None)
+    if job is not None:
+        job.cancel()
+
+
+def live(job, render, interval=0.5):
+    """Affiche ``render(job)`` et le rafraîchit tant que le lot tourne.
+
+    Seul le fragment est réexécuté pendant le calcul ; une fois le lot
+    terminé, un rerun complet arrête le rafraîchissement.
+    """
+    running = job is not None and not job.done
+
+    @st.fragment(run_every=interval if running else None)
+    def _panel():
+        render(job)
+        if running and job.done:
+            st.rerun()
+
+    _panel()
@@ -0,0 +1,61 @@
+"""Lecture à la demande des animations longues.
+
+Une figure animée embarque toutes ses frames : son poids croît avec la trace.
+Ici le serveur garde la trace et le navigateur ne reçoit que l'étape affichée :
+un fragment Streamlit redessine l'étape courante à chaque pas de lecture ou
+déplacement du curseur, sans réexécuter la page. Le chargement initial ne
+dépend plus de la longueur de la trace.
+
+    player.play("hanoi", len(moves) + 1, lambda k: plotly_chart(state_fig(k)))
+"""
+import streamlit as st
+
+SPEEDS = [1, 10, 100, 1000]  # étapes par pas de lecture
+
+
+def play(key, n, render, interval=0.3, label="Étape"):
+    """Lecteur des étapes ``0 … n-1`` ; ``render(k)`` affiche l'étape k.
+
+    L'état (étape, lecture, vitesse) vit dans ``st.session_state`` sous des
+    clés préfixées par ``key``. Démarrer ou arrêter la lecture relance la page
+    entière, le rafraîchissement périodique du fragment en dépendant.
+    """
+    k_key, run_key, speed_key = f"{key}_k", f"{key}_playing", f"{key}_speed"
+    if st.session_state.get(k_key, 0) >= n:  # trace raccourcie depuis
+        st.session_state[k_key] = n - 1
+    playing = st.session_state.get(run_key, False)
+
+    def _toggle():
+        st.session_state[run_key] = not playing
+        if not playing and st.session_state.get(k_key, 0) >= n - 1:
+            st.session_state[k_key] = 0
+
+    def _jump(k):
+        st.session_state[k_key] = max(0, min(n - 1, k))
+
+    @st.fragment(run_every=interval if playing else None)
+    def _player():
+        if st.session_state.get(run_key, False) != playing:
+            st.rerun()  # lecture démarrée ou arrêtée : changer run_every
+        k = st.session_state.setdefault(k_key, 0)
+        if playing:
+            k = min(n - 1, k + st.session_state.get(speed_key, 1))
+            st.session_state[k_key] = k
+        c1, c2, c3, c4, c5 = st.columns([1, 1, 1.4, 1, 2])
+        c1.button("⏮", key=f"{key}_first", on_click=_jump, args=(0,), width="stretch")
+        c2.button("◀", key=f"{key}_prev", on_click=_jump, args=(k - 1,), width="stretch",
+                  disabled=playing)
+        c3.button("⏸  Pause" if playing else "▶  Lire", key=f"{key}_play", on_click=_toggle,
+                  type="primary", width="stretch")
+        c4.button("▶", key=f"{key}_next", on_click=_jump, args=(k + 1,), width="stretch",
+                  disabled=playing)
+        c5.select_slider("Vitesse", SPEEDS, key=speed_key, format_func=lambda s: f"×{s}",
+                         label_visibility="collapsed")
+        if n > 1:
+            st.slider(label, 0, n - 1, key=k_key)
+        render(st.session_state[k_key])
+        if playing and k >= n - 1:
+            st.session_state[run_key] = False
+            st.rerun()
+
+    _player()
@@ -1,43 +1,92 @@
-import streamlit as st
-from pathlib import Path
+"""Styles et navigation communs : CSS, logo et barre latérale.
+
+Les fichiers de ``assets/`` et ``static/`` sont lus une fois par processus et
+les fragments HTML qui en dérivent sont mémorisés, puis reconstruits seulement
+quand la date de modification du fichier change. Le logo est servi par
+Streamlit comme fichier statique (``server.enableStaticServing``) au lieu
+d'être inclus en base64 dans chaque page ; à défaut, il est inclus une fois
+encodé.
+"""
 import base64
+import functools
+from pathlib import Path
+
+import streamlit as st
+
+_ROOT = Path(__file__).parent.parent
+_CSS_PATH = _ROOT / "assets" / "style.css"
+_FAVICON_PATH = _ROOT / "assets" / "favicon.ico"
+_LOGO_PATH = _ROOT / "static" / "logo.png"
+_LOGO_URL = "./app/static/logo.png"
+
+_ASSETS = {}  # (chemin, variante) -> (mtime_ns, valeur)
+
+
+def _asset(path, build, variant=None):
+    """``build(path)`` mémorisé tant que le fichier garde la même date ; None s'il manque."""
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    hit = _ASSETS.get((path, variant))
+    if hit is not None and hit[0] == mtime:
+        return hit[1]
+    value = build(path)
+    _ASSETS[(path, variant)] = (mtime, value)
+    return value
+
+
+def _logo_data_uri(path):
+    return "data:image/png;base64," + base64.b64encode(path.read_bytes()).decode()
+
 
-# Chemin vers le fichier CSS, résolu depuis l'emplacement de ce fichier
-_CSS_PATH = Path(__file__).parent.parent / "assets" / "style.css"
-_LOGO_PATH = Path(__file__).parent.parent / "assets" / "logo.png"
+def logo_src():
+    """URL du logo : fichier statique si le service est actif, sinon data URI ; None sans logo."""
+    if st.get_option("server.enableStaticServing"):
+        # la date en paramètre invalide aussi le cache du navigateur
+        return _asset(_LOGO_PATH, lambda p: f"{_LOGO_URL}?v={p.stat().st_mtime_ns}", "url")
+    return _asset(_LOGO_PATH, _logo_data_uri, "b64")
 
 
-def _get_logo_b64():
-    if _LOGO_PATH.exists():
-        return base64.b64encode(_LOGO_PATH.read_bytes()).decode()
-    return None
+def favicon():
+    """Icône de l'accueil (image PIL chargée une fois)."""
+    from PIL import Image
+
+    def load(path):
+        img = Image.open(path)
+        img.load()
+        return img
+
+    return _asset(_FAVICON_PATH, load)
 
 
 def inject_css():
-    """Lit style.css et l'injecte dans la page Streamlit."""
-    css = _CSS_PATH.read_text(encoding="utf-8")
-    st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
+    """Injecte style.css dans la page Streamlit (lu une fois, rechargé s'il change)."""
+    html = _asset(_CSS_PATH, lambda p: f"<style>{p.read_text(encoding='utf-8')}</style>")
+    st.markdown(html, unsafe_allow_html=True)
 
 
-def sidebar_nav():
-    """Barre de navigation latérale commune à toutes les pages."""
-    logo_b64 = _get_logo_b64()
-    with st.sidebar:
-        if logo_b64:
-            st.markdown(
-                f"""
+@functools.lru_cache(maxsize=4)
+def _sidebar_header(src):
+    return f"""
             <div style="padding:4px 0 12px 0;">
                 <div style="display:flex;align-items:center;gap:0.6rem;">
-                    <img src="data:image/png;base64,{logo_b64}"
+                    <img src="{src}"
                          style="width:36px;height:36px;border-radius:50%;
                                 box-shadow:0 0 10px rgba(191,30,46,0.5);flex-shrink:0;" />
                     <span style="font-size:1.6rem;font-weight:700;background:linear-gradient(135deg,#e2e8f0 0%,#7c3aed 50%,#06b6d4 100%);-webkit-background-clip:text;-webkit-text-fill-color:transparent;">Graphix</span>
                 </div>
                 <div style="color:#64748b;font-size:0.72rem;font-family:'Space Mono',monospace;margin-top:4px;padding-left:2px;">Par Laurent Jouron</div>
             </div>
-            """,
-                unsafe_allow_html=True,
-            )
+            """
+
+
+def sidebar_nav():
+    """Barre de navigation latérale commune à toutes les pages."""
+    src = logo_src()
+    with st.sidebar:
+        if src:
+            st.markdown(_sidebar_header(src), unsafe_allow_html=True)
         else:
             st.markdown(
                 '<div class="sidebar-title" style="padding:4px 0 12px 0;">Graphix</div>',
@@ -0,0 +1,43 @@
+"""Export et relecture des traces d'étapes depuis les pages.
+
+Le panneau « 💾 Trace » de la barre latérale propose la trace affichée en
+téléchargement (``.npz``, voir ``algolab.core.traceio``) et accepte en retour
+un fichier exporté par la même page, rejoué à la place du calcul :
+
+    steps = traces.panel("tri", steps, meta={"algo": algo})
+
+L'encodage n'a lieu qu'au clic sur « Télécharger » ; une trace importée est
+relue colonne par colonne, ses étapes reconstruites à la demande.
+"""
+import streamlit as st
+
+from algolab.core import traceio
+
+
+def panel(page, steps, meta=None, replay=True):
+    """Panneau d'export (et d'import si ``replay``) ; renvoie la trace à afficher.
+
+    ``steps`` : séquence d'étapes (dicts) calculée par la page. Si un fichier
+    exporté par ``page`` est chargé, la ``StoredTrace`` correspondante est
+    renvoyée à la place.
+    """
+    with st.sidebar.expander(f"💾 Trace — {page}"):
+        if replay:
+            upload = st.file_uploader("Rejouer une trace", type=["npz"], key=f"trace_upload_{page}")
+            if upload is not None:
+                try:
+                    loaded = traceio.load(upload)
+                except (ValueError, KeyError, OSError) as exc:
+                    st.error(f"Trace illisible : {exc}")
+                else:
+                    if loaded.meta.get("page") == page:
+                        st.caption(f"Trace importée : {len(loaded)} étapes.")
+                        steps = loaded
+                    else:
+                        st.warning(f"Trace de la page « {loaded.meta.get('page', '?')} », ignorée.")
+        st.download_button(
+            "Télécharger la trace", lambda: traceio.to_bytes(steps, {"page": page, **(meta or {})}),
+            file_name=f"{page}.npz", mime="application/octet-stream",
+            key=f"trace_download_{page}", width="stretch",
+        )
+    return steps